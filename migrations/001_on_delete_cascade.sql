@@ -0,0 +1,23 @@
+-- Каскадное удаление зависимых записей на стороне MySQL.
+-- После применения миграции включите DB_CONFIG['cascade_deletes'] в src/config.py:
+-- удаление коллекционера, коллекции или предмета каталога выполняется одним DELETE.
+--
+-- Имена внешних ключей зависят от того, как создавалась схема.
+-- Проверьте их командой SHOW CREATE TABLE и при необходимости поправьте ниже.
+
+ALTER TABLE collection_item
+    DROP FOREIGN KEY collection_item_ibfk_1,
+    DROP FOREIGN KEY collection_item_ibfk_2;
+
+ALTER TABLE collection_item
+    ADD CONSTRAINT fk_collection_item_collection
+        FOREIGN KEY (id_collection) REFERENCES collection (id) ON DELETE CASCADE,
+    ADD CONSTRAINT fk_collection_item_catalog
+        FOREIGN KEY (id_catalog) REFERENCES catalog (id) ON DELETE CASCADE;
+
+ALTER TABLE collection
+    DROP FOREIGN KEY collection_ibfk_1;
+
+ALTER TABLE collection
+    ADD CONSTRAINT fk_collection_author
+        FOREIGN KEY (author) REFERENCES collector (id) ON DELETE CASCADE;
@@ -0,0 +1,11 @@
+-- Индексы для агрегирующих запросов дашборда (_get_country_stats,
+-- _get_collection_types_stats): позволяют MySQL группировать по индексу
+-- без полного сканирования таблиц.
+--
+-- InnoDB автоматически создает индекс для столбца внешнего ключа. Если
+-- SHOW INDEX FROM collector / collection уже показывает индекс по этим
+-- столбцам, соответствующую команду можно пропустить.
+
+CREATE INDEX idx_collector_country ON collector (id_country);
+
+CREATE INDEX idx_collection_type ON collection (id_collection_type);
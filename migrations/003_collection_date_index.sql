@@ -0,0 +1,6 @@
+-- Индекс по дате создания коллекции для статистического отчета: условия
+-- date_of_creation >= DATE_SUB(NOW(), INTERVAL ...) в запросах активности по
+-- месяцам и недавних коллекций выполняются поиском по диапазону индекса
+-- вместо полного сканирования таблицы collection.
+
+CREATE INDEX idx_collection_date ON collection (date_of_creation);
@@ -0,0 +1,8 @@
+-- Индекс по автору коллекции для топа коллекционеров в статистическом отчете
+-- и агрегатов по коллекционерам в Excel: GROUP BY author выполняется по
+-- индексу без сортировки всей таблицы collection.
+--
+-- Если author объявлен внешним ключом, InnoDB уже создал для него индекс
+-- (SHOW INDEX FROM collection) — тогда команду можно пропустить.
+
+CREATE INDEX idx_collection_author ON collection (author);
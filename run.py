@@ -8,13 +8,15 @@ import os
 # Добавляем src в путь для импорта
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-try:
-    from main import main
-    sys.exit(main())
-except ImportError as e:
-    print(f"Ошибка импорта: {e}")
-    print("Проверьте установку зависимостей: pip install -r requirements.txt")
-    sys.exit(1)
-except Exception as e:
-    print(f"Ошибка при запуске: {e}")
-    sys.exit(1)
+# Защита нужна процессу-рендереру PDF: при spawn он заново импортирует этот модуль
+if __name__ == "__main__":
+    try:
+        from main import main
+        sys.exit(main())
+    except ImportError as e:
+        print(f"Ошибка импорта: {e}")
+        print("Проверьте установку зависимостей: pip install -r requirements.txt")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Ошибка при запуске: {e}")
+        sys.exit(1)
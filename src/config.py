@@ -10,6 +10,8 @@ DB_CONFIG = {
     'db': 'is21-08',
     'port': 3306,
     'charset': 'utf8mb4',
+    # Включить после применения migrations/001_on_delete_cascade.sql
+    'cascade_deletes': False,
 }
 
 # Конфигурация PDF генерации
@@ -19,7 +21,16 @@ PDF_CONFIG = {
         'windows': 'C:/Program Files/wkhtmltopdf/bin/wkhtmltopdf.exe',
         'linux': '/usr/bin/wkhtmltopdf',
         'mac': '/usr/local/bin/wkhtmltopdf'
-    }
+    },
+    # 'auto' — статистический отчет через ReportLab, если он установлен,
+    # остальные — WeasyPrint в процессе, если установлен, иначе wkhtmltopdf
+    'engine': 'auto',
+    # Шрифты с кириллицей для ReportLab; используется первый найденный
+    'reportlab_fonts': [
+        '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+        'C:/Windows/Fonts/arial.ttf',
+        '/Library/Fonts/Arial Unicode.ttf',
+    ]
 }
 
 # Настройки приложения
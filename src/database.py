@@ -2,20 +2,240 @@
 Модуль для работы с базой данных
 """
 import asyncio
+import concurrent.futures
+import functools
 import aiomysql
 import threading
 import time
 import logging
-from PySide6.QtCore import QObject, Signal
+from enum import IntEnum
+from collections import namedtuple
+from pymysql.constants import FIELD_TYPE
+from pymysql.converters import decoders
+from PySide6.QtCore import QObject, QTimer, Signal
 import config
 
+try:
+    import uvloop
+except ImportError:  # uvloop недоступен на Windows
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
+# Декодеры драйвера без разбора DATE: даты приходят ISO-строками 'YYYY-MM-DD',
+# как их отдает сервер, и UI выводит их без преобразования при отрисовке
+DB_CONVERSIONS = {
+    field_type: decoder for field_type, decoder in decoders.items()
+    if field_type != FIELD_TYPE.DATE
+}
+
+# Соответствие таблиц ключам статистики дашборда
+STATISTICS_TABLES = {
+    'collector': 'collectors_count',
+    'collection': 'collections_count',
+    'catalog': 'catalog_count',
+    'collection_item': 'items_count',
+}
+
+
+def _sql(text):
+    """Нормализация пробелов: одинаковые запросы всегда отправляются одинаковым текстом"""
+    return ' '.join(text.split())
+
+
+# Запросы на чтение
+SQL_GET_COLLECTORS = _sql("""
+    SELECT c.*, co.country
+    FROM collector c
+    LEFT JOIN country co ON c.id_country = co.id
+""")
+
+SQL_GET_COLLECTIONS = _sql("""
+    SELECT col.*, ct.collection_type
+    FROM collection col
+    LEFT JOIN collection_type ct ON col.id_collection_type = ct.id
+""")
+
+SQL_GET_CATALOG = _sql("""
+    SELECT cat.*, co.country
+    FROM catalog cat
+    LEFT JOIN country co ON cat.id_country = co.id
+""")
+
+# Постраничная выборка для UI: порядок по id, чтобы страницы не пересекались
+SQL_GET_COLLECTORS_PAGE = SQL_GET_COLLECTORS + " ORDER BY c.id LIMIT %s OFFSET %s"
+
+SQL_GET_COLLECTIONS_PAGE = SQL_GET_COLLECTIONS + " ORDER BY col.id LIMIT %s OFFSET %s"
+
+SQL_GET_CATALOG_PAGE = SQL_GET_CATALOG + " ORDER BY cat.id LIMIT %s OFFSET %s"
+
+# Последние коллекции для дашборда: сервер отдает только нужные строки
+SQL_GET_RECENT_COLLECTIONS = SQL_GET_COLLECTIONS + " ORDER BY col.id DESC LIMIT %s"
+
+RECENT_COLLECTIONS_LIMIT = 8
+
+SQL_COUNT_COLLECTORS = "SELECT COUNT(*) as total FROM collector"
+
+SQL_COUNT_COLLECTIONS = "SELECT COUNT(*) as total FROM collection"
+
+SQL_COUNT_CATALOG = "SELECT COUNT(*) as total FROM catalog"
+
+SQL_STATISTICS_EXACT = _sql("""
+    SELECT
+        (SELECT COUNT(*) FROM collector) as collectors_count,
+        (SELECT COUNT(*) FROM collection) as collections_count,
+        (SELECT COUNT(*) FROM catalog) as catalog_count,
+        (SELECT COUNT(*) FROM collection_item) as items_count
+""")
+
+SQL_STATISTICS_ESTIMATE = _sql("""
+    SELECT TABLE_NAME as table_name, TABLE_ROWS as table_rows
+    FROM information_schema.TABLES
+    WHERE TABLE_SCHEMA = %s
+      AND TABLE_NAME IN ('collector', 'collection', 'catalog', 'collection_item')
+""")
+
+SQL_COLLECTION_TYPES_STATS = _sql("""
+    SELECT ct.collection_type, COUNT(*) as count
+    FROM collection c
+    INNER JOIN collection_type ct ON c.id_collection_type = ct.id
+    GROUP BY ct.collection_type
+""")
+
+SQL_COUNTRY_STATS = _sql("""
+    SELECT co.country, COUNT(*) as collector_count
+    FROM collector c
+    INNER JOIN country co ON c.id_country = co.id
+    GROUP BY co.country
+    ORDER BY collector_count DESC
+    LIMIT 10
+""")
+
+SQL_COLLECTOR_AGGREGATES = _sql("""
+    SELECT author, COUNT(*) as collections_count,
+           CAST(COALESCE(SUM(number_of_items), 0) AS SIGNED) as items_count
+    FROM collection
+    WHERE author IS NOT NULL
+    GROUP BY author
+""")
+
+SQL_GET_COUNTRIES = "SELECT * FROM country"
+
+SQL_GET_COLLECTION_TYPES = "SELECT * FROM collection_type"
+
+# Запросы на изменение
+SQL_INSERT_COLLECTOR = _sql("""
+    INSERT INTO collector (surname, name, patronymic, email, id_country, description)
+    VALUES (%s, %s, %s, %s, %s, %s)
+""")
+
+SQL_UPDATE_COLLECTOR = _sql("""
+    UPDATE collector
+    SET surname=%s, name=%s, patronymic=%s, email=%s, id_country=%s, description=%s
+    WHERE id=%s
+""")
+
+SQL_INSERT_COLLECTION = _sql("""
+    INSERT INTO collection (name, author, id_collection_type, date_of_creation, number_of_items, description)
+    VALUES (%s, %s, %s, %s, %s, %s)
+""")
+
+SQL_UPDATE_COLLECTION = _sql("""
+    UPDATE collection
+    SET name=%s, author=%s, id_collection_type=%s, date_of_creation=%s, number_of_items=%s, description=%s
+    WHERE id=%s
+""")
+
+SQL_INSERT_CATALOG_ITEM = _sql("""
+    INSERT INTO catalog (name, rare, id_country, release_date, description)
+    VALUES (%s, %s, %s, %s, %s)
+""")
+
+SQL_UPDATE_CATALOG_ITEM = _sql("""
+    UPDATE catalog
+    SET name=%s, rare=%s, id_country=%s, release_date=%s, description=%s
+    WHERE id=%s
+""")
+
+# Запросы на удаление
+SQL_DELETE_COLLECTOR_ITEMS = _sql("""
+    DELETE ci FROM collection_item ci
+    JOIN collection col ON ci.id_collection = col.id
+    WHERE col.author = %s
+""")
+
+SQL_DELETE_COLLECTOR_COLLECTIONS = "DELETE FROM collection WHERE author = %s"
+
+SQL_DELETE_COLLECTOR = "DELETE FROM collector WHERE id = %s"
+
+SQL_COUNT_COLLECTION_ITEMS = "SELECT COUNT(*) as count FROM collection_item WHERE id_collection = %s"
+
+SQL_DELETE_COLLECTION_ITEMS = "DELETE FROM collection_item WHERE id_collection = %s"
+
+SQL_DELETE_COLLECTION = "DELETE FROM collection WHERE id = %s"
+
+SQL_COUNT_CATALOG_LINKS = "SELECT COUNT(*) as count FROM collection_item WHERE id_catalog = %s"
+
+SQL_DELETE_CATALOG_LINKS = "DELETE FROM collection_item WHERE id_catalog = %s"
+
+SQL_DELETE_CATALOG_ITEM = "DELETE FROM catalog WHERE id = %s"
+
+
+class DataKind(IntEnum):
+    """Тип данных в сигнале data_loaded (индекс в таблице обработчиков UI)"""
+    STATISTICS = 0
+    COLLECTORS = 1
+    COLLECTIONS = 2
+    CATALOG = 3
+    COLLECTION_TYPES = 4
+    COUNTRY_STATS = 5
+    COUNTRIES = 6
+    COLLECTION_TYPES_LIST = 7
+    COLLECTORS_PAGE = 8
+    COLLECTIONS_PAGE = 9
+    CATALOG_PAGE = 10
+    COLLECTOR_ADDED = 11
+    COLLECTOR_UPDATED = 12
+    COLLECTOR_DELETED = 13
+    COLLECTION_ADDED = 14
+    COLLECTION_UPDATED = 15
+    COLLECTION_DELETED = 16
+    CATALOG_ITEM_ADDED = 17
+    CATALOG_ITEM_UPDATED = 18
+    CATALOG_ITEM_DELETED = 19
+    COLLECTORS_ADDED = 20
+    COLLECTIONS_ADDED = 21
+    CATALOG_ITEMS_ADDED = 22
+    RECENT_COLLECTIONS = 23
+    DASHBOARD = 24
+
+    def __str__(self):
+        return self.name.lower()
+
 
 class DatabaseManager(QObject):
-    data_loaded = Signal(str, object)
+    data_loaded = Signal(int, object)
     error_occurred = Signal(str)
     connected = Signal()
+
+    # Тип данных -> корутина загрузки
+    LOADERS = {
+        DataKind.STATISTICS: '_get_dashboard_statistics',
+        DataKind.COLLECTORS: '_get_collectors',
+        DataKind.COLLECTIONS: '_get_collections',
+        DataKind.CATALOG: '_get_catalog',
+        DataKind.COLLECTION_TYPES: '_get_collection_types_stats',
+        DataKind.COUNTRY_STATS: '_get_country_stats',
+        DataKind.COUNTRIES: '_get_countries',
+        DataKind.COLLECTION_TYPES_LIST: '_get_collection_types',
+        DataKind.RECENT_COLLECTIONS: '_get_recent_collections',
+    }
+
+    # Наборы данных, из которых состоит снимок дашборда
+    DASHBOARD_KINDS = (
+        DataKind.STATISTICS, DataKind.COLLECTION_TYPES,
+        DataKind.COUNTRY_STATS, DataKind.RECENT_COLLECTIONS,
+    )
     
     def __init__(self, db_config=None):
         super().__init__()
@@ -23,19 +243,43 @@ class DatabaseManager(QObject):
         self.pool = None
         self.loop = None
         self.thread = None
-        self._is_loop_ready = False
+        self._connect_future = None
+        self._connect_lock = None
+        self._loop_ready = threading.Event()
+        self._row_types = {}
+        self._callbacks = {}
+        # Кэш редко меняющихся справочников: data_type -> (время загрузки, данные).
+        # Снимок дашборда держится несколько секунд: повторные запросы
+        # (переключение на дашборд, таймер) отдаются из памяти.
+        self._cache = {}
+        self._cache_ttl = {
+            DataKind.COUNTRIES: 300,
+            DataKind.COLLECTION_TYPES_LIST: 300,
+            DataKind.DASHBOARD: 5,
+        }
+        # Кэш общего числа строк для постраничной выборки: запрос -> (время, число)
+        self._row_counts = {}
+        self._row_count_ttl = 5
+        # Оценки TABLE_ROWS кэшируются сервером (information_schema_stats_expiry,
+        # по умолчанию сутки) и не видят только что сделанных изменений:
+        # первая загрузка статистики после изменения считает строки точно
+        self._exact_statistics_once = False
 
     def start(self):
         """Запуск event loop в отдельном потоке"""
-        self.thread = threading.Thread(target=self._run_event_loop, daemon=True)
+        self.thread = threading.Thread(target=self._run_event_loop, name="dbmgr-loop", daemon=True)
         self.thread.start()
 
     def _run_event_loop(self):
         """Запуск event loop"""
         try:
-            self.loop = asyncio.new_event_loop()
+            self.loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop)
-            self._is_loop_ready = True
+            self.loop.set_default_executor(
+                concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="dbmgr")
+            )
+            self._connect_lock = asyncio.Lock()
+            self._loop_ready.set()
             logger.info("Event loop запущен")
             self.loop.run_forever()
         except Exception as e:
@@ -44,13 +288,16 @@ class DatabaseManager(QObject):
 
     def wait_for_loop(self, timeout=5):
         """Ожидание инициализации event loop"""
-        start_time = time.time()
-        while not self._is_loop_ready and time.time() - start_time < timeout:
-            time.sleep(0.1)
-        return self._is_loop_ready
+        return self._loop_ready.wait(timeout)
 
     async def _connect(self):
         """Подключение к базе данных"""
+        async with self._connect_lock:
+            if self.pool:
+                return True
+            return await self._create_pool()
+
+    async def _create_pool(self):
         try:
             logger.info("Подключение к базе данных...")
             self.pool = await aiomysql.create_pool(
@@ -59,6 +306,7 @@ class DatabaseManager(QObject):
                 password=self.db_config['password'],
                 db=self.db_config['db'],
                 autocommit=True,
+                conv=DB_CONVERSIONS,
                 minsize=1,
                 maxsize=10
             )
@@ -70,17 +318,51 @@ class DatabaseManager(QObject):
             self.error_occurred.emit(str(e))
             return False
 
-    async def _execute_query(self, query, params=None):
-        """Выполнение запроса"""
+    def _row_type(self, row_name, description):
+        """Тип namedtuple для строк результата с заданным набором колонок"""
+        columns = tuple(column[0] for column in description)
+        key = (row_name, columns)
+        row_type = self._row_types.get(key)
+        if row_type is None:
+            row_type = namedtuple(row_name, columns, rename=True)
+            self._row_types[key] = row_type
+        return row_type
+
+    async def _execute_query(self, query, params=None, *, fetch=True, row_name=None, stream=False):
+        """
+        Выполнение запроса.
+
+        fetch=True возвращает строки результата, fetch=False - lastrowid
+        (для INSERT/UPDATE).
+
+        Если указан row_name, строки возвращаются как namedtuple с этим
+        именем вместо словарей - это заметно экономит память на больших
+        выборках. При stream=True используется небуферизованный курсор:
+        строки читаются с сервера по одной и сразу преобразуются, без
+        промежуточной копии всего результата в драйвере.
+        """
         if not self.pool:
             return None
             
+        if stream:
+            cursor_class = aiomysql.SSCursor if row_name else aiomysql.SSDictCursor
+        else:
+            cursor_class = aiomysql.Cursor if row_name else aiomysql.DictCursor
         try:
             async with self.pool.acquire() as conn:
-                async with conn.cursor(aiomysql.DictCursor) as cursor:
+                async with conn.cursor(cursor_class) as cursor:
                     await cursor.execute(query, params)
-                    if query.strip().upper().startswith('SELECT'):
-                        return await cursor.fetchall()
+                    if fetch:
+                        if stream:
+                            if row_name:
+                                row_type = self._row_type(row_name, cursor.description)
+                                return [row_type._make(row) async for row in cursor]
+                            return [row async for row in cursor]
+                        rows = await cursor.fetchall()
+                        if row_name:
+                            row_type = self._row_type(row_name, cursor.description)
+                            return [row_type._make(row) for row in rows]
+                        return rows
                     else:
                         return cursor.lastrowid
         except Exception as e:
@@ -88,402 +370,479 @@ class DatabaseManager(QObject):
             return None
 
     def connect(self):
-        """Запуск подключения к БД"""
+        """
+        Запуск подключения к БД.
+
+        Повторные вызовы во время подключения возвращают тот же future,
+        поэтому пул создается только один раз.
+        """
+        if self._connect_future is not None and not self._connect_future.done():
+            return self._connect_future
         if self.wait_for_loop():
-            asyncio.run_coroutine_threadsafe(self._connect(), self.loop)
+            self._connect_future = asyncio.run_coroutine_threadsafe(self._connect(), self.loop)
+            return self._connect_future
         else:
             logger.error("Event loop не запущен")
             self.error_occurred.emit("Event loop не запущен")
 
     # Методы для получения данных
     def get_collectors(self):
-        if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._get_collectors(), self.loop)
-        future.add_done_callback(lambda f: self._on_data_loaded(f, 'collectors'))
+        self._submit(self._get_collectors, DataKind.COLLECTORS)
 
     def get_collections(self):
-        if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._get_collections(), self.loop)
-        future.add_done_callback(lambda f: self._on_data_loaded(f, 'collections'))
+        self._submit(self._get_collections, DataKind.COLLECTIONS)
 
     def get_catalog(self):
-        if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._get_catalog(), self.loop)
-        future.add_done_callback(lambda f: self._on_data_loaded(f, 'catalog'))
+        self._submit(self._get_catalog, DataKind.CATALOG)
 
-    def get_statistics(self):
-        if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._get_statistics(), self.loop)
-        future.add_done_callback(lambda f: self._on_data_loaded(f, 'statistics'))
+    def get_recent_collections(self, limit=RECENT_COLLECTIONS_LIMIT):
+        self._submit(self._get_recent_collections, DataKind.RECENT_COLLECTIONS, limit)
+
+    def get_statistics(self, exact=False):
+        self._submit(self._get_statistics, DataKind.STATISTICS, exact)
 
     def get_collection_types_stats(self):
-        if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._get_collection_types_stats(), self.loop)
-        future.add_done_callback(lambda f: self._on_data_loaded(f, 'collection_types'))
+        self._submit(self._get_collection_types_stats, DataKind.COLLECTION_TYPES)
 
     def get_country_stats(self):
-        if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._get_country_stats(), self.loop)
-        future.add_done_callback(lambda f: self._on_data_loaded(f, 'country_stats'))
+        self._submit(self._get_country_stats, DataKind.COUNTRY_STATS)
 
     def get_countries(self):
         if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._get_countries(), self.loop)
-        future.add_done_callback(lambda f: self._on_data_loaded(f, 'countries'))
+        if self._emit_cached(DataKind.COUNTRIES): return
+        self._submit(self._get_countries, DataKind.COUNTRIES)
 
     def get_collection_types(self):
         if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._get_collection_types(), self.loop)
-        future.add_done_callback(lambda f: self._on_data_loaded(f, 'collection_types_list'))
+        if self._emit_cached(DataKind.COLLECTION_TYPES_LIST): return
+        self._submit(self._get_collection_types, DataKind.COLLECTION_TYPES_LIST)
+
+    def get_dashboard(self):
+        """Снимок дашборда одним сигналом: {DataKind: данные}"""
+        if not self.pool: return
+        if self._emit_cached(DataKind.DASHBOARD): return
+        self._submit(self._get_dashboard, DataKind.DASHBOARD)
+
+    def get_collectors_page(self, offset, limit):
+        self._submit(self._get_collectors_page, DataKind.COLLECTORS_PAGE, offset, limit)
+
+    def get_collections_page(self, offset, limit):
+        self._submit(self._get_collections_page, DataKind.COLLECTIONS_PAGE, offset, limit)
+
+    def get_catalog_page(self, offset, limit):
+        self._submit(self._get_catalog_page, DataKind.CATALOG_PAGE, offset, limit)
+
+    def refresh_all(self, data_types=None):
+        """Параллельная загрузка нескольких наборов данных одним вызовом"""
+        if not self.pool: return
+        data_types = [
+            data_type for data_type in (data_types or self.LOADERS)
+            if not (data_type in self._cache_ttl and self._emit_cached(data_type))
+        ]
+        if data_types:
+            asyncio.run_coroutine_threadsafe(self._refresh_all(data_types), self.loop)
+
+    async def _refresh_all(self, data_types):
+        results = await asyncio.gather(
+            *(getattr(self, self.LOADERS[data_type])() for data_type in data_types),
+            return_exceptions=True
+        )
+        for data_type, result in zip(data_types, results):
+            if isinstance(result, Exception):
+                self.error_occurred.emit(f"Ошибка загрузки {data_type}: {result}")
+            else:
+                self._emit_loaded(data_type, result)
+
+    # Кэширование справочников
+    def _emit_cached(self, data_type):
+        """Отправка данных из кэша, если они еще не устарели"""
+        entry = self._cache.get(data_type)
+        if entry is None:
+            return False
+        loaded_at, data = entry
+        if time.monotonic() - loaded_at > self._cache_ttl[data_type]:
+            del self._cache[data_type]
+            return False
+        QTimer.singleShot(0, lambda: self.data_loaded.emit(data_type, data))
+        return True
+
+    def invalidate_cache(self, *data_types):
+        """Сброс кэша справочников (без аргументов - полностью)"""
+        if not data_types:
+            self._cache.clear()
+            self._row_counts.clear()
+            return
+        for data_type in data_types:
+            self._cache.pop(data_type, None)
+
+    def _submit(self, coro_func, key, *args, done=None):
+        """Запуск корутины в event loop с обработчиком результата для ключа key"""
+        if not self.pool: return
+        future = asyncio.run_coroutine_threadsafe(coro_func(*args), self.loop)
+        future.add_done_callback(self._callback(done or self._on_data_loaded, key))
+
+    def _callback(self, handler, key):
+        """Закэшированный done-callback для пары (обработчик, ключ)"""
+        callback = self._callbacks.get((handler.__name__, key))
+        if callback is None:
+            callback = functools.partial(handler, data_type=key)
+            self._callbacks[(handler.__name__, key)] = callback
+        return callback
 
     # Асинхронные методы для выполнения запросов
     async def _get_collectors(self):
-        return await self._execute_query("""
-            SELECT c.*, co.country 
-            FROM collector c 
-            LEFT JOIN country co ON c.id_country = co.id
-        """)
+        return await self._execute_query(SQL_GET_COLLECTORS, row_name='Collector', stream=True)
 
     async def _get_collections(self):
-        return await self._execute_query("""
-            SELECT col.*, ct.collection_type 
-            FROM collection col 
-            LEFT JOIN collection_type ct ON col.id_collection_type = ct.id
-        """)
+        return await self._execute_query(SQL_GET_COLLECTIONS, row_name='Collection', stream=True)
 
     async def _get_catalog(self):
-        return await self._execute_query("""
-            SELECT cat.*, co.country 
-            FROM catalog cat 
-            LEFT JOIN country co ON cat.id_country = co.id
-        """)
-
-    async def _get_statistics(self):
-        result = await self._execute_query("""
-            SELECT 
-                (SELECT COUNT(*) FROM collector) as collectors_count,
-                (SELECT COUNT(*) FROM collection) as collections_count,
-                (SELECT COUNT(*) FROM catalog) as catalog_count,
-                (SELECT COUNT(*) FROM collection_item) as items_count
-        """)
-        return result[0] if result else {}
+        return await self._execute_query(SQL_GET_CATALOG, row_name='CatalogItem', stream=True)
+
+    async def _get_recent_collections(self, limit=RECENT_COLLECTIONS_LIMIT):
+        return await self._execute_query(SQL_GET_RECENT_COLLECTIONS, (limit,), row_name='Collection')
+
+    async def _get_dashboard(self):
+        results = await asyncio.gather(
+            *(getattr(self, self.LOADERS[data_type])() for data_type in self.DASHBOARD_KINDS)
+        )
+        return dict(zip(self.DASHBOARD_KINDS, results))
+
+    async def _get_collectors_page(self, offset, limit):
+        return await self._get_page(SQL_GET_COLLECTORS_PAGE, SQL_COUNT_COLLECTORS, 'Collector', offset, limit)
+
+    async def _get_collections_page(self, offset, limit):
+        return await self._get_page(SQL_GET_COLLECTIONS_PAGE, SQL_COUNT_COLLECTIONS, 'Collection', offset, limit)
+
+    async def _get_catalog_page(self, offset, limit):
+        return await self._get_page(SQL_GET_CATALOG_PAGE, SQL_COUNT_CATALOG, 'CatalogItem', offset, limit)
+
+    async def _get_page(self, page_query, count_query, row_name, offset, limit):
+        """Одна страница строк и общее число строк таблицы"""
+        rows = await self._execute_query(page_query, (limit, offset), row_name=row_name)
+        return {
+            'rows': rows or [],
+            'total': await self._count_rows(count_query),
+            'offset': offset,
+            'limit': limit,
+        }
+
+    async def _count_rows(self, count_query):
+        """Точное число строк, закэшированное на несколько секунд"""
+        entry = self._row_counts.get(count_query)
+        if entry is not None and time.monotonic() - entry[0] <= self._row_count_ttl:
+            return entry[1]
+        result = await self._execute_query(count_query)
+        total = result[0]['total'] if result else 0
+        self._row_counts[count_query] = (time.monotonic(), total)
+        return total
+
+    async def _get_statistics(self, exact=False):
+        """
+        Общая статистика по таблицам.
+
+        По умолчанию количество строк берется из information_schema: это
+        не требует полного сканирования таблиц, но для InnoDB значения
+        являются оценкой. Для точного подсчета передайте exact=True.
+        """
+        if exact:
+            result = await self._execute_query(SQL_STATISTICS_EXACT)
+            return result[0] if result else {}
+
+        result = await self._execute_query(SQL_STATISTICS_ESTIMATE, (self.db_config['db'],))
+        if not result:
+            return {}
+
+        rows = {row['table_name']: row['table_rows'] or 0 for row in result}
+        return {
+            key: rows.get(table, 0)
+            for table, key in STATISTICS_TABLES.items()
+        }
+
+    async def _get_dashboard_statistics(self):
+        """Статистика для дашборда: оценка, после изменения данных - один точный подсчет"""
+        exact, self._exact_statistics_once = self._exact_statistics_once, False
+        return await self._get_statistics(exact=exact)
 
     async def _get_collection_types_stats(self):
-        return await self._execute_query("""
-            SELECT ct.collection_type, COUNT(c.id) as count
-            FROM collection c
-            LEFT JOIN collection_type ct ON c.id_collection_type = ct.id
-            GROUP BY ct.collection_type
-        """)
+        return await self._execute_query(SQL_COLLECTION_TYPES_STATS, row_name='TypeStat')
 
     async def _get_country_stats(self):
-        return await self._execute_query("""
-            SELECT co.country, COUNT(c.id) as collector_count
-            FROM collector c
-            LEFT JOIN country co ON c.id_country = co.id
-            GROUP BY co.country
-            ORDER BY collector_count DESC
-            LIMIT 10
-        """)
+        return await self._execute_query(SQL_COUNTRY_STATS, row_name='CountryStat')
+
+    async def _get_collector_aggregates(self):
+        return await self._execute_query(SQL_COLLECTOR_AGGREGATES)
 
     async def _get_countries(self):
-        return await self._execute_query("SELECT * FROM country")
+        return await self._execute_query(SQL_GET_COUNTRIES)
 
     async def _get_collection_types(self):
-        return await self._execute_query("SELECT * FROM collection_type")
+        return await self._execute_query(SQL_GET_COLLECTION_TYPES)
 
     # Методы для добавления/обновления/удаления данных
     def add_collector(self, data):
-        if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._add_collector(data), self.loop)
-        future.add_done_callback(lambda f: self._on_modify_complete(f, 'collector_added'))
+        self._submit(self._add_collector, DataKind.COLLECTOR_ADDED, data, done=self._on_modify_complete)
 
     def update_collector(self, collector_id, data):
-        if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._update_collector(collector_id, data), self.loop)
-        future.add_done_callback(lambda f: self._on_modify_complete(f, 'collector_updated'))
+        self._submit(self._update_collector, DataKind.COLLECTOR_UPDATED, collector_id, data, done=self._on_modify_complete)
 
     def delete_collector(self, collector_id):
-        if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._delete_collector(collector_id), self.loop)
-        future.add_done_callback(lambda f: self._on_modify_complete(f, 'collector_deleted'))
+        self._submit(self._delete_collector, DataKind.COLLECTOR_DELETED, collector_id, done=self._on_modify_complete)
 
     def add_collection(self, data):
-        if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._add_collection(data), self.loop)
-        future.add_done_callback(lambda f: self._on_modify_complete(f, 'collection_added'))
+        self._submit(self._add_collection, DataKind.COLLECTION_ADDED, data, done=self._on_modify_complete)
 
     def update_collection(self, collection_id, data):
-        if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._update_collection(collection_id, data), self.loop)
-        future.add_done_callback(lambda f: self._on_modify_complete(f, 'collection_updated'))
+        self._submit(self._update_collection, DataKind.COLLECTION_UPDATED, collection_id, data, done=self._on_modify_complete)
 
     def delete_collection(self, collection_id):
-        if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._delete_collection(collection_id), self.loop)
-        future.add_done_callback(lambda f: self._on_modify_complete(f, 'collection_deleted'))
+        self._submit(self._delete_collection, DataKind.COLLECTION_DELETED, collection_id, done=self._on_modify_complete)
 
     def add_catalog_item(self, data):
-        if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._add_catalog_item(data), self.loop)
-        future.add_done_callback(lambda f: self._on_modify_complete(f, 'catalog_item_added'))
+        self._submit(self._add_catalog_item, DataKind.CATALOG_ITEM_ADDED, data, done=self._on_modify_complete)
 
     def update_catalog_item(self, item_id, data):
-        if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._update_catalog_item(item_id, data), self.loop)
-        future.add_done_callback(lambda f: self._on_modify_complete(f, 'catalog_item_updated'))
+        self._submit(self._update_catalog_item, DataKind.CATALOG_ITEM_UPDATED, item_id, data, done=self._on_modify_complete)
 
     def delete_catalog_item(self, item_id):
-        if not self.pool: return
-        future = asyncio.run_coroutine_threadsafe(self._delete_catalog_item(item_id), self.loop)
-        future.add_done_callback(lambda f: self._on_modify_complete(f, 'catalog_item_deleted'))
+        self._submit(self._delete_catalog_item, DataKind.CATALOG_ITEM_DELETED, item_id, done=self._on_modify_complete)
+
+    def add_collectors(self, rows):
+        self._submit(self._add_collectors, DataKind.COLLECTORS_ADDED, rows, done=self._on_modify_complete)
+
+    def add_collections(self, rows):
+        self._submit(self._add_collections, DataKind.COLLECTIONS_ADDED, rows, done=self._on_modify_complete)
+
+    def add_catalog_items(self, rows):
+        self._submit(self._add_catalog_items, DataKind.CATALOG_ITEMS_ADDED, rows, done=self._on_modify_complete)
+
+    # Параметры INSERT запросов
+    def _collector_params(self, data):
+        return (data['surname'], data['name'], data['patronymic'], data['email'], 
+                data['id_country'], data['description'])
+
+    def _collection_params(self, data):
+        return (data['name'], data['author'], data.get('id_collection_type') or 1,
+                data['date_of_creation'], data['number_of_items'], data['description'])
+
+    def _catalog_item_params(self, data):
+        return (data['name'], data['rare'], data.get('id_country') or 1,
+                data['release_date'], data['description'])
 
     # Асинхронные методы для модификации данных
+    async def _execute_many(self, query, params_list):
+        """Пакетная вставка одним запросом в транзакции, возвращает число строк"""
+        if not params_list:
+            return 0
+        async with self.pool.acquire() as conn:
+            await conn.begin()
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.executemany(query, params_list)
+                    rowcount = cursor.rowcount
+                await conn.commit()
+                return rowcount
+            except Exception as e:
+                await conn.rollback()
+                logger.error(f"Ошибка пакетной вставки: {e}")
+                raise
+
     async def _add_collector(self, data):
-        query = """
-            INSERT INTO collector (surname, name, patronymic, email, id_country, description)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """
-        params = (data['surname'], data['name'], data['patronymic'], data['email'], 
-                 data['id_country'], data['description'])
-        return await self._execute_query(query, params)
+        return await self._execute_query(SQL_INSERT_COLLECTOR, self._collector_params(data), fetch=False)
+
+    async def _add_collectors(self, rows):
+        return await self._execute_many(SQL_INSERT_COLLECTOR, [self._collector_params(data) for data in rows])
 
     async def _update_collector(self, collector_id, data):
-        query = """
-            UPDATE collector 
-            SET surname=%s, name=%s, patronymic=%s, email=%s, id_country=%s, description=%s
-            WHERE id=%s
-        """
         params = (data['surname'], data['name'], data['patronymic'], data['email'],
                  data['id_country'], data['description'], collector_id)
-        return await self._execute_query(query, params)
+        return await self._execute_query(SQL_UPDATE_COLLECTOR, params, fetch=False)
 
     async def _delete_collector(self, collector_id):
         """Удаление коллекционера с учетом внешних ключей через транзакцию"""
-        conn = None
+        if self.db_config.get('cascade_deletes'):
+            return await self._delete_cascade(SQL_DELETE_COLLECTOR, collector_id)
+
         try:
-            conn = await aiomysql.connect(
-                host=self.db_config['host'],
-                user=self.db_config['user'],
-                password=self.db_config['password'],
-                db=self.db_config['db'],
-                autocommit=False
-            )
-            
-            async with conn.cursor(aiomysql.DictCursor) as cursor:
-                try:
-                    # Сначала находим все коллекции этого коллекционера
-                    find_collections_query = "SELECT id FROM collection WHERE author = %s"
-                    await cursor.execute(find_collections_query, (collector_id,))
-                    collections = await cursor.fetchall()
-                    
-                    # Для каждой коллекции удаляем зависимые записи в collection_item
-                    for collection in collections:
-                        collection_id = collection['id']
-                        delete_items_query = "DELETE FROM collection_item WHERE id_collection = %s"
-                        await cursor.execute(delete_items_query, (collection_id,))
+            async with self.pool.acquire() as conn:
+                # Соединения пула работают в autocommit, поэтому транзакцию открываем явно
+                await conn.begin()
+                async with conn.cursor(aiomysql.DictCursor) as cursor:
+                    try:
+                        # Сначала одним запросом удаляем записи collection_item всех коллекций коллекционера
+                        await cursor.execute(SQL_DELETE_COLLECTOR_ITEMS, (collector_id,))
                     
-                    # Теперь удаляем все коллекции коллекционера
-                    delete_collections_query = "DELETE FROM collection WHERE author = %s"
-                    await cursor.execute(delete_collections_query, (collector_id,))
+                        # Теперь удаляем все коллекции коллекционера
+                        await cursor.execute(SQL_DELETE_COLLECTOR_COLLECTIONS, (collector_id,))
                     
-                    # Наконец, удаляем самого коллекционера
-                    delete_collector_query = "DELETE FROM collector WHERE id = %s"
-                    await cursor.execute(delete_collector_query, (collector_id,))
+                        # Наконец, удаляем самого коллекционера
+                        await cursor.execute(SQL_DELETE_COLLECTOR, (collector_id,))
                     
-                    await conn.commit()
-                    logger.info(f"Коллекционер {collector_id} и все его коллекции успешно удалены")
-                    return True
+                        await conn.commit()
+                        logger.info(f"Коллекционер {collector_id} и все его коллекции успешно удалены")
+                        return True
                     
-                except Exception as e:
-                    await conn.rollback()
-                    logger.error(f"Ошибка в транзакции удаления коллекционера {collector_id}: {e}")
-                    raise
+                    except Exception as e:
+                        await conn.rollback()
+                        logger.error(f"Ошибка в транзакции удаления коллекционера {collector_id}: {e}")
+                        raise
                     
         except Exception as e:
             logger.error(f"Ошибка подключения или удаления коллекционера {collector_id}: {e}")
             raise
-            
-        finally:
-            if conn:
-                conn.close()
 
     async def _add_collection(self, data):
         try:
-            query = """
-                INSERT INTO collection (name, author, id_collection_type, date_of_creation, number_of_items, description)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """
-            id_collection_type = data['id_collection_type'] if data['id_collection_type'] else 1
-            params = (data['name'], data['author'], id_collection_type,
-                     data['date_of_creation'], data['number_of_items'], data['description'])
-            return await self._execute_query(query, params)
+            return await self._execute_query(SQL_INSERT_COLLECTION, self._collection_params(data), fetch=False)
         except Exception as e:
             logger.error(f"Ошибка добавления коллекции: {e}")
             raise
 
+    async def _add_collections(self, rows):
+        return await self._execute_many(SQL_INSERT_COLLECTION, [self._collection_params(data) for data in rows])
+
     async def _update_collection(self, collection_id, data):
-        query = """
-            UPDATE collection 
-            SET name=%s, author=%s, id_collection_type=%s, date_of_creation=%s, number_of_items=%s, description=%s
-            WHERE id=%s
-        """
         params = (data['name'], data['author'], data['id_collection_type'],
                  data['date_of_creation'], data['number_of_items'], data['description'], collection_id)
-        return await self._execute_query(query, params)
+        return await self._execute_query(SQL_UPDATE_COLLECTION, params, fetch=False)
 
     async def _delete_collection(self, collection_id):
         """Удаление коллекции с учетом внешних ключей через транзакцию"""
-        conn = None
+        if self.db_config.get('cascade_deletes'):
+            return await self._delete_cascade(SQL_DELETE_COLLECTION, collection_id)
+
         try:
-            conn = await aiomysql.connect(
-                host=self.db_config['host'],
-                user=self.db_config['user'],
-                password=self.db_config['password'],
-                db=self.db_config['db'],
-                autocommit=False
-            )
-            
-            async with conn.cursor(aiomysql.DictCursor) as cursor:
-                try:
-                    # Проверяем, есть ли зависимые записи в collection_item
-                    check_query = """
-                        SELECT COUNT(*) as count 
-                        FROM collection_item 
-                        WHERE id_collection = %s
-                    """
-                    await cursor.execute(check_query, (collection_id,))
-                    result = await cursor.fetchone()
+            async with self.pool.acquire() as conn:
+                # Соединения пула работают в autocommit, поэтому транзакцию открываем явно
+                await conn.begin()
+                async with conn.cursor(aiomysql.DictCursor) as cursor:
+                    try:
+                        # Проверяем, есть ли зависимые записи в collection_item
+                        await cursor.execute(SQL_COUNT_COLLECTION_ITEMS, (collection_id,))
+                        result = await cursor.fetchone()
                     
-                    if result and result['count'] > 0:
-                        # Удаляем зависимые записи
-                        delete_items_query = "DELETE FROM collection_item WHERE id_collection = %s"
-                        await cursor.execute(delete_items_query, (collection_id,))
-                        logger.info(f"Удалено {result['count']} предметов из коллекции {collection_id}")
+                        if result and result['count'] > 0:
+                            # Удаляем зависимые записи
+                            await cursor.execute(SQL_DELETE_COLLECTION_ITEMS, (collection_id,))
+                            logger.info(f"Удалено {result['count']} предметов из коллекции {collection_id}")
                     
-                    # Удаляем саму коллекцию
-                    delete_collection_query = "DELETE FROM collection WHERE id = %s"
-                    await cursor.execute(delete_collection_query, (collection_id,))
+                        # Удаляем саму коллекцию
+                        await cursor.execute(SQL_DELETE_COLLECTION, (collection_id,))
                     
-                    await conn.commit()
-                    logger.info(f"Коллекция {collection_id} успешно удалена")
-                    return True
+                        await conn.commit()
+                        logger.info(f"Коллекция {collection_id} успешно удалена")
+                        return True
                     
-                except Exception as e:
-                    await conn.rollback()
-                    logger.error(f"Ошибка в транзакции удаления коллекции {collection_id}: {e}")
-                    raise
+                    except Exception as e:
+                        await conn.rollback()
+                        logger.error(f"Ошибка в транзакции удаления коллекции {collection_id}: {e}")
+                        raise
                     
         except Exception as e:
             logger.error(f"Ошибка подключения или удаления коллекции {collection_id}: {e}")
             raise
-            
-        finally:
-            if conn:
-                conn.close()
 
     async def _add_catalog_item(self, data):
         try:
-            query = """
-                INSERT INTO catalog (name, rare, id_country, release_date, description)
-                VALUES (%s, %s, %s, %s, %s)
-            """
-            id_country = data['id_country'] if data['id_country'] else 1
-            params = (data['name'], data['rare'], id_country,
-                     data['release_date'], data['description'])
-            return await self._execute_query(query, params)
+            return await self._execute_query(SQL_INSERT_CATALOG_ITEM, self._catalog_item_params(data), fetch=False)
         except Exception as e:
             logger.error(f"Ошибка добавления предмета каталога: {e}")
             raise
 
+    async def _add_catalog_items(self, rows):
+        return await self._execute_many(SQL_INSERT_CATALOG_ITEM, [self._catalog_item_params(data) for data in rows])
+
     async def _update_catalog_item(self, item_id, data):
-        query = """
-            UPDATE catalog 
-            SET name=%s, rare=%s, id_country=%s, release_date=%s, description=%s
-            WHERE id=%s
-        """
         params = (data['name'], data['rare'], data['id_country'],
                  data['release_date'], data['description'], item_id)
-        return await self._execute_query(query, params)
+        return await self._execute_query(SQL_UPDATE_CATALOG_ITEM, params, fetch=False)
 
     async def _delete_catalog_item(self, item_id):
         """Удаление предмета каталога с учетом внешних ключей через транзакцию"""
-        conn = None
+        if self.db_config.get('cascade_deletes'):
+            return await self._delete_cascade(SQL_DELETE_CATALOG_ITEM, item_id)
+
         try:
-            conn = await aiomysql.connect(
-                host=self.db_config['host'],
-                user=self.db_config['user'],
-                password=self.db_config['password'],
-                db=self.db_config['db'],
-                autocommit=False
-            )
-            
-            async with conn.cursor(aiomysql.DictCursor) as cursor:
-                try:
-                    # Проверяем, есть ли зависимые записи
-                    check_query = """
-                        SELECT COUNT(*) as count 
-                        FROM collection_item 
-                        WHERE id_catalog = %s
-                    """
-                    await cursor.execute(check_query, (item_id,))
-                    result = await cursor.fetchone()
+            async with self.pool.acquire() as conn:
+                # Соединения пула работают в autocommit, поэтому транзакцию открываем явно
+                await conn.begin()
+                async with conn.cursor(aiomysql.DictCursor) as cursor:
+                    try:
+                        # Проверяем, есть ли зависимые записи
+                        await cursor.execute(SQL_COUNT_CATALOG_LINKS, (item_id,))
+                        result = await cursor.fetchone()
                     
-                    if result and result['count'] > 0:
-                        # Если есть зависимые записи, удаляем их сначала
-                        delete_links_query = "DELETE FROM collection_item WHERE id_catalog = %s"
-                        await cursor.execute(delete_links_query, (item_id,))
-                        logger.info(f"Удалено {result['count']} зависимых записей из collection_item")
+                        if result and result['count'] > 0:
+                            # Если есть зависимые записи, удаляем их сначала
+                            await cursor.execute(SQL_DELETE_CATALOG_LINKS, (item_id,))
+                            logger.info(f"Удалено {result['count']} зависимых записей из collection_item")
                     
-                    # Теперь удаляем сам предмет из каталога
-                    delete_item_query = "DELETE FROM catalog WHERE id = %s"
-                    await cursor.execute(delete_item_query, (item_id,))
+                        # Теперь удаляем сам предмет из каталога
+                        await cursor.execute(SQL_DELETE_CATALOG_ITEM, (item_id,))
                     
-                    await conn.commit()
-                    logger.info(f"Предмет каталога {item_id} успешно удален")
-                    return True
+                        await conn.commit()
+                        logger.info(f"Предмет каталога {item_id} успешно удален")
+                        return True
                     
-                except Exception as e:
-                    await conn.rollback()
-                    logger.error(f"Ошибка в транзакции удаления предмета {item_id}: {e}")
-                    raise
+                    except Exception as e:
+                        await conn.rollback()
+                        logger.error(f"Ошибка в транзакции удаления предмета {item_id}: {e}")
+                        raise
                     
         except Exception as e:
             logger.error(f"Ошибка подключения или удаления предмета каталога {item_id}: {e}")
             raise
-            
-        finally:
-            if conn:
-                conn.close()
+
+    async def _delete_cascade(self, query, row_id):
+        """Удаление одной строкой, зависимые записи удаляет ON DELETE CASCADE"""
+        async with self.pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query, (row_id,))
+        logger.info(f"Каскадное удаление выполнено: {query} ({row_id})")
+        return True
 
     def _on_data_loaded(self, future, data_type):
         try:
             result = future.result()
-            self.data_loaded.emit(data_type, result)
         except Exception as e:
             self.error_occurred.emit(f"Ошибка загрузки {data_type}: {e}")
+            return
+        self._emit_loaded(data_type, result)
+
+    def _emit_loaded(self, data_type, result):
+        if data_type in self._cache_ttl and result is not None:
+            self._cache[data_type] = (time.monotonic(), result)
+        self.data_loaded.emit(data_type, result)
 
-    def _on_modify_complete(self, future, operation_type):
+    def _on_modify_complete(self, future, data_type):
         try:
             result = future.result()
-            self.data_loaded.emit(operation_type, result)
+            # Изменения могут затрагивать связанные справочники
+            self.invalidate_cache()
+            self._exact_statistics_once = True
+            self.data_loaded.emit(data_type, result)
         except Exception as e:
-            self.error_occurred.emit(f"Ошибка операции {operation_type}: {e}")
+            self.error_occurred.emit(f"Ошибка операции {data_type}: {e}")
 
     def stop(self):
-        """Остановка event loop"""
+        """
+        Остановка event loop без блокировки вызывающего (GUI) потока.
+
+        Пул закрывается и loop останавливается в его собственном потоке;
+        поток-демон завершится сам. Для детерминированного закрытия
+        используйте корутину aclose().
+        """
         if self.loop and self.loop.is_running():
-            try:
-                close_future = asyncio.run_coroutine_threadsafe(self._close(), self.loop)
-                close_future.result(timeout=5)
-            except Exception as e:
-                logger.warning(f"Ошибка при закрытии соединений: {e}")
-            finally:
-                self.loop.call_soon_threadsafe(self.loop.stop)
-                logger.info("Event loop остановлен")
+            self.loop.call_soon_threadsafe(self._close_pool)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            logger.info("Event loop остановлен")
+
+    def _close_pool(self):
+        if self.pool:
+            self.pool.close()
 
-    async def _close(self):
-        """Закрытие подключения"""
+    async def aclose(self):
+        """Закрытие подключения с ожиданием закрытия всех соединений"""
         if self.pool:
             self.pool.close()
             await self.pool.wait_closed()
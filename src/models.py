@@ -2,204 +2,163 @@
 Диалоговые окна и модели данных
 """
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QFormLayout, QLineEdit, 
-    QComboBox, QTextEdit, QPushButton, QHBoxLayout,
-    QDateEdit, QSpinBox, QMessageBox
+    QApplication, QDialog, QVBoxLayout, QFormLayout, QLineEdit, 
+    QComboBox, QPlainTextEdit, QPushButton, QHBoxLayout,
+    QDateEdit, QSpinBox
 )
-from PySide6.QtCore import QDate
-from datetime import datetime
+from PySide6.QtCore import QDate, QSize, Qt
+from PySide6.QtGui import QColor, QPainter, QStandardItem, QStandardItemModel
 
 
-class CollectorDialog(QDialog):
-    def __init__(self, parent=None, collector=None, countries=None):
-        super().__init__(parent)
-        self.collector = collector
-        self.countries = countries or []
-        
-        self.setWindowTitle("Редактировать коллекционера" if collector else "Добавить коллекционера")
-        self.setModal(True)
-        self.setFixedSize(500, 400)
-        
-        layout = QVBoxLayout(self)
-        
-        form_layout = QFormLayout()
-        
-        self.surname_edit = QLineEdit()
-        self.name_edit = QLineEdit()
-        self.patronymic_edit = QLineEdit()
-        self.email_edit = QLineEdit()
-        self.country_combo = QComboBox()
-        self.description_edit = QTextEdit()
-        
-        self.country_combo.addItem("Не выбрано", None)
-        for country in self.countries:
-            self.country_combo.addItem(country['country'], country['id'])
-        
-        if collector:
-            self.surname_edit.setText(collector.get('surname', ''))
-            self.name_edit.setText(collector.get('name', ''))
-            self.patronymic_edit.setText(collector.get('patronymic', ''))
-            self.email_edit.setText(collector.get('email', ''))
-            self.description_edit.setPlainText(collector.get('description', ''))
-            
-            country_id = collector.get('id_country')
-            if country_id:
-                for i in range(self.country_combo.count()):
-                    if self.country_combo.itemData(i) == country_id:
-                        self.country_combo.setCurrentIndex(i)
-                        break
-        
-        form_layout.addRow("Фамилия:", self.surname_edit)
-        form_layout.addRow("Имя:", self.name_edit)
-        form_layout.addRow("Отчество:", self.patronymic_edit)
-        form_layout.addRow("Email:", self.email_edit)
-        form_layout.addRow("Страна:", self.country_combo)
-        form_layout.addRow("Описание:", self.description_edit)
-        
-        layout.addLayout(form_layout)
-        
-        button_layout = QHBoxLayout()
-        self.save_btn = QPushButton("Сохранить")
-        self.cancel_btn = QPushButton("Отмена")
-        
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #219a52;
-            }
-        """)
-        
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
-        
-        self.save_btn.clicked.connect(self.accept)
-        self.cancel_btn.clicked.connect(self.reject)
-        
-        button_layout.addWidget(self.save_btn)
-        button_layout.addWidget(self.cancel_btn)
-        layout.addLayout(button_layout)
-    
-    def get_data(self):
-        return {
-            'surname': self.surname_edit.text(),
-            'name': self.name_edit.text(),
-            'patronymic': self.patronymic_edit.text(),
-            'email': self.email_edit.text(),
-            'id_country': self.country_combo.currentData(),
-            'description': self.description_edit.toPlainText()
-        }
+class _FlatButton(QPushButton):
+    """Плоская кнопка со скруглёнными углами, отрисованная без QSS"""
+    COLOR = QColor("#95a5a6")
+    HOVER_COLOR = QColor("#7f8c8d")
+    TEXT_COLOR = QColor("white")
+    RADIUS = 5
 
+    def __init__(self, text, parent=None):
+        super().__init__(text, parent)
+        self.setAttribute(Qt.WA_Hover)
+        font = self.font()
+        font.setBold(True)
+        self.setFont(font)
 
-class CollectionDialog(QDialog):
-    def __init__(self, parent=None, collection=None, collection_types=None):
+    def sizeHint(self):
+        metrics = self.fontMetrics()
+        return QSize(metrics.horizontalAdvance(self.text()) + 30, metrics.height() + 16)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        if not self.isEnabled():
+            painter.setOpacity(0.5)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.HOVER_COLOR if self.underMouse() else self.COLOR)
+        painter.drawRoundedRect(self.rect(), self.RADIUS, self.RADIUS)
+        painter.setPen(self.TEXT_COLOR)
+        painter.drawText(self.rect(), Qt.AlignCenter, self.text())
+
+
+class SaveButton(_FlatButton):
+    COLOR = QColor("#27ae60")
+    HOVER_COLOR = QColor("#219a52")
+
+
+class CancelButton(_FlatButton):
+    pass
+
+
+# Индексы уровней редкости в rare_combo
+_RARE_INDEX = {"Обычный": 0, "Редкий": 1, "Очень редкий": 2, "Уникальный": 3}
+
+
+# Справочники, загруженные из БД; диалоги берут их, если списки не переданы явно
+_countries_cache = ()
+_collection_types_cache = ()
+
+
+def set_countries(countries):
+    """Обновление справочника стран для диалогов"""
+    global _countries_cache
+    countries = tuple(countries or ())
+    # Неизменившийся справочник сохраняет прежний объект и общую модель комбобокса
+    if countries != _countries_cache:
+        _countries_cache = countries
+        # Модель и индекс {id: строка} строятся сразу при загрузке,
+        # а не при открытии первого диалога
+        _SharedModels.get(_countries_cache, 'country')
+
+
+def set_collection_types(collection_types):
+    """Обновление справочника типов коллекций для диалогов"""
+    global _collection_types_cache
+    collection_types = tuple(collection_types or ())
+    if collection_types != _collection_types_cache:
+        _collection_types_cache = collection_types
+        _SharedModels.get(_collection_types_cache, 'collection_type')
+
+
+def _reference_sources():
+    """Текущие справочники по имени источника поля-комбобокса"""
+    return {'countries': _countries_cache, 'collection_types': _collection_types_cache}
+
+
+class _SharedModels:
+    """Модели справочников, общие для комбобоксов всех диалогов"""
+    # text_key -> (список-источник, модель, {id: строка})
+    _cache = {}
+
+    @classmethod
+    def get(cls, items, text_key, id_key='id'):
+        cached = cls._cache.get(text_key)
+        if cached is not None and cached[0] is items:
+            return cached[1], cached[2]
+        # Родитель — приложение: модель переживает закрытие диалогов
+        model = QStandardItemModel(QApplication.instance())
+        placeholder = QStandardItem("Не выбрано")
+        rows = [placeholder]
+        for entry in items:
+            row = QStandardItem(entry[text_key])
+            row.setData(entry[id_key], Qt.UserRole)
+            rows.append(row)
+        model.invisibleRootItem().appendRows(rows)
+        # Строка 0 занята пунктом "Не выбрано"
+        index = {e[id_key]: i + 1 for i, e in enumerate(items)}
+        if cached is not None:
+            cached[1].deleteLater()
+        cls._cache[text_key] = (items, model, index)
+        return model, index
+
+
+class _Field:
+    """Описание поля формы: атрибут виджета, ключ данных, подпись и вид"""
+    __slots__ = ('attr', 'key', 'label', 'kind', 'source', 'text_key')
+
+    def __init__(self, attr, key, label, kind, source=None, text_key=None):
+        self.attr = attr
+        self.key = key
+        self.label = label
+        self.kind = kind
+        self.source = source
+        self.text_key = text_key
+
+
+class _FormDialog(QDialog):
+    """Базовый диалог, форма которого строится по списку FIELDS"""
+    FIELDS = ()
+    _PLAN = ()
+    _KEYS = ()
+    _LABELS = ()
+    TITLES = ("", "")
+    # Атрибуты обязательных полей (QLineEdit или комбобокс-справочник)
+    REQUIRED = ()
+
+    def __init__(self, parent=None, record=None, **sources):
         super().__init__(parent)
-        self.collection = collection
-        self.collection_types = collection_types or []
+        self.record = record
+        self._sources = sources
         
-        self.setWindowTitle("Редактировать коллекцию" if collection else "Добавить коллекцию")
-        self.setModal(True)
-        self.setFixedSize(500, 450)
+        self.setWindowTitle(self.TITLES[bool(record)])
         
         layout = QVBoxLayout(self)
         
         form_layout = QFormLayout()
         
-        self.name_edit = QLineEdit()
-        self.author_edit = QLineEdit()
-        self.type_combo = QComboBox()
-        self.date_edit = QDateEdit()
-        self.items_spin = QSpinBox()
-        self.description_edit = QTextEdit()
-        
-        self.date_edit.setCalendarPopup(True)
-        self.date_edit.setDate(QDate.currentDate())
-        self.items_spin.setRange(0, 1000000)
-        self.items_spin.setValue(0)
-        
-        self.type_combo.addItem("Не выбрано", None)
-        for ct in self.collection_types:
-            self.type_combo.addItem(ct['collection_type'], ct['id'])
-        
-        if collection:
-            self.name_edit.setText(collection.get('name', ''))
-            self.author_edit.setText(collection.get('author', ''))
-            self.items_spin.setValue(collection.get('number_of_items', 0))
-            self.description_edit.setPlainText(collection.get('description', ''))
-            
-            type_id = collection.get('id_collection_type')
-            if type_id:
-                for i in range(self.type_combo.count()):
-                    if self.type_combo.itemData(i) == type_id:
-                        self.type_combo.setCurrentIndex(i)
-                        break
-            
-            date_str = collection.get('date_of_creation')
-            if date_str:
-                try:
-                    date = QDate.fromString(date_str, 'yyyy-MM-dd')
-                    if date.isValid():
-                        self.date_edit.setDate(date)
-                except:
-                    pass
-        
-        form_layout.addRow("Название:", self.name_edit)
-        form_layout.addRow("Автор:", self.author_edit)
-        form_layout.addRow("Тип коллекции:", self.type_combo)
-        form_layout.addRow("Дата создания:", self.date_edit)
-        form_layout.addRow("Количество предметов:", self.items_spin)
-        form_layout.addRow("Описание:", self.description_edit)
+        # Для комбобоксов-справочников: id записи -> строка комбобокса
+        self._combo_rows = {}
+        for label, (field, build, restore, _) in zip(self._LABELS, self._PLAN):
+            widget = build(self, field, sources)
+            setattr(self, field.attr, widget)
+            if record:
+                restore(self, field, widget, record.get(field.key))
+            form_layout.addRow(label, widget)
         
         layout.addLayout(form_layout)
         
         button_layout = QHBoxLayout()
-        self.save_btn = QPushButton("Сохранить")
-        self.cancel_btn = QPushButton("Отмена")
-        
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #219a52;
-            }
-        """)
-        
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
+        self.save_btn = SaveButton("Сохранить")
+        self.cancel_btn = CancelButton("Отмена")
         
         self.save_btn.clicked.connect(self.accept)
         self.cancel_btn.clicked.connect(self.reject)
@@ -207,147 +166,219 @@ class CollectionDialog(QDialog):
         button_layout.addWidget(self.save_btn)
         button_layout.addWidget(self.cancel_btn)
         layout.addLayout(button_layout)
+        # Модальность даёт exec(); высоту определяет раскладка
+        self.setMinimumWidth(500)
+        
+        # Сохранение доступно, только когда заполнены обязательные поля
+        for attr in self.REQUIRED:
+            widget = getattr(self, attr)
+            if isinstance(widget, QLineEdit):
+                widget.textChanged.connect(self._validate)
+            else:
+                widget.currentIndexChanged.connect(self._validate)
+        self._validate()
     
-    def accept(self):
-        if not self.name_edit.text().strip():
-            QMessageBox.warning(self, "Ошибка", "Название коллекции не может быть пустым")
-            return
-            
-        if self.type_combo.currentData() is None:
-            QMessageBox.warning(self, "Ошибка", "Необходимо выбрать тип коллекции")
-            return
-            
-        super().accept()
+    def reset(self, record=None, **sources):
+        """
+        Подготовка уже созданного диалога к новому открытию: форма
+        заполняется из record (или очищается), комбобоксы получают
+        актуальные справочники.
+        """
+        self.record = record
+        self._sources = sources or _reference_sources()
+        self.setWindowTitle(self.TITLES[bool(record)])
+        for field, _, restore, _ in self._PLAN:
+            widget = getattr(self, field.attr)
+            if field.kind == 'combo':
+                model, self._combo_rows[field.attr] = _SharedModels.get(
+                    self._sources.get(field.source) or (), field.text_key)
+                if widget.model() is not model:
+                    widget.setModel(model)
+            restore(self, field, widget, record.get(field.key) if record else None)
+        self._validate()
+
+    @staticmethod
+    def _is_filled(widget):
+        if isinstance(widget, QLineEdit):
+            return bool(widget.text().strip())
+        return widget.currentData() is not None
     
-    def get_data(self):
-        return {
-            'name': self.name_edit.text(),
-            'author': self.author_edit.text(),
-            'id_collection_type': self.type_combo.currentData(),
-            'date_of_creation': self.date_edit.date().toString('yyyy-MM-dd'),
-            'number_of_items': self.items_spin.value(),
-            'description': self.description_edit.toPlainText()
-        }
+    def _validate(self, *args):
+        self.save_btn.setEnabled(all(self._is_filled(getattr(self, attr)) for attr in self.REQUIRED))
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Разбираем FIELDS один раз на класс: поле -> (создание, восстановление, чтение)
+        cls._PLAN = tuple(
+            (field,
+             getattr(cls, f'_build_{field.kind}'),
+             getattr(cls, f'_restore_{field.kind}'),
+             getattr(cls, f'_read_{field.kind}'))
+            for field in cls.FIELDS
+        )
+        # Ключи get_data() и подписи формы в порядке полей
+        cls._KEYS = tuple(field.key for field in cls.FIELDS)
+        cls._LABELS = tuple(field.label for field in cls.FIELDS)
 
+    def _build_line(self, field, sources):
+        return QLineEdit()
 
-class CatalogItemDialog(QDialog):
-    def __init__(self, parent=None, item=None, countries=None):
-        super().__init__(parent)
-        self.item = item
-        self.countries = countries or []
-        
-        self.setWindowTitle("Редактировать предмет каталога" if item else "Добавить предмет каталога")
-        self.setModal(True)
-        self.setFixedSize(500, 400)
-        
-        layout = QVBoxLayout(self)
-        
-        form_layout = QFormLayout()
-        
-        self.name_edit = QLineEdit()
-        self.rare_combo = QComboBox()
-        self.country_combo = QComboBox()
-        self.date_edit = QDateEdit()
-        self.description_edit = QTextEdit()
-        
-        self.date_edit.setCalendarPopup(True)
-        self.date_edit.setDate(QDate.currentDate())
-        
-        self.rare_combo.addItems(["Обычный", "Редкий", "Очень редкий", "Уникальный"])
-        
-        self.country_combo.addItem("Не выбрано", None)
-        for country in self.countries:
-            self.country_combo.addItem(country['country'], country['id'])
-        
-        if item:
-            self.name_edit.setText(item.get('name', ''))
-            self.description_edit.setPlainText(item.get('description', ''))
-            
-            rare = item.get('rare', '')
-            if rare:
-                index = self.rare_combo.findText(rare)
-                if index >= 0:
-                    self.rare_combo.setCurrentIndex(index)
-            
-            country_id = item.get('id_country')
-            if country_id:
-                for i in range(self.country_combo.count()):
-                    if self.country_combo.itemData(i) == country_id:
-                        self.country_combo.setCurrentIndex(i)
-                        break
-            
-            date_str = item.get('release_date')
-            if date_str:
-                try:
-                    date = QDate.fromString(date_str, 'yyyy-MM-dd')
-                    if date.isValid():
-                        self.date_edit.setDate(date)
-                except:
-                    pass
-        
-        form_layout.addRow("Название:", self.name_edit)
-        form_layout.addRow("Редкость:", self.rare_combo)
-        form_layout.addRow("Страна:", self.country_combo)
-        form_layout.addRow("Дата выпуска:", self.date_edit)
-        form_layout.addRow("Описание:", self.description_edit)
-        
-        layout.addLayout(form_layout)
-        
-        button_layout = QHBoxLayout()
-        self.save_btn = QPushButton("Сохранить")
-        self.cancel_btn = QPushButton("Отмена")
-        
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #219a52;
-            }
-        """)
-        
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
-        
-        self.save_btn.clicked.connect(self.accept)
-        self.cancel_btn.clicked.connect(self.reject)
-        
-        button_layout.addWidget(self.save_btn)
-        button_layout.addWidget(self.cancel_btn)
-        layout.addLayout(button_layout)
-    
-    def accept(self):
-        if not self.name_edit.text().strip():
-            QMessageBox.warning(self, "Ошибка", "Название предмета не может быть пустым")
-            return
-            
-        if self.country_combo.currentData() is None:
-            QMessageBox.warning(self, "Ошибка", "Необходимо выбрать страну")
-            return
-            
-        super().accept()
+    def _restore_line(self, field, widget, value):
+        # Автор коллекции хранится как id коллекционера (число)
+        widget.setText('' if value is None else str(value))
+
+    @staticmethod
+    def _read_line(widget):
+        return widget.text()
+
+    def _build_text(self, field, sources):
+        return QPlainTextEdit()
+
+    def _restore_text(self, field, widget, value):
+        widget.setPlainText(value or '')
+
+    @staticmethod
+    def _read_text(widget):
+        return widget.toPlainText()
+
+    def _build_spin(self, field, sources):
+        widget = QSpinBox()
+        widget.setRange(0, 1000000)
+        return widget
+
+    def _restore_spin(self, field, widget, value):
+        widget.setValue(value or 0)
+
+    @staticmethod
+    def _read_spin(widget):
+        return widget.value()
+
+    def _build_date(self, field, sources):
+        widget = QDateEdit()
+        # Сам QCalendarWidget Qt создаёт лениво, при первом открытии попапа
+        widget.setCalendarPopup(True)
+        if not self.record:
+            widget.setDate(QDate.currentDate())
+        return widget
+
+    def _restore_date(self, field, widget, value):
+        date = QDate()
+        if value:
+            # Дата хранится в ISO-формате (или приходит как datetime.date)
+            value = str(value)
+            if (len(value) == 10 and value[:4].isdigit()
+                    and value[5:7].isdigit() and value[8:10].isdigit()):
+                date = QDate(int(value[:4]), int(value[5:7]), int(value[8:10]))
+        widget.setDate(date if date.isValid() else QDate.currentDate())
+
+    @staticmethod
+    def _read_date(widget):
+        return widget.date().toString('yyyy-MM-dd')
+
+    def _build_rare(self, field, sources):
+        widget = QComboBox()
+        widget.addItems(list(_RARE_INDEX))
+        return widget
+
+    def _restore_rare(self, field, widget, value):
+        widget.setCurrentIndex(_RARE_INDEX.get(value, 0))
+
+    @staticmethod
+    def _read_rare(widget):
+        return widget.currentText()
+
+    def _build_combo(self, field, sources):
+        widget = QComboBox()
+        # Общая модель данных; текущий выбор у каждого комбобокса свой
+        model, self._combo_rows[field.attr] = _SharedModels.get(
+            sources.get(field.source) or (), field.text_key)
+        widget.setModel(model)
+        return widget
+
+    def _restore_combo(self, field, widget, value):
+        # Неизвестное значение - пункт "Не выбрано"
+        widget.setCurrentIndex(self._combo_rows[field.attr].get(value, 0))
+
+    @staticmethod
+    def _read_combo(widget):
+        return widget.currentData()
     
     def get_data(self):
-        return {
-            'name': self.name_edit.text(),
-            'rare': self.rare_combo.currentText(),
-            'id_country': self.country_combo.currentData(),
-            'release_date': self.date_edit.date().toString('yyyy-MM-dd'),
-            'description': self.description_edit.toPlainText()
-        }
+        return dict(zip(self._KEYS, [read(getattr(self, field.attr)) for field, _, _, read in self._PLAN]))
+
+
+class CollectorDialog(_FormDialog):
+    FIELDS = (
+        _Field('surname_edit', 'surname', "Фамилия:", 'line'),
+        _Field('name_edit', 'name', "Имя:", 'line'),
+        _Field('patronymic_edit', 'patronymic', "Отчество:", 'line'),
+        _Field('email_edit', 'email', "Email:", 'line'),
+        _Field('country_combo', 'id_country', "Страна:", 'combo', 'countries', 'country'),
+        _Field('description_edit', 'description', "Описание:", 'text'),
+    )
+    TITLES = ("Добавить коллекционера", "Редактировать коллекционера")
+
+    def __init__(self, parent=None, collector=None, countries=None):
+        if countries is None:
+            countries = _countries_cache
+        super().__init__(parent, collector, countries=countries)
+
+    @property
+    def collector(self):
+        return self.record
+
+    @property
+    def countries(self):
+        return self._sources['countries']
+
+
+class CollectionDialog(_FormDialog):
+    FIELDS = (
+        _Field('name_edit', 'name', "Название:", 'line'),
+        _Field('author_edit', 'author', "Автор:", 'line'),
+        _Field('type_combo', 'id_collection_type', "Тип коллекции:", 'combo',
+               'collection_types', 'collection_type'),
+        _Field('date_edit', 'date_of_creation', "Дата создания:", 'date'),
+        _Field('items_spin', 'number_of_items', "Количество предметов:", 'spin'),
+        _Field('description_edit', 'description', "Описание:", 'text'),
+    )
+    TITLES = ("Добавить коллекцию", "Редактировать коллекцию")
+    REQUIRED = ('name_edit', 'type_combo')
+
+    def __init__(self, parent=None, collection=None, collection_types=None):
+        if collection_types is None:
+            collection_types = _collection_types_cache
+        super().__init__(parent, collection, collection_types=collection_types)
+
+    @property
+    def collection(self):
+        return self.record
+
+    @property
+    def collection_types(self):
+        return self._sources['collection_types']
+
+
+class CatalogItemDialog(_FormDialog):
+    FIELDS = (
+        _Field('name_edit', 'name', "Название:", 'line'),
+        _Field('rare_combo', 'rare', "Редкость:", 'rare'),
+        _Field('country_combo', 'id_country', "Страна:", 'combo', 'countries', 'country'),
+        _Field('date_edit', 'release_date', "Дата выпуска:", 'date'),
+        _Field('description_edit', 'description', "Описание:", 'text'),
+    )
+    TITLES = ("Добавить предмет каталога", "Редактировать предмет каталога")
+    REQUIRED = ('name_edit', 'country_combo')
+
+    def __init__(self, parent=None, item=None, countries=None):
+        if countries is None:
+            countries = _countries_cache
+        super().__init__(parent, item, countries=countries)
+
+    @property
+    def item(self):
+        return self.record
+
+    @property
+    def countries(self):
+        return self._sources['countries']
@@ -2,21 +2,298 @@
 Модуль для генерации отчетов (PDF и Excel)
 """
 import asyncio
+import concurrent.futures
+import functools
+import itertools
+import multiprocessing
+import threading
 import aiomysql
-import xlsxwriter
 import pdfkit
 import os
 import logging
-from datetime import datetime
+import pickle
+import types
+import zipfile
+from collections import namedtuple
+from datetime import date, datetime
 from jinja2 import Environment, FileSystemLoader
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QObject, Signal
 from PySide6.QtWidgets import QProgressDialog  # если используется
 from PySide6.QtCore import Qt
 import config
 
+try:
+    import weasyprint
+except ImportError:
+    weasyprint = None
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+except ImportError:
+    pdfmetrics = None
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _format_date(value):
+    """Форматирование даты 'YYYY-MM-DD' для отображения как 'DD.MM.YYYY'"""
+    if not isinstance(value, str):
+        return str(value)
+    parts = value.split('-')
+    if len(value) == 10 and len(parts) == 3 and all(p.isdigit() for p in parts):
+        # Быстрый путь без strptime: только проверка, что такая дата существует
+        y, m, d = parts
+        try:
+            date(int(y), int(m), int(d))
+        except ValueError:
+            return value
+        return f"{d}.{m}.{y}"
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').strftime('%d.%m.%Y')
+    except ValueError:
+        return value
+
+
+# Окружение Jinja2 создается один раз на процесс; шаблоны компилируются при импорте
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), '..', 'templates')
+os.makedirs(TEMPLATE_DIR, exist_ok=True)
+_jinja_env = Environment(loader=FileSystemLoader(TEMPLATE_DIR), auto_reload=False, cache_size=50)
+_jinja_env.filters['format_date'] = _format_date
+# Поля страницы для WeasyPrint (аналог опций wkhtmltopdf), создаются при первом отчете
+_weasyprint_page_css = None
+_TEMPLATES = {
+    name: _jinja_env.get_template(name)
+    for name in ('statistical_report.html', 'detailed_report.html')
+}
+
+PDFKIT_OPTIONS = {
+    'page-size': 'A4',
+    'margin-top': '0.75in',
+    'margin-right': '0.75in',
+    'margin-bottom': '0.75in',
+    'margin-left': '0.75in',
+    'encoding': "UTF-8",
+    'no-outline': None,
+    'enable-local-file-access': None,
+    'quiet': ''
+}
+
+# Один процесс-рендерер на приложение (PDF и Excel): пока он верстает отчет, следующий уже собирает данные
+_report_executor = None
+_report_executor_lock = threading.Lock()
+
+
+def _get_report_executor():
+    global _report_executor
+    with _report_executor_lock:
+        if _report_executor is None:
+            # spawn: fork многопоточного Qt-процесса небезопасен
+            _report_executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context('spawn')
+            )
+        return _report_executor
+
+
+def _discard_report_executor(executor):
+    """Сброс упавшего процесса-рендерера: следующий отчет запустит новый"""
+    global _report_executor
+    with _report_executor_lock:
+        if _report_executor is executor:
+            _report_executor = None
+    executor.shutdown(wait=False)
+
+
+# Один event loop отчетов на приложение: пул соединений живет между отчетами
+_reporter_loop = None
+_reporter_loop_lock = threading.Lock()
+
+
+def _get_reporter_loop():
+    global _reporter_loop
+    with _reporter_loop_lock:
+        if _reporter_loop is None:
+            _reporter_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_reporter_loop.run_forever, name="reports-loop", daemon=True
+            ).start()
+        return _reporter_loop
+
+
+def stop_reporter_loop():
+    """Закрытие пулов отчетов и остановка их event loop без блокировки вызывающего потока"""
+    global _reporter_loop
+    with _reporter_loop_lock:
+        loop, _reporter_loop = _reporter_loop, None
+    if loop is None:
+        return
+    future = asyncio.run_coroutine_threadsafe(BaseReporter.close_pools(), loop)
+    future.add_done_callback(lambda _: loop.call_soon_threadsafe(loop.stop))
+
+
+def _write_pdf(html_content, output_path, engine='auto', wkhtmltopdf_path=None):
+    """Генерация PDF из HTML контента (выполняется и в процессе-рендерере)"""
+    global _weasyprint_page_css
+    try:
+        if weasyprint is not None and engine in ('auto', 'weasyprint'):
+            if _weasyprint_page_css is None:
+                _weasyprint_page_css = weasyprint.CSS(string='@page { size: A4; margin: 0.75in; }')
+            weasyprint.HTML(string=html_content, base_url=TEMPLATE_DIR).write_pdf(
+                output_path, stylesheets=[_weasyprint_page_css]
+            )
+        elif wkhtmltopdf_path:
+            pdfkit.from_string(html_content, output_path, options=PDFKIT_OPTIONS,
+                               configuration=pdfkit.configuration(wkhtmltopdf=wkhtmltopdf_path))
+        else:
+            pdfkit.from_string(html_content, output_path, options=PDFKIT_OPTIONS)
+            
+        logger.info(f"PDF успешно сгенерирован: {output_path}")
+        return True
+        
+    except Exception as e:
+        logger.error(f"Ошибка генерации PDF: {e}")
+        raise
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ymd(date_str):
+    """Разбор даты 'YYYY-MM-DD' (повторяющиеся даты разбираются один раз)"""
+    return datetime.strptime(date_str, '%Y-%m-%d')
+
+
+def _reportlab_font():
+    """Путь к TTF-шрифту с кириллицей для ReportLab или None, если ReportLab недоступен"""
+    if pdfmetrics is None:
+        return None
+    for path in config.PDF_CONFIG.get('reportlab_fonts', ()):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _write_statistical_pdf(data, output_path, meta, font_path):
+    """Статистический отчет напрямую в PDF средствами ReportLab, без HTML-движка"""
+    try:
+        if 'ReportFont' not in pdfmetrics.getRegisteredFontNames():
+            pdfmetrics.registerFont(TTFont('ReportFont', font_path))
+        
+        dark = colors.HexColor('#34495e')
+        muted = colors.HexColor('#7f8c8d')
+        text = ParagraphStyle('text', fontName='ReportFont', fontSize=10, leading=14,
+                              textColor=colors.HexColor('#333333'))
+        title = ParagraphStyle('title', parent=text, fontSize=20, leading=26, alignment=1,
+                               textColor=colors.HexColor('#2c3e50'))
+        subtitle = ParagraphStyle('subtitle', parent=text, fontSize=16, leading=22, alignment=1,
+                                  textColor=dark)
+        centered = ParagraphStyle('centered', parent=text, alignment=1, textColor=muted)
+        section = ParagraphStyle('section', parent=text, fontSize=14, leading=20, textColor=colors.white,
+                                 backColor=dark, borderPadding=6, spaceBefore=16, spaceAfter=12)
+        table_style = TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), 'ReportFont'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BACKGROUND', (0, 0), (-1, 0), dark),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
+            ('LINEBELOW', (0, 1), (-1, -1), 0.5, colors.HexColor('#dddddd')),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ])
+        
+        def table(header, rows):
+            result = Table([header] + rows, repeatRows=1, hAlign='LEFT')
+            result.setStyle(table_style)
+            return result
+        
+        story = [
+            Paragraph(meta['app_name'], title),
+            Paragraph(meta['report_name'], subtitle),
+            Paragraph(f"Дата генерации: {meta['generation_date']}", centered),
+            Paragraph("Автор: Система отчетности", centered),
+            Paragraph("Общая статистика системы", section),
+        ]
+        
+        stats = data.get('general_stats') or {}
+        if stats:
+            story.append(table(['Показатель', 'Значение'], [
+                ['Всего коллекционеров', stats.get('total_collectors') or 0],
+                ['Всего коллекций', stats.get('total_collections') or 0],
+                ['Предметов в каталоге', stats.get('total_catalog_items') or 0],
+                ['Всего предметов в коллекциях', stats.get('total_items_in_collections') or 0],
+                ['Новых коллекций за 30 дней', stats.get('recent_collections') or 0],
+                ['Активных коллекционеров', stats.get('active_collectors') or 0],
+            ]))
+        
+        metrics = data.get('additional_metrics')
+        if metrics:
+            story += [
+                Paragraph("Ключевые метрики", section),
+                Paragraph(f"Активных коллекционеров: {metrics['active_collectors_percentage']}%", text),
+                Paragraph(f"Среднее кол-во предметов: {metrics['avg_items_per_collection']:.1f}", text),
+                Paragraph(f"Новых коллекций: {metrics['recent_collections_percentage']:.1f}%", text),
+            ]
+        
+        story += [PageBreak(), Paragraph("Распределение коллекций по типам", section)]
+        collection_types = data.get('collection_types') or []
+        if collection_types:
+            total = sum(item['count'] for item in collection_types)
+            story.append(table(['Тип коллекции', 'Количество', 'Доля'], [
+                [item['collection_type'] or 'Не указан', item['count'],
+                 f"{(item['count'] / total * 100) if total > 0 else 0:.1f}%"]
+                for item in collection_types
+            ]))
+        else:
+            story.append(Paragraph("Нет данных о типах коллекций", text))
+        
+        story.append(Paragraph("Топ-5 самых активных коллекционеров", section))
+        top_collectors = data.get('top_collectors') or []
+        if top_collectors:
+            story.append(table(['#', 'Коллекционер', 'Коллекций'], [
+                [index, f"{collector['surname']} {collector['name']}", collector['collections_count']]
+                for index, collector in enumerate(top_collectors, 1)
+            ]))
+        else:
+            story.append(Paragraph("Нет данных о коллекционерах", text))
+        
+        story += [PageBreak(), Paragraph("Динамика активности за последние 6 месяцев", section)]
+        monthly_activity = data.get('monthly_activity') or []
+        if monthly_activity:
+            story.append(table(['Месяц', 'Создано коллекций'], [
+                [month_data['month'], month_data['collections_created']]
+                for month_data in monthly_activity
+            ]))
+        else:
+            story.append(Paragraph("Нет данных о месячной активности", text))
+        
+        story += [
+            Spacer(1, 30),
+            Paragraph(f"Сгенерировано системой отчетности {meta['app_name']} | {meta['generation_date']}", centered),
+        ]
+        
+        margin = 0.75 * inch
+        SimpleDocTemplate(output_path, pagesize=A4, leftMargin=margin, rightMargin=margin,
+                          topMargin=margin, bottomMargin=margin, title=meta['report_name']).build(story)
+        
+        logger.info(f"PDF успешно сгенерирован: {output_path}")
+        return True
+        
+    except Exception as e:
+        logger.error(f"Ошибка генерации PDF: {e}")
+        raise
+
+
+def _set_tall_rows(set_row, start_row, records):
+    """Увеличенная высота строк таблицы для записей с длинным описанием"""
+    for index, record in enumerate(records):
+        if len(record.description or '') > 100:
+            set_row(start_row + index, 60)
+
+
 class BaseReporter(QObject):
     """Базовый класс для генерации PDF отчетов"""
     
@@ -24,14 +301,15 @@ class BaseReporter(QObject):
     report_finished = Signal(str)
     report_error = Signal(str)
     
+    # (event loop, host, user, db) -> задача создания aiomysql.Pool
+    _pools = {}
+    
     def __init__(self, db_config):
         super().__init__()
         self.db_config = db_config
+        self.wkhtmltopdf_path = None
         
-        # Настройка шаблонов
-        template_dir = os.path.join(os.path.dirname(__file__), '..', 'templates')
-        os.makedirs(template_dir, exist_ok=True)
-        self.env = Environment(loader=FileSystemLoader(template_dir))
+        self.env = _jinja_env
         
         # Настройка PDFKit
         try:
@@ -42,86 +320,108 @@ class BaseReporter(QObject):
             else:
                 wkhtmltopdf_path = '/usr/bin/wkhtmltopdf'
             
-            if os.path.exists(wkhtmltopdf_path):
-                self.pdfkit_config = pdfkit.configuration(wkhtmltopdf=wkhtmltopdf_path)
-            else:
-                self.pdfkit_config = pdfkit.configuration()
+            # Путь (строка) передается в процесс-рендерер, сама конфигурация не сериализуется
+            self.wkhtmltopdf_path = wkhtmltopdf_path if os.path.exists(wkhtmltopdf_path) else None
+            self.pdfkit_config = pdfkit.configuration(wkhtmltopdf=self.wkhtmltopdf_path or '')
                 
             logger.info("PDFKit конфигурация успешно настроена")
         except Exception as e:
             logger.warning(f"Не удалось настроить PDFKit: {e}")
             self.pdfkit_config = None
 
-    async def _execute_query(self, query, params=None):
-        """Выполнение SQL запроса через прямое подключение"""
-        try:
-            conn = await aiomysql.connect(
+    async def _get_pool(self):
+        """Пул соединений отчетов для текущего event loop (создается один раз)"""
+        loop = asyncio.get_running_loop()
+        key = (loop, self.db_config['host'], self.db_config['user'], self.db_config['db'])
+        pool_task = BaseReporter._pools.get(key)
+        if pool_task is None:
+            # Храним задачу, чтобы параллельные запросы ждали один и тот же пул
+            pool_task = loop.create_task(aiomysql.create_pool(
                 host=self.db_config['host'],
                 user=self.db_config['user'],
                 password=self.db_config['password'],
                 db=self.db_config['db'],
-                autocommit=True
-            )
-            
-            async with conn.cursor(aiomysql.DictCursor) as cursor:
-                await cursor.execute(query, params or {})
-                if query.strip().upper().startswith('SELECT'):
-                    result = await cursor.fetchall()
-                else:
-                    result = cursor.lastrowid
-                
-            conn.close()
-            return result
+                autocommit=True,
+                minsize=1,
+                maxsize=10
+            ))
+            BaseReporter._pools[key] = pool_task
+        try:
+            return await pool_task
+        except Exception:
+            BaseReporter._pools.pop(key, None)
+            raise
+
+    @classmethod
+    async def close_pools(cls):
+        """Закрытие пулов, созданных в текущем event loop"""
+        loop = asyncio.get_running_loop()
+        for key in [key for key in cls._pools if key[0] is loop]:
+            pool_task = cls._pools.pop(key)
+            try:
+                pool = await pool_task
+            except Exception:
+                continue
+            pool.close()
+            await pool.wait_closed()
+
+    async def _execute_query(self, query, params=None, *, fetch=True):
+        """
+        Выполнение SQL запроса через пул соединений.
+
+        Строки выборки читаются небуферизованным курсором по мере прихода
+        с сервера, без полной копии результата в драйвере.
+        """
+        cursor_class = aiomysql.SSDictCursor if fetch else aiomysql.DictCursor
+        try:
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                async with conn.cursor(cursor_class) as cursor:
+                    await cursor.execute(query, params or {})
+                    if fetch:
+                        return [row async for row in cursor]
+                    return cursor.lastrowid
             
         except Exception as e:
             logger.error(f"Ошибка выполнения запроса: {e}")
             raise
 
-    def _format_date(self, date_str):
-        """Форматирование даты для отображения"""
+    async def _execute_script(self, query, params=None):
+        """Выполнение нескольких SQL запросов за один обмен; возвращает список наборов строк"""
         try:
-            if isinstance(date_str, str):
-                date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-                return date_obj.strftime('%d.%m.%Y')
-            return str(date_str)
-        except:
-            return str(date_str)
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                async with conn.cursor(aiomysql.DictCursor) as cursor:
+                    await cursor.execute(query, params or {})
+                    results = [await cursor.fetchall()]
+                    while await cursor.nextset():
+                        results.append(await cursor.fetchall())
+                    return results
+            
+        except Exception as e:
+            logger.error(f"Ошибка выполнения пакета запросов: {e}")
+            raise
 
     def _render_template(self, template_name, context):
         """Рендеринг HTML шаблона"""
         try:
-            template = self.env.get_template(template_name)
+            template = _TEMPLATES.get(template_name) or self.env.get_template(template_name)
             return template.render(**context)
         except Exception as e:
             logger.error(f"Ошибка рендеринга шаблона {template_name}: {e}")
             raise
 
     def _generate_pdf(self, html_content, output_path):
-        """Генерация PDF из HTML контента"""
-        try:
-            options = {
-                'page-size': 'A4',
-                'margin-top': '0.75in',
-                'margin-right': '0.75in',
-                'margin-bottom': '0.75in',
-                'margin-left': '0.75in',
-                'encoding': "UTF-8",
-                'no-outline': None,
-                'enable-local-file-access': None,
-                'quiet': ''
-            }
-            
-            if self.pdfkit_config:
-                pdfkit.from_string(html_content, output_path, options=options, configuration=self.pdfkit_config)
-            else:
-                pdfkit.from_string(html_content, output_path, options=options)
-                
-            logger.info(f"PDF успешно сгенерирован: {output_path}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Ошибка генерации PDF: {e}")
-            raise
+        """Генерация PDF из HTML контента в текущем процессе"""
+        return _write_pdf(html_content, output_path,
+                          config.PDF_CONFIG.get('engine', 'auto'), self.wkhtmltopdf_path)
+
+    async def _render_pdf(self, html_content, output_path):
+        """Генерация PDF в процессе-рендерере, не блокируя event loop"""
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_report_executor(), _write_pdf, html_content, output_path,
+            config.PDF_CONFIG.get('engine', 'auto'), self.wkhtmltopdf_path
+        )
 
     async def generate_report(self, output_path):
         """Абстрактный метод генерации отчета"""
@@ -142,61 +442,59 @@ class StatisticalReport(BaseReporter):
         data = {}
         
         try:
-            self.progress_updated.emit("Сбор общей статистики...")
+            self.progress_updated.emit("Сбор статистики, типов коллекций и активности...")
             
-            # Общая статистика
-            general_stats = await self._execute_query("""
+            # Четыре запроса одним пакетом: один обмен с сервером вместо четырех
+            general_stats, collection_types, top_collectors, monthly_activity = await self._execute_script("""
+                -- Общая статистика
                 SELECT 
                     (SELECT COUNT(*) FROM collector) as total_collectors,
                     (SELECT COUNT(*) FROM collection) as total_collections,
                     (SELECT COUNT(*) FROM catalog) as total_catalog_items,
                     (SELECT COUNT(*) FROM collection_item) as total_items_in_collections,
                     (SELECT COUNT(*) FROM collection WHERE date_of_creation >= DATE_SUB(NOW(), INTERVAL 30 DAY)) as recent_collections,
-                    (SELECT COUNT(*) FROM collector WHERE id IN (
-                        SELECT DISTINCT c.id FROM collector c 
-                        JOIN collection col ON c.id = col.author
-                    )) as active_collectors
-            """)
-            data['general_stats'] = general_stats[0] if general_stats else {}
-            
-            self.progress_updated.emit("Анализ типов коллекций...")
-            
-            # Распределение по типам коллекций
-            collection_types = await self._execute_query("""
+                    (SELECT COUNT(DISTINCT author) FROM collection) as active_collectors;
+                
+                -- Распределение по типам коллекций
                 SELECT ct.collection_type, COUNT(c.id) as count
                 FROM collection c
                 LEFT JOIN collection_type ct ON c.id_collection_type = ct.id
                 GROUP BY ct.collection_type
-                ORDER BY count DESC
-            """)
-            data['collection_types'] = collection_types
-            
-            self.progress_updated.emit("Поиск самых активных коллекционеров...")
-            
-            # Топ коллекционеров
-            top_collectors = await self._execute_query("""
-                SELECT c.surname, c.name, COUNT(col.id) as collections_count
-                FROM collector c
-                LEFT JOIN collection col ON c.id = col.author
-                GROUP BY c.id, c.surname, c.name
-                ORDER BY collections_count DESC
-                LIMIT 5
-            """)
-            data['top_collectors'] = top_collectors
-            
-            self.progress_updated.emit("Анализ месячной активности...")
-            
-            # Активность по месяцам
-            monthly_activity = await self._execute_query("""
+                ORDER BY count DESC;
+                
+                -- Топ коллекционеров: сначала пять авторов по индексу collection(author),
+                -- затем имена по первичному ключу
+                SELECT c.surname, c.name, x.cnt as collections_count
+                FROM (
+                    SELECT author, COUNT(*) as cnt
+                    FROM collection
+                    WHERE author IS NOT NULL
+                    GROUP BY author
+                    ORDER BY cnt DESC
+                    LIMIT 5
+                ) x
+                JOIN collector c ON c.id = x.author
+                ORDER BY x.cnt DESC;
+                
+                -- Активность по месяцам
                 SELECT 
-                    DATE_FORMAT(date_of_creation, '%%Y-%%m') as month,
+                    YEAR(date_of_creation) as y,
+                    MONTH(date_of_creation) as m,
                     COUNT(*) as collections_created
                 FROM collection
                 WHERE date_of_creation >= DATE_SUB(NOW(), INTERVAL 6 MONTH)
-                GROUP BY DATE_FORMAT(date_of_creation, '%%Y-%%m')
-                ORDER BY month
+                GROUP BY y, m
+                ORDER BY y, m
             """)
-            data['monthly_activity'] = monthly_activity
+            data['general_stats'] = general_stats[0] if general_stats else {}
+            data['collection_types'] = collection_types
+            data['top_collectors'] = top_collectors
+            # Строку 'ГГГГ-ММ' собираем здесь, а не через DATE_FORMAT в запросе
+            data['monthly_activity'] = [
+                {'month': f"{row['y']:04d}-{row['m']:02d}",
+                 'collections_created': row['collections_created']}
+                for row in monthly_activity
+            ]
             
             # Расчет дополнительных метрик
             if data['general_stats']:
@@ -236,17 +534,26 @@ class StatisticalReport(BaseReporter):
                 'report_name': self.report_name,
                 'generation_date': datetime.now().strftime('%d.%m.%Y %H:%M'),
                 'app_name': config.APP_CONFIG['name'],
-                'data': data,
-                'format_date': self._format_date
+                'data': data
             }
             
             self.progress_updated.emit("Генерация PDF отчета...")
             
+            # Таблицы отчета фиксированы — с ReportLab HTML-движок не нужен
+            font_path = _reportlab_font()
+            if font_path and config.PDF_CONFIG.get('engine', 'auto') in ('auto', 'reportlab'):
+                meta = {key: context[key] for key in ('report_name', 'generation_date', 'app_name')}
+                await asyncio.get_running_loop().run_in_executor(
+                    _get_report_executor(), _write_statistical_pdf, data, output_path, meta, font_path
+                )
+                logger.info(f"Статистический отчет успешно сгенерирован: {output_path}")
+                return output_path
+            
             # Рендеринг HTML
             html_content = self._render_template('statistical_report.html', context)
             
             # Генерация PDF
-            self._generate_pdf(html_content, output_path)
+            await self._render_pdf(html_content, output_path)
             
             logger.info(f"Статистический отчет успешно сгенерирован: {output_path}")
             return output_path
@@ -270,62 +577,64 @@ class DetailedReport(BaseReporter):
         data = {}
         
         try:
-            self.progress_updated.emit("Загрузка данных о коллекционерах...")
+            self.progress_updated.emit("Загрузка коллекционеров, коллекций и каталога...")
+            
+            collectors_data, collections_data, catalog_data = await asyncio.gather(
+                # Коллекционеры с коллекциями
+                self._execute_query("""
+                    SELECT 
+                        c.id,
+                        c.surname,
+                        c.name,
+                        c.patronymic,
+                        c.email,
+                        co.country,
+                        COUNT(col.id) as collections_count
+                    FROM collector c
+                    LEFT JOIN country co ON c.id_country = co.id
+                    LEFT JOIN collection col ON c.id = col.author
+                    GROUP BY c.id, c.surname, c.name, c.patronymic, c.email, co.country
+                    ORDER BY collections_count DESC
+                    LIMIT 50
+                """),
+                # Коллекции с типами
+                self._execute_query("""
+                    SELECT 
+                        col.id,
+                        col.name,
+                        col.author,
+                        ct.collection_type,
+                        col.date_of_creation,
+                        col.number_of_items,
+                        col.description
+                    FROM collection col
+                    LEFT JOIN collection_type ct ON col.id_collection_type = ct.id
+                    ORDER BY col.date_of_creation DESC
+                    LIMIT 50
+                """),
+                # Предметы каталога
+                self._execute_query("""
+                    SELECT 
+                        cat.id,
+                        cat.name,
+                        cat.rare,
+                        co.country,
+                        cat.release_date,
+                        cat.description
+                    FROM catalog cat
+                    LEFT JOIN country co ON cat.id_country = co.id
+                    ORDER BY cat.release_date DESC
+                    LIMIT 50
+                """),
+            )
+            # Даты форматируются один раз здесь, шаблон только вставляет строки
+            for row in collections_data:
+                row['date_of_creation_fmt'] = _format_date(row['date_of_creation'])
+            for row in catalog_data:
+                row['release_date_fmt'] = _format_date(row['release_date'])
             
-            # Коллекционеры с коллекциями
-            collectors_data = await self._execute_query("""
-                SELECT 
-                    c.id,
-                    c.surname,
-                    c.name,
-                    c.patronymic,
-                    c.email,
-                    co.country,
-                    COUNT(col.id) as collections_count
-                FROM collector c
-                LEFT JOIN country co ON c.id_country = co.id
-                LEFT JOIN collection col ON c.id = col.author
-                GROUP BY c.id, c.surname, c.name, c.patronymic, c.email, co.country
-                ORDER BY collections_count DESC
-                LIMIT 50
-            """)
             data['collectors'] = collectors_data or []
-            
-            self.progress_updated.emit("Загрузка данных о коллекциях...")
-            
-            # Коллекции с типами
-            collections_data = await self._execute_query("""
-                SELECT 
-                    col.id,
-                    col.name,
-                    col.author,
-                    ct.collection_type,
-                    col.date_of_creation,
-                    col.number_of_items,
-                    col.description
-                FROM collection col
-                LEFT JOIN collection_type ct ON col.id_collection_type = ct.id
-                ORDER BY col.date_of_creation DESC
-                LIMIT 50
-            """)
             data['collections'] = collections_data or []
-            
-            self.progress_updated.emit("Загрузка данных о предметах каталога...")
-            
-            # Предметы каталога
-            catalog_data = await self._execute_query("""
-                SELECT 
-                    cat.id,
-                    cat.name,
-                    cat.rare,
-                    co.country,
-                    cat.release_date,
-                    cat.description
-                FROM catalog cat
-                LEFT JOIN country co ON cat.id_country = co.id
-                ORDER BY cat.release_date DESC
-                LIMIT 50
-            """)
             data['catalog'] = catalog_data or []
             
             logger.info("Детальные данные успешно собраны")
@@ -350,8 +659,7 @@ class DetailedReport(BaseReporter):
                 'report_name': self.report_name,
                 'generation_date': datetime.now().strftime('%d.%m.%Y %H:%M'),
                 'app_name': config.APP_CONFIG['name'],
-                'data': data,
-                'format_date': self._format_date
+                'data': data
             }
             
             self.progress_updated.emit("Генерация PDF отчета...")
@@ -360,7 +668,7 @@ class DetailedReport(BaseReporter):
             html_content = self._render_template('detailed_report.html', context)
             
             # Генерация PDF
-            self._generate_pdf(html_content, output_path)
+            await self._render_pdf(html_content, output_path)
             
             logger.info(f"Детальный отчет успешно сгенерирован: {output_path}")
             return output_path
@@ -370,25 +678,27 @@ class DetailedReport(BaseReporter):
             raise
 
 
-class PDFReportThread(QThread):
-    """Поток для асинхронной генерации PDF отчетов"""
+class PDFReportThread(QObject):
+    """Генерация PDF отчета в общем фоновом event loop отчетов"""
     
     finished = Signal(str)
     error = Signal(str)
     progress = Signal(str)
     
-    def __init__(self, db_config, report_type, filename, parent=None):
+    def __init__(self, db_config, report_type=None, filename=None, parent=None):
         super().__init__(parent)
         self.db_config = db_config
         self.report_type = report_type
         self.filename = filename
     
-    def run(self):
+    def generate(self, report_type, filename):
+        """Запуск очередного отчета тем же объектом (сигналы уже подключены)"""
+        self.report_type = report_type
+        self.filename = filename
+        self.start()
+    
+    def start(self):
         try:
-            # Создаем новую event loop для этого потока
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
             if self.report_type == 'statistical':
                 reporter = StatisticalReport(self.db_config)
             else:
@@ -397,21 +707,559 @@ class PDFReportThread(QThread):
             # Подключаем сигналы прогресса
             reporter.progress_updated.connect(self.progress.emit)
             
-            try:
-                # Запускаем асинхронную генерацию
-                result = loop.run_until_complete(reporter.generate_report(self.filename))
-                self.finished.emit(result)
-            except Exception as e:
-                logger.error(f"Ошибка генерации отчета: {e}")
-                self.error.emit(str(e))
-            finally:
-                loop.close()
-                
+            future = asyncio.run_coroutine_threadsafe(
+                reporter.generate_report(self.filename), _get_reporter_loop()
+            )
+            future.add_done_callback(self._on_done)
+            
+        except Exception as e:
+            logger.error(f"Ошибка запуска генерации PDF: {e}")
+            self.error.emit(str(e))
+    
+    def _on_done(self, future):
+        """Обработка завершения генерации (вызывается в потоке отчетов)"""
+        try:
+            self.finished.emit(future.result())
         except Exception as e:
-            logger.error(f"Ошибка в потоке генерации PDF: {e}")
+            logger.error(f"Ошибка генерации отчета: {e}")
             self.error.emit(str(e))
 
 
+# Строки-namedtuple из DatabaseManager создаются динамически и не переносятся
+# в другой процесс как есть: передаем имена полей и обычные кортежи
+_PACKED_RECORD_KEYS = (
+    'collectors', 'collections', 'catalog', 'collection_types_stats', 'country_stats'
+)
+
+
+def _pack_records(records):
+    if not records:
+        return None, []
+    row_type = type(records[0])
+    return (row_type.__name__, row_type._fields), [tuple(record) for record in records]
+
+
+def _unpack_records(packed):
+    header, rows = packed
+    if header is None:
+        return []
+    row_type = namedtuple(*header)
+    return [row_type._make(row) for row in rows]
+
+
+class _FastZipFile(zipfile.ZipFile):
+    """ZipFile для упаковки xlsx с быстрым уровнем сжатия"""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('compresslevel', 1)
+        super().__init__(*args, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _fast_workbook_class():
+    """Workbook, который упаковывает xlsx через _FastZipFile"""
+    import xlsxwriter.workbook as workbook_module
+
+    # Копия _store_workbook, в глобальных именах которой ZipFile заменен на
+    # _FastZipFile: сам модуль xlsxwriter не меняется, параллельные экспорты
+    # и другие пользователи xlsxwriter в процессе не затрагиваются
+    base = workbook_module.Workbook._store_workbook
+    store_workbook = types.FunctionType(
+        base.__code__, dict(vars(workbook_module), ZipFile=_FastZipFile),
+        base.__name__, base.__defaults__, base.__closure__
+    )
+
+    class FastWorkbook(workbook_module.Workbook):
+        _store_workbook = store_workbook
+
+    return FastWorkbook
+
+
+def _write_excel_report(data, filename):
+    """Запись Excel отчета по собранным данным (выполняется в процессе-рендерере)"""
+    # Импорт при первом экспорте: приложению на старте xlsxwriter и NumPy не нужны
+    import numpy as np
+    
+    for key in _PACKED_RECORD_KEYS:
+        data[key] = _unpack_records(data[key])
+    
+    workbook = None
+    try:
+        # Создаем словарь для связи ID коллекционера с его именем
+        collector_name_map = {
+            c.id: ' '.join(filter(None, (c.surname, c.name, c.patronymic)))
+            for c in data['collectors']
+        }
+        
+        # Количество коллекций и предметов для каждого коллекционера (GROUP BY в БД)
+        collections_count_map = {}
+        collector_items_map = {}
+        for agg in data['collector_aggregates']:
+            collections_count_map[agg['author']] = agg['collections_count']
+            collector_items_map[agg['author']] = agg['items_count']
+        
+        # Упаковка XML листов в zip — самая долгая часть close(): файл сразу открывают,
+        # поэтому сжимаем быстрым уровнем 1 вместо стандартного 6
+        workbook = _fast_workbook_class()(filename, {
+            'default_date_format': 'dd.mm.yyyy',
+            # Строки пишутся на диск по мере заполнения — память не растет с объемом данных.
+            # Это тот же потоковый режим, что write_only в openpyxl, но без отдельной
+            # библиотеки и с сохранением форматирования таблиц
+            'constant_memory': True,
+            # Строки из БД пишутся как текст: write() не проверяет каждую ячейку
+            # регулярными выражениями на формулы и ссылки
+            'strings_to_numbers': False,
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+        })
+        
+        # Форматы
+        title_format = workbook.add_format({
+            'bold': True,
+            'font_size': 14,
+            'fg_color': '#FF6B35',
+            'font_color': 'white',
+            'border': 1,
+            'align': 'center',
+            'valign': 'vcenter'
+        })
+        
+        header_format = workbook.add_format({
+            'bold': True,
+            'font_size': 11,
+            'fg_color': '#FFE0B2',
+            'font_color': '#BF360C',
+            'border': 1,
+            'align': 'center',
+            'valign': 'vcenter'
+        })
+        
+        # Правильные числовые форматы
+        id_format = workbook.add_format({'num_format': '0', 'border': 1, 'align': 'center'})
+        date_format = workbook.add_format({'num_format': 'dd.mm.yyyy', 'border': 1, 'align': 'center'})
+        number_format = workbook.add_format({'num_format': '#,##0', 'border': 1, 'align': 'center'})
+        text_format = workbook.add_format({'border': 1, 'valign': 'top', 'text_wrap': True})
+        center_format = workbook.add_format({'align': 'center', 'border': 1, 'valign': 'vcenter'})
+        bold_format = workbook.add_format({'bold': True, 'border': 1})
+        decimal_format = workbook.add_format({'num_format': '0.00', 'border': 1, 'align': 'center'})
+        
+        # ЛИСТ 1: ДАННЫЕ ПРОЕКТА
+        worksheet_data = workbook.add_worksheet('Данные проекта')
+        
+        worksheet_data.set_row(0, 40)
+        worksheet_data.set_row(1, 25)
+        worksheet_data.merge_range(0, 0, 0, 8, 'ОТЧЕТ ПЛАТФОРМЫ КОЛЛЕКЦИОНЕРОВ', title_format)
+        worksheet_data.merge_range(1, 0, 1, 8, 'Система управления коллекциями марок и монет', header_format)
+        
+        # Увеличиваем высоту строк для заголовков
+        worksheet_data.set_row(3, 30)
+        
+        headers = [
+            'ID', 'Фамилия', 'Имя', 'Отчество', 'Email', 'Страна', 
+            'Описание', 'Кол-во коллекций', 'Сумма предметов'
+        ]
+        
+        worksheet_data.write_row(3, 0, headers, header_format)
+        
+        # Увеличиваем ширину колонок для лучшего отображения
+        column_widths = [6, 15, 15, 15, 25, 15, 40, 15, 15]
+        for col, width in enumerate(column_widths):
+            worksheet_data.set_column(col, col, width)
+        
+        # Методы листа связываем с локальными именами: циклы ниже пишут тысячи ячеек
+        write = worksheet_data.write
+        write_number = worksheet_data.write_number
+        write_row = worksheet_data.write_row
+        write_datetime = worksheet_data.write_datetime
+        set_row = worksheet_data.set_row
+        
+        row = 4
+        # Высоты строк с длинными описаниями задаем до записи таблицы: в режиме
+        # constant_memory строка сбрасывается на диск, как только начата следующая
+        _set_tall_rows(set_row, row, data['collectors'])
+        for collector in data['collectors']:
+            collector_id = collector.id
+            description = collector.description or ''
+            
+            # Соседние ячейки с общим форматом пишутся одним вызовом
+            write_number(row, 0, collector_id, id_format)
+            write_row(row, 1, (collector.surname, collector.name,
+                               collector.patronymic, collector.email), text_format)
+            write(row, 5, collector.country, center_format)
+            write(row, 6, description, text_format)
+            write_row(row, 7, (collections_count_map.get(collector_id, 0),
+                               collector_items_map.get(collector_id, 0)), number_format)
+            
+            row += 1
+        
+        if data.get('collectors'):
+            worksheet_data.autofilter(3, 0, row-1, len(headers)-1)
+        
+        # Пустая строка
+        row += 2
+        
+        # КОЛЛЕКЦИИ
+        write(row, 0, 'Коллекции:', bold_format)
+        row += 1
+        
+        collection_headers = [
+            'ID', 'Название', 'Автор', 'Тип', 'Дата создания', 
+            'Кол-во предметов', 'Описание'
+        ]
+        
+        write_row(row, 0, collection_headers, header_format)
+        
+        row += 1
+        collections_start_row = row
+        
+        _set_tall_rows(set_row, row, data['collections'])
+        for collection in data['collections']:
+            description = collection.description or ''
+            
+            # Получаем имя автора из словаря
+            author_id = collection.author
+            author_name = collector_name_map.get(author_id, str(author_id) if author_id else 'Неизвестно')
+            
+            write_number(row, 0, collection.id, id_format)
+            write_row(row, 1, (collection.name, author_name), text_format)
+            
+            write(row, 3, collection.collection_type, center_format)
+            
+            # Форматируем дату
+            date_str = collection.date_of_creation
+            if date_str:
+                try:
+                    if isinstance(date_str, str):
+                        date_str = date_str.split(' ')[0]
+                        try:
+                            write_datetime(row, 4, _parse_ymd(date_str), date_format)
+                        except ValueError:
+                            write(row, 4, date_str, center_format)
+                    else:
+                        write_datetime(row, 4, date_str, date_format)
+                except Exception:
+                    write(row, 4, str(date_str), center_format)
+            else:
+                write(row, 4, '', center_format)
+            
+            write_number(row, 5, collection.number_of_items, number_format)
+            write(row, 6, description, text_format)
+            
+            row += 1
+        
+        if data.get('collections'):
+            worksheet_data.autofilter(collections_start_row-1, 0, row-1, len(collection_headers)-1)
+        
+        # Пустая строка
+        row += 2
+        
+        # КАТАЛОГ
+        write(row, 0, 'Каталог предметов:', bold_format)
+        row += 1
+        
+        catalog_headers = [
+            'ID', 'Название', 'Редкость', 'Страна', 'Дата выпуска', 'Описание'
+        ]
+        
+        write_row(row, 0, catalog_headers, header_format)
+        
+        row += 1
+        catalog_start_row = row
+        
+        _set_tall_rows(set_row, row, data['catalog'])
+        for item in data['catalog']:
+            description = item.description or ''
+            
+            write_number(row, 0, item.id, id_format)
+            write(row, 1, item.name, text_format)
+            write_row(row, 2, (item.rare, item.country), center_format)
+            
+            # Форматируем дату выпуска
+            release_date = item.release_date
+            if release_date:
+                try:
+                    if isinstance(release_date, str):
+                        release_date = release_date.split(' ')[0]
+                        if release_date.startswith('0000-'):
+                            write(row, 4, 'Неизвестно', center_format)
+                        else:
+                            try:
+                                write_datetime(row, 4, _parse_ymd(release_date), date_format)
+                            except ValueError:
+                                write(row, 4, release_date, center_format)
+                    else:
+                        write_datetime(row, 4, release_date, date_format)
+                except Exception:
+                    write(row, 4, str(release_date), center_format)
+            else:
+                write(row, 4, '', center_format)
+            
+            write(row, 5, description, text_format)
+            
+            row += 1
+        
+        if data.get('catalog'):
+            worksheet_data.autofilter(catalog_start_row-1, 0, row-1, len(catalog_headers)-1)
+        
+        worksheet_data.freeze_panes(4, 0)
+        
+        # ЛИСТ 2: АНАЛИТИКА
+        worksheet_analytics = workbook.add_worksheet('Аналитика')
+        worksheet_analytics.set_row(0, 40)
+        worksheet_analytics.merge_range(0, 0, 0, 3, 'АНАЛИТИКА ДАННЫХ', title_format)
+        
+        write = worksheet_analytics.write
+        write_number = worksheet_analytics.write_number
+        write_row = worksheet_analytics.write_row
+        merge_range = worksheet_analytics.merge_range
+        
+        row = 3
+        
+        # 1. Общая статистика
+        stats = data.get('statistics', {})
+        # Показатели читаются из словаря один раз: ниже они нужны в нескольких таблицах
+        total_collectors_val = stats.get('collectors_count', 0)
+        total_collections_val = stats.get('collections_count', 0)
+        total_items_val = stats.get('items_count', 0)
+        catalog_count = stats.get('catalog_count', 0)
+        merge_range(row - 1, 0, row - 1, 1, 'ОБЩАЯ СТАТИСТИКА', title_format)
+        row += 1
+        
+        stats_headers = ['Показатель', 'Значение']
+        write_row(row, 0, stats_headers, header_format)
+        row += 1
+        
+        stats_data = [
+            ['Всего коллекционеров', total_collectors_val],
+            ['Всего коллекций', total_collections_val],
+            ['Предметов в каталоге', catalog_count],
+            ['Предметов в коллекциях', total_items_val]
+        ]
+        
+        for label, value in stats_data:
+            write(row, 0, label, text_format)
+            write_number(row, 1, value, number_format)
+            row += 1
+        
+        row += 2
+        
+        # 2. Распределение по типам коллекций
+        merge_range(row - 1, 0, row - 1, 2, 'РАСПРЕДЕЛЕНИЕ ПО ТИПАМ КОЛЛЕКЦИЙ', title_format)
+        row += 1
+        
+        type_headers = ['Тип коллекции', 'Количество', 'Доля, %']
+        write_row(row, 0, type_headers, header_format)
+        row += 1
+        
+        type_stats = data.get('collection_types_stats', [])
+        # Итог и доли считаются векторно по массиву количеств
+        type_counts = np.fromiter((item.count for item in type_stats),
+                                  dtype=np.int64, count=len(type_stats))
+        total_collections = int(type_counts.sum())
+        type_percentages = (type_counts / total_collections * 100 if total_collections > 0
+                            else np.zeros(len(type_counts)))
+        
+        type_table_start = row if type_stats else None
+        for record, count, percentage in zip(type_stats, type_counts.tolist(),
+                                             type_percentages.tolist()):
+            write(row, 0, record.collection_type, text_format)
+            write_number(row, 1, count, number_format)
+            write_number(row, 2, percentage, decimal_format)
+            row += 1
+        
+        type_table_end = (row - 1) if type_table_start is not None else None
+        
+        # График 1: Круговая диаграмма типов коллекций
+        if type_table_start is not None and type_table_end is not None and type_table_end >= type_table_start:
+            chart1 = workbook.add_chart({'type': 'pie'})
+            
+            chart1.add_series({
+                'name': 'Типы коллекций',
+                # Диапазоны списком [лист, первая строка, столбец, последняя строка, столбец]
+                'categories': ['Аналитика', type_table_start, 0, type_table_end, 0],
+                'values': ['Аналитика', type_table_start, 1, type_table_end, 1],
+            })
+            chart1.set_title({'name': 'Распределение коллекций по типам'})
+            chart1.set_style(10)
+            worksheet_analytics.insert_chart(2, 4, chart1)
+        
+        row += 20
+        
+        # 3. Коллекционеры по странам
+        merge_range(row - 1, 0, row - 1, 2, 'КОЛЛЕКЦИОНЕРЫ ПО СТРАНАМ', title_format)
+        row += 1
+        
+        country_headers = ['Страна', 'Кол-во коллекционеров', 'Доля, %']
+        write_row(row, 0, country_headers, header_format)
+        row += 1
+        
+        country_stats = data.get('country_stats', [])
+        country_counts = np.fromiter((item.collector_count for item in country_stats),
+                                     dtype=np.int64, count=len(country_stats))
+        total_collectors = int(country_counts.sum())
+        country_percentages = (country_counts / total_collectors * 100 if total_collectors > 0
+                               else np.zeros(len(country_counts)))
+        
+        country_table_start = row if country_stats else None
+        for record, count, percentage in zip(country_stats, country_counts.tolist(),
+                                             country_percentages.tolist()):
+            write(row, 0, record.country, text_format)
+            write_number(row, 1, count, number_format)
+            write_number(row, 2, percentage, decimal_format)
+            row += 1
+        
+        country_table_end = (row - 1) if country_table_start is not None else None
+        
+        # График 2: Столбчатая диаграмма по странам
+        if country_table_start is not None and country_table_end is not None and country_table_end >= country_table_start:
+            chart2 = workbook.add_chart({'type': 'column'})
+            
+            chart2.add_series({
+                'name': 'Коллекционеры',
+                # Диапазоны списком [лист, первая строка, столбец, последняя строка, столбец]
+                'categories': ['Аналитика', country_table_start, 0, country_table_end, 0],
+                'values': ['Аналитика', country_table_start, 1, country_table_end, 1],
+            })
+            chart2.set_title({'name': 'Коллекционеры по странам'})
+            chart2.set_x_axis({'name': 'Страна'})
+            chart2.set_y_axis({'name': 'Количество'})
+            chart2.set_style(11)
+            chart2.set_legend({'none': True})
+            worksheet_analytics.insert_chart(22, 4, chart2)
+        
+        # Расчетные показатели
+        row += 20
+        merge_range(row - 1, 0, row - 1, 1, 'РАСЧЕТНЫЕ ПОКАЗАТЕЛИ', title_format)
+        row += 1
+        
+        # Количества коллекций по авторам одним массивом: активные и лидер считаются в NumPy
+        # за один проход по словарю, без промежуточных списков
+        author_counts = np.fromiter(collections_count_map.values(), dtype=np.int64,
+                                    count=len(collections_count_map))
+        # Коллекционеры, у которых есть хотя бы одна коллекция (нужно в трех местах ниже)
+        active_collectors = int(np.count_nonzero(author_counts))
+        if collections_count_map:
+            top_index = int(author_counts.argmax())
+            # Порядок ключей словаря совпадает с порядком значений в массиве
+            top_collector_id = next(itertools.islice(collections_count_map, top_index, None))
+            top_collections_count = int(author_counts[top_index])
+        else:
+            top_collector_id, top_collections_count = None, 0
+        top_collector_name = collector_name_map.get(top_collector_id, 'Неизвестно')
+        
+        # Тип значения известен заранее: третий элемент выбирает числовой формат.
+        # Средние пишутся без round(): до двух знаков их округляет формат ячейки 0.00
+        metrics = [
+            ('Всего коллекционеров:', total_collectors_val, True),
+            ('Всего коллекций:', total_collections_val, True),
+            ('Среднее коллекций на коллекционера:', 
+             total_collections_val / max(total_collectors_val, 1), False),
+            ('Всего предметов в коллекциях:', total_items_val, True),
+            ('Среднее предметов в коллекции:', 
+             total_items_val / max(total_collections_val, 1), False),
+            ('Активных коллекционеров (имеющих коллекции):', active_collectors, True)
+        ]
+        
+        for metric_name, metric_value, is_int in metrics:
+            write(row, 0, metric_name, bold_format)
+            if is_int:
+                write_number(row, 1, metric_value, number_format)
+            else:
+                write_number(row, 1, metric_value, decimal_format)
+            row += 1
+        
+        # Устанавливаем ширину колонок
+        worksheet_analytics.set_column(0, 0, 35)
+        worksheet_analytics.set_column(1, 1, 20)
+        worksheet_analytics.set_column(2, 2, 15)
+        
+        # ЛИСТ 3: ВИЗУАЛИЗАЦИЯ
+        worksheet_viz = workbook.add_worksheet('Визуализация')
+        worksheet_viz.set_row(0, 40)
+        worksheet_viz.merge_range(0, 0, 0, 2, 'ВИЗУАЛИЗАЦИЯ ДАННЫХ', title_format)
+        
+        write = worksheet_viz.write
+        write_number = worksheet_viz.write_number
+        write_row = worksheet_viz.write_row
+        merge_range = worksheet_viz.merge_range
+        
+        row = 3
+        
+        # Инфографика
+        merge_range(row - 1, 0, row - 1, 1, 'ИНФОГРАФИКА ОСНОВНЫХ ПОКАЗАТЕЛЕЙ', title_format)
+        row += 1
+        
+        info_headers = ['Показатель', 'Значение', 'Описание']
+        write_row(row, 0, info_headers, header_format)
+        row += 1
+        
+        info_data = [
+            ['Всего коллекционеров', total_collectors_val, 'Коллекционеров в системе'],
+            ['Всего коллекций', total_collections_val, 'Коллекций создано'],
+            ['Всего предметов', total_items_val, 'Предметов в коллекциях'],
+            ['Предметов в каталоге', catalog_count, 'Предметов в общем каталоге'],
+            ['Типов коллекций', len(type_stats), 'Различных типов коллекций'],
+            ['Стран', len(country_stats), 'Стран представлено'],
+            ['Активных коллекционеров', active_collectors, 'Коллекционеров с коллекциями']
+        ]
+        
+        for label, value, description in info_data:
+            write(row, 0, label, bold_format)
+            write_number(row, 1, value, number_format)
+            write(row, 2, description, text_format)
+            row += 1
+        
+        # Выводы
+        row += 2
+        merge_range(row - 1, 0, row - 1, 2, 'ВЫВОДЫ ПО АНАЛИТИКЕ', title_format)
+        row += 1
+        
+        # Лидеры по типам и странам берутся из уже посчитанных массивов количеств
+        top_type = type_stats[int(type_counts.argmax())] if type_stats else None
+        top_country = country_stats[int(country_counts.argmax())] if country_stats else None
+        
+        conclusions = [
+            f'1. В системе зарегистрировано {total_collectors_val} коллекционеров, из них {active_collectors} активных.',
+            f'2. Создано {total_collections_val} коллекций различных типов.',
+            f'3. В каталоге представлено {catalog_count} предметов.',
+            f'4. Всего в коллекциях содержится {total_items_val} предметов.',
+        ]
+        
+        if top_type is not None:
+            conclusions.append(f'5. Наиболее популярный тип коллекций: {top_type.collection_type} '
+                             f'({top_type.count} коллекций).')
+        
+        if top_country is not None:
+            conclusions.append(f'6. Больше всего коллекционеров в стране: {top_country.country} '
+                             f'({top_country.collector_count} человек).')
+        
+        if top_collections_count > 0:
+            conclusions.append(f'7. Самый активный коллекционер: {top_collector_name} '
+                             f'({top_collections_count} коллекций).')
+        
+        for i, conclusion in enumerate(conclusions, row):
+            merge_range(i, 0, i, 2, conclusion, text_format)
+        row += len(conclusions)
+        
+        # Устанавливаем ширину колонок
+        worksheet_viz.set_column(0, 0, 30)
+        worksheet_viz.set_column(1, 1, 15)
+        worksheet_viz.set_column(2, 2, 45)
+        
+        workbook.close()
+    except Exception:
+        if workbook is not None:
+            # В режиме constant_memory листы держат открытые временные файлы:
+            # закрываем книгу и удаляем недописанный отчет
+            try:
+                workbook.close()
+                os.remove(filename)
+            except Exception:
+                pass
+        raise
+    return filename
+
+
 class ExcelExporter(QObject):
     """Класс для генерации Excel отчетов"""
     
@@ -426,14 +1274,19 @@ class ExcelExporter(QObject):
     async def _get_all_data(self):
         """Получение всех данных для отчета"""
         try:
-            collectors = await self.db_manager._get_collectors()
-            collections = await self.db_manager._get_collections()
-            catalog = await self.db_manager._get_catalog()
-            statistics = await self.db_manager._get_statistics()
-            collection_types_stats = await self.db_manager._get_collection_types_stats()
-            country_stats = await self.db_manager._get_country_stats()
-            countries = await self.db_manager._get_countries()
-            collection_types = await self.db_manager._get_collection_types()
+            db = self.db_manager
+            (collectors, collections, catalog, statistics, collection_types_stats,
+             country_stats, countries, collection_types, collector_aggregates) = await asyncio.gather(
+                db._get_collectors(),
+                db._get_collections(),
+                db._get_catalog(),
+                db._get_statistics(exact=True),
+                db._get_collection_types_stats(),
+                db._get_country_stats(),
+                db._get_countries(),
+                db._get_collection_types(),
+                db._get_collector_aggregates(),
+            )
             
             return {
                 'collectors': collectors or [],
@@ -443,7 +1296,8 @@ class ExcelExporter(QObject):
                 'collection_types_stats': collection_types_stats or [],
                 'country_stats': country_stats or [],
                 'countries': countries or [],
-                'collection_types': collection_types or []
+                'collection_types': collection_types or [],
+                'collector_aggregates': collector_aggregates or []
             }
         except Exception as e:
             logger.error(f"Ошибка получения данных для Excel: {e}")
@@ -468,452 +1322,22 @@ class ExcelExporter(QObject):
             data = await self._get_all_data()
             self.progress_updated.emit(30)
             
-            # Создаем словарь для связи ID коллекционера с его именем
-            collector_name_map = {}
-            for collector in data.get('collectors', []):
-                collector_name = f"{collector.get('surname', '')} {collector.get('name', '')}".strip()
-                if collector.get('patronymic'):
-                    collector_name += f" {collector.get('patronymic', '')}"
-                collector_name_map[collector.get('id')] = collector_name
-            
-            # Подсчитываем количество коллекций для каждого коллекционера
-            collections_count_map = {}
-            for collection in data.get('collections', []):
-                author_id = collection.get('author')
-                if author_id:
-                    collections_count_map[author_id] = collections_count_map.get(author_id, 0) + 1
-            
-            workbook = xlsxwriter.Workbook(filename, {'default_date_format': 'dd.mm.yyyy'})
-            
-            # Форматы
-            title_format = workbook.add_format({
-                'bold': True,
-                'font_size': 14,
-                'fg_color': '#FF6B35',
-                'font_color': 'white',
-                'border': 1,
-                'align': 'center',
-                'valign': 'vcenter'
-            })
-            
-            header_format = workbook.add_format({
-                'bold': True,
-                'font_size': 11,
-                'fg_color': '#FFE0B2',
-                'font_color': '#BF360C',
-                'border': 1,
-                'align': 'center',
-                'valign': 'vcenter'
-            })
-            
-            # Правильные числовые форматы
-            id_format = workbook.add_format({'num_format': '0', 'border': 1, 'align': 'center'})
-            date_format = workbook.add_format({'num_format': 'dd.mm.yyyy', 'border': 1, 'align': 'center'})
-            number_format = workbook.add_format({'num_format': '#,##0', 'border': 1, 'align': 'center'})
-            text_format = workbook.add_format({'border': 1, 'valign': 'top', 'text_wrap': True})
-            center_format = workbook.add_format({'align': 'center', 'border': 1, 'valign': 'vcenter'})
-            bold_format = workbook.add_format({'bold': True, 'border': 1})
-            decimal_format = workbook.add_format({'num_format': '0.00', 'border': 1, 'align': 'center'})
-            
-            # ЛИСТ 1: ДАННЫЕ ПРОЕКТА
-            worksheet_data = workbook.add_worksheet('Данные проекта')
-            
-            worksheet_data.merge_range('A1:I1', 'ОТЧЕТ ПЛАТФОРМЫ КОЛЛЕКЦИОНЕРОВ', title_format)
-            worksheet_data.merge_range('A2:I2', 'Система управления коллекциями марок и монет', header_format)
-            worksheet_data.set_row(0, 40)
-            worksheet_data.set_row(1, 25)
-            
-            # Увеличиваем высоту строк для заголовков
-            worksheet_data.set_row(3, 30)
-            
-            headers = [
-                'ID', 'Фамилия', 'Имя', 'Отчество', 'Email', 'Страна', 
-                'Описание', 'Кол-во коллекций', 'Сумма предметов'
-            ]
-            
-            for col, header in enumerate(headers):
-                worksheet_data.write(3, col, header, header_format)
-            
-            # Увеличиваем ширину колонок для лучшего отображения
-            column_widths = [6, 15, 15, 15, 25, 15, 40, 15, 15]
-            for col, width in enumerate(column_widths):
-                worksheet_data.set_column(col, col, width)
-            
-            row = 4
-            # Считаем общее количество предметов для каждого коллекционера
-            collector_items_map = {}
-            for collection in data.get('collections', []):
-                author_id = collection.get('author')
-                items_count = collection.get('number_of_items', 0)
-                if author_id:
-                    collector_items_map[author_id] = collector_items_map.get(author_id, 0) + items_count
-            
-            for collector in data.get('collectors', []):
-                collector_id = collector.get('id')
-                collections_count = collections_count_map.get(collector_id, 0)
-                total_items = collector_items_map.get(collector_id, 0)
-                
-                worksheet_data.write_number(row, 0, collector_id, id_format)
-                worksheet_data.write(row, 1, collector.get('surname', ''), text_format)
-                worksheet_data.write(row, 2, collector.get('name', ''), text_format)
-                worksheet_data.write(row, 3, collector.get('patronymic', ''), text_format)
-                worksheet_data.write(row, 4, collector.get('email', ''), text_format)
-                worksheet_data.write(row, 5, collector.get('country', ''), center_format)
-                worksheet_data.write(row, 6, collector.get('description', ''), text_format)
-                worksheet_data.write_number(row, 7, collections_count, number_format)
-                worksheet_data.write_number(row, 8, total_items, number_format)
-                
-                # Увеличиваем высоту строк для длинных описаний
-                description = collector.get('description', '')
-                if len(description) > 100:
-                    worksheet_data.set_row(row, 60)
-                
-                row += 1
-            
-            if data.get('collectors'):
-                worksheet_data.autofilter(3, 0, row-1, len(headers)-1)
-            
-            # Пустая строка
-            row += 2
-            
-            # КОЛЛЕКЦИИ
-            worksheet_data.write(row, 0, 'Коллекции:', bold_format)
-            row += 1
-            
-            collection_headers = [
-                'ID', 'Название', 'Автор', 'Тип', 'Дата создания', 
-                'Кол-во предметов', 'Описание'
-            ]
-            
-            for col, header in enumerate(collection_headers):
-                worksheet_data.write(row, col, header, header_format)
-            
-            row += 1
-            collections_start_row = row
+            for key in _PACKED_RECORD_KEYS:
+                data[key] = _pack_records(data[key])
+            # Прогресс сообщается по этапам, а не по строкам: сигнал идет в GUI через очередь
+            self.progress_updated.emit(50)
             
-            for collection in data.get('collections', []):
-                worksheet_data.write_number(row, 0, collection.get('id', 0), id_format)
-                worksheet_data.write(row, 1, collection.get('name', ''), text_format)
-                
-                # Получаем имя автора из словаря
-                author_id = collection.get('author')
-                author_name = collector_name_map.get(author_id, str(author_id) if author_id else 'Неизвестно')
-                worksheet_data.write(row, 2, author_name, text_format)
-                
-                worksheet_data.write(row, 3, collection.get('collection_type', ''), center_format)
-                
-                # Форматируем дату
-                date_str = collection.get('date_of_creation')
-                if date_str:
-                    try:
-                        if isinstance(date_str, str):
-                            date_str = date_str.split(' ')[0]
-                            try:
-                                date = datetime.strptime(date_str, '%Y-%m-%d')
-                                worksheet_data.write_datetime(row, 4, date, date_format)
-                            except ValueError:
-                                worksheet_data.write(row, 4, date_str, center_format)
-                        else:
-                            worksheet_data.write_datetime(row, 4, date_str, date_format)
-                    except Exception:
-                        worksheet_data.write(row, 4, str(date_str), center_format)
-                else:
-                    worksheet_data.write(row, 4, '', center_format)
-                
-                worksheet_data.write_number(row, 5, collection.get('number_of_items', 0), number_format)
-                worksheet_data.write(row, 6, collection.get('description', ''), text_format)
-                
-                # Увеличиваем высоту строк для длинных описаний
-                description = collection.get('description', '')
-                if len(description) > 100:
-                    worksheet_data.set_row(row, 60)
-                
-                row += 1
-            
-            if data.get('collections'):
-                worksheet_data.autofilter(collections_start_row-1, 0, row-1, len(collection_headers)-1)
-            
-            # Пустая строка
-            row += 2
-            
-            # КАТАЛОГ
-            worksheet_data.write(row, 0, 'Каталог предметов:', bold_format)
-            row += 1
-            
-            catalog_headers = [
-                'ID', 'Название', 'Редкость', 'Страна', 'Дата выпуска', 'Описание'
-            ]
-            
-            for col, header in enumerate(catalog_headers):
-                worksheet_data.write(row, col, header, header_format)
-            
-            row += 1
-            catalog_start_row = row
-            
-            for item in data.get('catalog', []):
-                worksheet_data.write_number(row, 0, item.get('id', 0), id_format)
-                worksheet_data.write(row, 1, item.get('name', ''), text_format)
-                worksheet_data.write(row, 2, item.get('rare', ''), center_format)
-                worksheet_data.write(row, 3, item.get('country', ''), center_format)
-                
-                # Форматируем дату выпуска
-                release_date = item.get('release_date')
-                if release_date:
-                    try:
-                        if isinstance(release_date, str):
-                            release_date = release_date.split(' ')[0]
-                            if release_date == '0000-00-00' or release_date.startswith('0000-'):
-                                worksheet_data.write(row, 4, 'Неизвестно', center_format)
-                            else:
-                                try:
-                                    date = datetime.strptime(release_date, '%Y-%m-%d')
-                                    worksheet_data.write_datetime(row, 4, date, date_format)
-                                except ValueError:
-                                    worksheet_data.write(row, 4, release_date, center_format)
-                        else:
-                            worksheet_data.write_datetime(row, 4, release_date, date_format)
-                    except Exception:
-                        worksheet_data.write(row, 4, str(release_date), center_format)
-                else:
-                    worksheet_data.write(row, 4, '', center_format)
-                
-                worksheet_data.write(row, 5, item.get('description', ''), text_format)
-                
-                # Увеличиваем высоту строк для длинных описаний
-                description = item.get('description', '')
-                if len(description) > 100:
-                    worksheet_data.set_row(row, 60)
-                
-                row += 1
-            
-            if data.get('catalog'):
-                worksheet_data.autofilter(catalog_start_row-1, 0, row-1, len(catalog_headers)-1)
-            
-            worksheet_data.freeze_panes(4, 0)
-            
-            # ЛИСТ 2: АНАЛИТИКА
-            worksheet_analytics = workbook.add_worksheet('Аналитика')
-            worksheet_analytics.merge_range('A1:D1', 'АНАЛИТИКА ДАННЫХ', title_format)
-            worksheet_analytics.set_row(0, 40)
-            
-            row = 3
-            
-            # 1. Общая статистика
-            stats = data.get('statistics', {})
-            worksheet_analytics.merge_range(f'A{row}:B{row}', 'ОБЩАЯ СТАТИСТИКА', title_format)
-            row += 1
-            
-            stats_headers = ['Показатель', 'Значение']
-            for col, header in enumerate(stats_headers):
-                worksheet_analytics.write(row, col, header, header_format)
-            row += 1
-            
-            stats_data = [
-                ['Всего коллекционеров', stats.get('collectors_count', 0)],
-                ['Всего коллекций', stats.get('collections_count', 0)],
-                ['Предметов в каталоге', stats.get('catalog_count', 0)],
-                ['Предметов в коллекциях', stats.get('items_count', 0)]
-            ]
-            
-            for stat in stats_data:
-                worksheet_analytics.write(row, 0, stat[0], text_format)
-                worksheet_analytics.write_number(row, 1, stat[1], number_format)
-                row += 1
-            
-            row += 2
-            
-            # 2. Распределение по типам коллекций
-            worksheet_analytics.merge_range(f'A{row}:C{row}', 'РАСПРЕДЕЛЕНИЕ ПО ТИПАМ КОЛЛЕКЦИЙ', title_format)
-            row += 1
-            
-            type_headers = ['Тип коллекции', 'Количество', 'Доля, %']
-            for col, header in enumerate(type_headers):
-                worksheet_analytics.write(row, col, header, header_format)
-            row += 1
-            
-            type_stats = data.get('collection_types_stats', [])
-            total_collections = sum(item.get('count', 0) for item in type_stats)
-            
-            type_table_start = row if type_stats else None
-            for record in type_stats:
-                count = record.get('count', 0)
-                percentage = (count / total_collections * 100) if total_collections > 0 else 0
-                
-                worksheet_analytics.write(row, 0, record.get('collection_type', 'Не указан'), text_format)
-                worksheet_analytics.write_number(row, 1, count, number_format)
-                worksheet_analytics.write_number(row, 2, percentage, decimal_format)
-                row += 1
-            
-            type_table_end = (row - 1) if type_table_start is not None else None
-            
-            # График 1: Круговая диаграмма типов коллекций
-            if type_table_start is not None and type_table_end is not None and type_table_end >= type_table_start:
-                chart1 = workbook.add_chart({'type': 'pie'})
-                excel_start = type_table_start + 1
-                excel_end = type_table_end + 1
-                
-                chart1.add_series({
-                    'name': 'Типы коллекций',
-                    'categories': f'=Аналитика!$A${excel_start}:$A${excel_end}',
-                    'values': f'=Аналитика!$B${excel_start}:$B${excel_end}',
-                })
-                chart1.set_title({'name': 'Распределение коллекций по типам'})
-                chart1.set_style(10)
-                worksheet_analytics.insert_chart('E3', chart1)
-            
-            row += 20
-            
-            # 3. Коллекционеры по странам
-            worksheet_analytics.merge_range(f'A{row}:C{row}', 'КОЛЛЕКЦИОНЕРЫ ПО СТРАНАМ', title_format)
-            row += 1
-            
-            country_headers = ['Страна', 'Кол-во коллекционеров', 'Доля, %']
-            for col, header in enumerate(country_headers):
-                worksheet_analytics.write(row, col, header, header_format)
-            row += 1
-            
-            country_stats = data.get('country_stats', [])
-            total_collectors = sum(item.get('collector_count', 0) for item in country_stats)
-            
-            country_table_start = row if country_stats else None
-            for record in country_stats:
-                count = record.get('collector_count', 0)
-                percentage = (count / total_collectors * 100) if total_collectors > 0 else 0
-                
-                worksheet_analytics.write(row, 0, record.get('country', 'Не указана'), text_format)
-                worksheet_analytics.write_number(row, 1, count, number_format)
-                worksheet_analytics.write_number(row, 2, percentage, decimal_format)
-                row += 1
-            
-            country_table_end = (row - 1) if country_table_start is not None else None
-            
-            # График 2: Столбчатая диаграмма по странам
-            if country_table_start is not None and country_table_end is not None and country_table_end >= country_table_start:
-                chart2 = workbook.add_chart({'type': 'column'})
-                excel_start = country_table_start + 1
-                excel_end = country_table_end + 1
-                
-                chart2.add_series({
-                    'name': 'Коллекционеры',
-                    'categories': f'=Аналитика!$A${excel_start}:$A${excel_end}',
-                    'values': f'=Аналитика!$B${excel_start}:$B${excel_end}',
-                })
-                chart2.set_title({'name': 'Коллекционеры по странам'})
-                chart2.set_x_axis({'name': 'Страна'})
-                chart2.set_y_axis({'name': 'Количество'})
-                chart2.set_style(11)
-                chart2.set_legend({'none': True})
-                worksheet_analytics.insert_chart('E23', chart2)
-            
-            # Расчетные показатели
-            row += 20
-            worksheet_analytics.merge_range(f'A{row}:B{row}', 'РАСЧЕТНЫЕ ПОКАЗАТЕЛИ', title_format)
-            row += 1
-            
-            total_collectors_val = stats.get('collectors_count', 0)
-            total_collections_val = stats.get('collections_count', 0)
-            total_items_val = stats.get('items_count', 0)
-            
-            metrics = [
-                ['Всего коллекционеров:', total_collectors_val],
-                ['Всего коллекций:', total_collections_val],
-                ['Среднее коллекций на коллекционера:', 
-                 round(total_collections_val / max(total_collectors_val, 1), 2)],
-                ['Всего предметов в коллекциях:', total_items_val],
-                ['Среднее предметов в коллекции:', 
-                 round(total_items_val / max(total_collections_val, 1), 2)],
-                ['Активных коллекционеров (имеющих коллекции):', 
-                 sum(1 for collector_id, count in collections_count_map.items() if count > 0)]
-            ]
-            
-            for metric_name, metric_value in metrics:
-                worksheet_analytics.write(row, 0, metric_name, bold_format)
-                if isinstance(metric_value, (int, float)):
-                    if isinstance(metric_value, int):
-                        worksheet_analytics.write_number(row, 1, metric_value, number_format)
-                    else:
-                        worksheet_analytics.write(row, 1, metric_value, decimal_format)
-                row += 1
-            
-            # Устанавливаем ширину колонок
-            worksheet_analytics.set_column('A:A', 35)
-            worksheet_analytics.set_column('B:B', 20)
-            worksheet_analytics.set_column('C:C', 15)
-            
-            # ЛИСТ 3: ВИЗУАЛИЗАЦИЯ
-            worksheet_viz = workbook.add_worksheet('Визуализация')
-            worksheet_viz.merge_range('A1:C1', 'ВИЗУАЛИЗАЦИЯ ДАННЫХ', title_format)
-            worksheet_viz.set_row(0, 40)
-            
-            row = 3
-            
-            # Инфографика
-            worksheet_viz.merge_range(f'A{row}:B{row}', 'ИНФОГРАФИКА ОСНОВНЫХ ПОКАЗАТЕЛЕЙ', title_format)
-            row += 1
-            
-            info_headers = ['Показатель', 'Значение', 'Описание']
-            for col, header in enumerate(info_headers):
-                worksheet_viz.write(row, col, header, header_format)
-            row += 1
-            
-            info_data = [
-                ['Всего коллекционеров', total_collectors_val, 'Коллекционеров в системе'],
-                ['Всего коллекций', total_collections_val, 'Коллекций создано'],
-                ['Всего предметов', total_items_val, 'Предметов в коллекциях'],
-                ['Предметов в каталоге', stats.get('catalog_count', 0), 'Предметов в общем каталоге'],
-                ['Типов коллекций', len(type_stats), 'Различных типов коллекций'],
-                ['Стран', len(country_stats), 'Стран представлено'],
-                ['Активных коллекционеров', sum(1 for c in collections_count_map.values() if c > 0), 
-                 'Коллекционеров с коллекциями']
-            ]
-            
-            for info_row in info_data:
-                worksheet_viz.write(row, 0, info_row[0], bold_format)
-                worksheet_viz.write_number(row, 1, info_row[1], number_format)
-                worksheet_viz.write(row, 2, info_row[2], text_format)
-                row += 1
-            
-            # Выводы
-            row += 2
-            worksheet_viz.merge_range(f'A{row}:C{row}', 'ВЫВОДЫ ПО АНАЛИТИКЕ', title_format)
-            row += 1
-            
-            active_collectors = sum(1 for c in collections_count_map.values() if c > 0)
-            top_collector_id = max(collections_count_map.items(), key=lambda x: x[1])[0] if collections_count_map else None
-            top_collector_name = collector_name_map.get(top_collector_id, 'Неизвестно') if top_collector_id else 'Неизвестно'
-            top_collections_count = collections_count_map.get(top_collector_id, 0) if top_collector_id else 0
-            
-            conclusions = [
-                f'1. В системе зарегистрировано {total_collectors_val} коллекционеров, из них {active_collectors} активных.',
-                f'2. Создано {total_collections_val} коллекций различных типов.',
-                f'3. В каталоге представлено {stats.get("catalog_count", 0)} предметов.',
-                f'4. Всего в коллекциях содержится {total_items_val} предметов.',
-            ]
-            
-            if type_stats:
-                top_type = max(type_stats, key=lambda x: x.get('count', 0))
-                conclusions.append(f'5. Наиболее популярный тип коллекций: {top_type.get("collection_type")} '
-                                 f'({top_type.get("count")} коллекций).')
-            
-            if country_stats:
-                top_country = max(country_stats, key=lambda x: x.get('collector_count', 0))
-                conclusions.append(f'6. Больше всего коллекционеров в стране: {top_country.get("country")} '
-                                 f'({top_country.get("collector_count")} человек).')
-            
-            if top_collections_count > 0:
-                conclusions.append(f'7. Самый активный коллекционер: {top_collector_name} '
-                                 f'({top_collections_count} коллекций).')
-            
-            for conclusion in conclusions:
-                worksheet_viz.merge_range(row, 0, row, 2, conclusion, text_format)
-                row += 1
-            
-            # Устанавливаем ширину колонок
-            worksheet_viz.set_column('A:A', 30)
-            worksheet_viz.set_column('B:B', 15)
-            worksheet_viz.set_column('C:C', 45)
-            
-            workbook.close()
+            # xlsxwriter занимает процессор на все время записи: пишем книгу в
+            # процессе-рендерере, чтобы не держать GIL и event loop базы данных
+            loop = asyncio.get_running_loop()
+            executor = _get_report_executor()
+            try:
+                await loop.run_in_executor(executor, _write_excel_report, data, filename)
+            except (pickle.PicklingError, concurrent.futures.BrokenExecutor) as e:
+                logger.warning(f"Процесс-рендерер недоступен, Excel пишется в потоке: {e}")
+                if isinstance(e, concurrent.futures.BrokenExecutor):
+                    _discard_report_executor(executor)
+                await loop.run_in_executor(None, _write_excel_report, data, filename)
             self.progress_updated.emit(100)
             
             self.export_finished.emit(filename)
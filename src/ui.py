@@ -2,41 +2,413 @@
 Графический интерфейс приложения
 """
 import sys
+import math
+import functools
+import operator
 import logging
+import time
 from datetime import datetime
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QStackedWidget, QFrame, QTableWidget,
-    QTableWidgetItem, QHeaderView, QMessageBox, QProgressDialog,
-    QFileDialog, QGroupBox, QMenuBar
+    QLabel, QPushButton, QStackedWidget, QFrame, QTableView,
+    QAbstractItemView, QHeaderView, QMessageBox, QProgressDialog,
+    QFileDialog, QGroupBox, QMenuBar, QSizePolicy, QButtonGroup, QDialog
+)
+from PySide6.QtGui import QAction, QFont, QPalette, QColor, QImage, QPixmap
+from PySide6.QtCore import (
+    Qt, QTimer, QDate, QAbstractTableModel, QModelIndex, QRunnable, QThreadPool, Signal
 )
-from PySide6.QtGui import QAction, QFont, QPalette, QColor
-from PySide6.QtCore import Qt, QTimer, QDate
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 
-from database import DatabaseManager
-from reports import ExcelExporter, PDFReportThread
-from models import CollectorDialog, CollectionDialog, CatalogItemDialog
+from database import DatabaseManager, DataKind
+from reports import ExcelExporter, PDFReportThread, stop_reporter_loop
+from models import (
+    CollectorDialog, CollectionDialog, CatalogItemDialog,
+    set_countries, set_collection_types
+)
 import config
 
 logger = logging.getLogger(__name__)
 
+# Что перечитывать после изменения: удаление коллекционера каскадно
+# удаляет его коллекции, поэтому затрагивает и их статистику
+_COLLECTOR_REFRESH = (
+    DataKind.COLLECTORS, DataKind.COLLECTIONS, DataKind.RECENT_COLLECTIONS,
+    DataKind.STATISTICS, DataKind.COLLECTION_TYPES, DataKind.COUNTRY_STATS,
+)
+_COLLECTION_REFRESH = (
+    DataKind.COLLECTIONS, DataKind.RECENT_COLLECTIONS,
+    DataKind.STATISTICS, DataKind.COLLECTION_TYPES,
+)
+_CATALOG_REFRESH = (DataKind.CATALOG, DataKind.STATISTICS)
+MODIFY_REFRESH = {
+    DataKind.COLLECTOR_ADDED: _COLLECTOR_REFRESH,
+    DataKind.COLLECTOR_UPDATED: _COLLECTOR_REFRESH,
+    DataKind.COLLECTOR_DELETED: _COLLECTOR_REFRESH,
+    DataKind.COLLECTION_ADDED: _COLLECTION_REFRESH,
+    DataKind.COLLECTION_UPDATED: _COLLECTION_REFRESH,
+    DataKind.COLLECTION_DELETED: _COLLECTION_REFRESH,
+    DataKind.CATALOG_ITEM_ADDED: _CATALOG_REFRESH,
+    DataKind.CATALOG_ITEM_UPDATED: _CATALOG_REFRESH,
+    DataKind.CATALOG_ITEM_DELETED: _CATALOG_REFRESH,
+    DataKind.COLLECTORS_ADDED: _COLLECTOR_REFRESH,
+    DataKind.COLLECTIONS_ADDED: _COLLECTION_REFRESH,
+    DataKind.CATALOG_ITEMS_ADDED: _CATALOG_REFRESH,
+}
+
+# Повторное открытие вкладки раньше этого срока (с) не перечитывает данные
+TAB_REFRESH_INTERVAL = 1.0
+
+# Круговая диаграмма типов коллекций
+PIE_COLORS = ('#3498db', '#2ecc71', '#9b59b6', '#e74c3c', '#f39c12')
+PIE_KWARGS = {'autopct': '%1.1f%%', 'startangle': 90}
+
+# Колонки таблиц: (заголовок, поле строки БД)
+COLLECTOR_COLUMNS = (
+    ("ID", 'id'), ("Фамилия", 'surname'), ("Имя", 'name'),
+    ("Отчество", 'patronymic'), ("Email", 'email'), ("Страна", 'country'),
+)
+COLLECTION_COLUMNS = (
+    ("ID", 'id'), ("Название", 'name'), ("Автор", 'author'),
+    ("Тип", 'collection_type'), ("Дата создания", 'date_of_creation'),
+    ("Предметов", 'number_of_items'), ("Описание", 'description'),
+)
+CATALOG_COLUMNS = (
+    ("ID", 'id'), ("Название", 'name'), ("Редкость", 'rare'),
+    ("Страна", 'country'), ("Дата выпуска", 'release_date'), ("Описание", 'description'),
+)
+RECENT_COLUMNS = (
+    ("Название", 'name'), ("Автор", 'author'),
+    ("Тип", 'collection_type'), ("Предметы", 'number_of_items'),
+)
+
+# Очередь в GUI-поток без повторного подключения того же слота
+QUEUED_UNIQUE = Qt.ConnectionType(
+    Qt.ConnectionType.QueuedConnection.value | Qt.ConnectionType.UniqueConnection.value
+)
+
+# Общая таблица стилей окна: правила разбираются один раз и наследуются
+# дочерними виджетами; вид кнопок и заголовков задается свойством role.
+MAIN_STYLE = """
+    QLabel[role="page-title"] {
+        font-size: 24px;
+        font-weight: bold;
+        color: #2c3e50;
+        padding: 20px;
+        background-color: #ecf0f1;
+        border-bottom: 2px solid #bdc3c7;
+    }
+    QPushButton[role="primary"], QPushButton[role="danger"] {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        padding: 8px 15px;
+        border-radius: 5px;
+        font-weight: bold;
+        margin: 5px;
+    }
+    QPushButton[role="primary"]:hover {
+        background-color: #2980b9;
+    }
+    QPushButton[role="danger"] {
+        background-color: #e74c3c;
+    }
+    QPushButton[role="danger"]:hover {
+        background-color: #c0392b;
+    }
+    QPushButton[role="primary"]:disabled, QPushButton[role="danger"]:disabled {
+        background-color: #bdc3c7;
+    }
+    QGroupBox {
+        font-weight: bold;
+        font-size: 14px;
+        border: 1px solid #ddd;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+"""
+
+CARD_STYLE = """
+    QFrame {
+        background-color: white;
+        border: 1px solid #ddd;
+        border-radius: 10px;
+        padding: 15px;
+    }
+"""
+
+# Боковое меню
+MENU_STYLE = """
+    QFrame {
+        background-color: #2c3e50;
+        border: none;
+    }
+    QPushButton {
+        background-color: #34495e;
+        color: white;
+        border: none;
+        padding: 15px;
+        text-align: left;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #1abc9c;
+    }
+    QPushButton:pressed {
+        background-color: #16a085;
+    }
+"""
+
+MENU_TITLE_STYLE = """
+    QLabel {
+        background-color: #1abc9c;
+        color: white;
+        font-size: 18px;
+        font-weight: bold;
+        padding: 20px;
+        text-align: center;
+    }
+"""
+
+# Таблица последних коллекций на дашборде
+RECENT_TABLE_STYLE = """
+    QTableView {
+        gridline-color: #ddd;
+        alternate-background-color: #f8f9fa;
+    }
+    QHeaderView::section {
+        background-color: #34495e;
+        color: white;
+        font-weight: bold;
+        padding: 5px;
+        border: none;
+    }
+"""
+
+# Шрифты карточек статистики: (семейство, размер, жирный)
+CARD_FONTS = {
+    'icon': ("Arial", 16, False),
+    'title': ("Arial", 11, True),
+    'value': ("Arial", 24, True),
+    'desc': ("Arial", 10, False),
+}
+
+
+def _cell_text(value):
+    """Текст ячейки таблицы (NULL -> пустая строка)"""
+    return "" if value is None else str(value)
+
+
+class _RenderTask(QRunnable):
+    """Отрисовка фигуры Agg в пуле потоков"""
+
+    def __init__(self, view):
+        super().__init__()
+        self.view = view
+
+    def run(self):
+        canvas = self.view.canvas
+        canvas.draw()
+        buffer = canvas.buffer_rgba()
+        height, width = buffer.shape[:2]
+        self.view.rendered.emit(bytes(buffer), width, height)
+
+
+class ChartView(QLabel):
+    """
+    График дашборда: Figure рисуется Agg вне экрана, а на экран
+    выводится готовым QPixmap. Qt-канвас matplotlib не нужен.
+
+    Полная отрисовка выполняется в отдельном потоке, чтобы не блокировать
+    интерфейс. Пока она идет, фигуру менять нельзя: изменения откладываются
+    через defer() и применяются после вывода кадра.
+    """
+
+    rendered = Signal(bytes, int, int)
+
+    _pool = None
+
+    @classmethod
+    def _render_pool(cls):
+        # Один поток на все графики: matplotlib не рассчитан на
+        # одновременную отрисовку нескольких фигур
+        if cls._pool is None:
+            cls._pool = QThreadPool()
+            cls._pool.setMaxThreadCount(1)
+        return cls._pool
+
+    @classmethod
+    def wait_renders(cls):
+        """Дождаться завершения отрисовок (при закрытии окна)"""
+        if cls._pool is not None:
+            cls._pool.waitForDone()
+
+    def __init__(self, figure, parent=None):
+        super().__init__(parent)
+        self.figure = figure
+        self.canvas = FigureCanvasAgg(figure)
+        self._dpi = figure.dpi
+        self.busy = False
+        self._deferred = None
+        self._resize_pending = False
+        self._redraw = False
+        self.rendered.connect(self._on_rendered)
+        self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+        self.setAlignment(Qt.AlignCenter)
+
+    def draw(self):
+        """Полная отрисовка фигуры в фоновом потоке"""
+        if self.busy:
+            self._redraw = True
+            return
+        self.busy = True
+        self._render_pool().start(_RenderTask(self))
+
+    def defer(self, callback):
+        """Выполнить изменение фигуры после текущей отрисовки (последнее побеждает)"""
+        self._deferred = callback
+
+    def show_buffer(self):
+        """Вывод текущего буфера Agg"""
+        buffer = self.canvas.buffer_rgba()
+        height, width = buffer.shape[:2]
+        self._show_image(QImage(buffer, width, height, QImage.Format.Format_RGBA8888))
+
+    def _show_image(self, image):
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        self.setPixmap(pixmap)
+
+    def _on_rendered(self, data, width, height):
+        self._show_image(QImage(data, width, height, QImage.Format.Format_RGBA8888))
+        self.busy = False
+        callback, self._deferred = self._deferred, None
+        if callback is not None:
+            callback()
+        if self.busy:
+            return
+        if self._resize_pending:
+            self._apply_size()
+        elif self._redraw:
+            self._redraw = False
+            self.draw()
+
+    def _apply_size(self):
+        if self.busy:
+            self._resize_pending = True
+            return
+        self._resize_pending = False
+        self._redraw = False
+        ratio = self.devicePixelRatioF()
+        self.figure.set_dpi(self._dpi * ratio)
+        self.figure.set_size_inches(self.width() / self._dpi, self.height() / self._dpi)
+        self.draw()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.width() <= 0 or self.height() <= 0:
+            return
+        self._apply_size()
+
+
+class RecordTableModel(QAbstractTableModel):
+    """
+    Модель таблицы поверх списка строк из БД (namedtuple).
+
+    Ячейки не создаются заранее: представление запрашивает текст только
+    для видимых строк, а обновление данных - один сброс модели.
+    """
+
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        # columns: [(заголовок, поле строки), ...]
+        self._headers = [header for header, _ in columns]
+        self._getters = [operator.attrgetter(field) for _, field in columns]
+        self._rows = []
+        # Текущая сортировка (колонка, порядок) или None
+        self._sort = None
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = self._sorted(rows) if self._sort else rows
+        self.endResetModel()
+
+    def _sorted(self, rows):
+        column, order = self._sort
+        getter = self._getters[column]
+        # Сравниваются исходные значения: числа - по величине,
+        # пустые - в конце при любом порядке
+        filled = [row for row in rows if getter(row) is not None]
+        empty = [row for row in rows if getter(row) is None]
+        filled.sort(key=getter, reverse=order == Qt.SortOrder.DescendingOrder)
+        return filled + empty
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if column < 0:
+            return
+        self._sort = (column, order)
+        self.layoutAboutToBeChanged.emit()
+        self._rows = self._sorted(self._rows)
+        self.layoutChanged.emit()
+
+    def row_at(self, row):
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._getters)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = self._getters[index.column()](self._rows[index.row()])
+            # Целые (id, число предметов) Qt форматирует сам, без str()
+            return value if type(value) is int else _cell_text(value)
+        if role == Qt.ItemDataRole.EditRole:
+            return self._getters[index.column()](self._rows[index.row()])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return None
+
 
 class DashboardPySide6(QMainWindow):
+    _card_fonts = {}
+
     def __init__(self):
         super().__init__()
         self.db = DatabaseManager()
         self.excel_exporter = ExcelExporter(self.db)
         self.setWindowTitle(f"{config.APP_CONFIG['name']} - Дашборд")
         self.setGeometry(100, 100, 1400, 900)
-        
-        self.countries = []
-        self.collection_types = []
-        self.current_collectors = []
-        self.current_collections = []
-        self.current_catalog = []
+        self.setStyleSheet(MAIN_STYLE)
+        
+        # Модели таблиц живут с окна: данные приходят в них и до того,
+        # как построена страница с таблицей
+        self.collectors_model = RecordTableModel(COLLECTOR_COLUMNS, self)
+        self.collections_model = RecordTableModel(COLLECTION_COLUMNS, self)
+        self.catalog_model = RecordTableModel(CATALOG_COLUMNS, self)
+        self.collectors_table = None
+        self.collections_table = None
+        self.catalog_table = None
+        # DataKind -> время последнего запроса или получения данных
+        self._refreshed_at = {}
+        # Диалоги форм создаются один раз и переиспользуются: класс -> диалог
+        self._dialogs = {}
         
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
@@ -51,39 +423,117 @@ class DashboardPySide6(QMainWindow):
         self.content_area = QStackedWidget()
         main_layout.addWidget(self.content_area)
         
+        # Сообщения об успешных операциях выводятся здесь, без модальных окон
+        self.statusBar()
+        
         self.create_dashboard_page()
-        self.create_collectors_page()
-        self.create_collections_page()
-        self.create_catalog_page()
-        self.create_about_page()
+        
+        # Остальные страницы строятся при первом открытии, до этого
+        # в стеке лежат пустые заглушки.
+        self._page_builders = {
+            1: self.create_collectors_page,
+            2: self.create_collections_page,
+            3: self.create_catalog_page,
+            4: self.create_about_page,
+        }
+        for _ in self._page_builders:
+            self.content_area.addWidget(QWidget())
         
         self.content_area.setCurrentIndex(0)
         
-        self.db.data_loaded.connect(self.on_data_loaded)
-        self.db.error_occurred.connect(self.on_database_error)
-        self.db.connected.connect(self.on_database_connected)
+        # Обработчики результатов БД: индекс списка - значение DataKind
+        self._handlers = [None] * len(DataKind)
+        self._handlers[DataKind.STATISTICS] = self.update_statistics
+        self._handlers[DataKind.COLLECTORS] = self.update_collectors_table
+        self._handlers[DataKind.COLLECTIONS] = self.update_collections_table
+        self._handlers[DataKind.RECENT_COLLECTIONS] = self.update_recent_collections_table
+        self._handlers[DataKind.DASHBOARD] = self.update_dashboard
+        self._handlers[DataKind.CATALOG] = self.update_catalog_table
+        self._handlers[DataKind.COLLECTION_TYPES] = self.update_collection_types_chart
+        self._handlers[DataKind.COUNTRY_STATS] = self.update_country_chart
+        self._handlers[DataKind.COUNTRIES] = set_countries
+        self._handlers[DataKind.COLLECTION_TYPES_LIST] = set_collection_types
+        for data_type in MODIFY_REFRESH:
+            self._handlers[data_type] = functools.partial(self._on_data_modified, data_type)
+        
+        # Обновления после изменений копятся 50 мс и уходят одним refresh_all
+        self._pending_refresh = set()
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(
+            self._do_refresh_all, Qt.ConnectionType.DirectConnection
+        )
         
-        self.excel_exporter.progress_updated.connect(self.on_export_progress)
-        self.excel_exporter.export_finished.connect(self.on_export_finished)
-        self.excel_exporter.export_error.connect(self.on_export_error)
+        # Сигналы БД испускаются из потока event loop: явное QueuedConnection
+        # доставляет их в GUI-поток. Результаты (object) передаются по ссылке,
+        # без копирования списков строк. UniqueConnection исключает повторное
+        # подключение того же обработчика.
+        self.db.data_loaded.connect(self.on_data_loaded, QUEUED_UNIQUE)
+        self.db.error_occurred.connect(self.on_database_error, QUEUED_UNIQUE)
+        self.db.connected.connect(self.on_database_connected, QUEUED_UNIQUE)
+        
+        # Экспорт Excel выполняется в event loop БД: все его сигналы
+        # приходят из другого потока
+        self.excel_exporter.progress_updated.connect(
+            self.on_export_progress, Qt.ConnectionType.QueuedConnection
+        )
+        self.excel_exporter.export_finished.connect(
+            self.on_export_finished, Qt.ConnectionType.QueuedConnection
+        )
+        self.excel_exporter.export_error.connect(
+            self.on_export_error, Qt.ConnectionType.QueuedConnection
+        )
         
         self.db.start()
         
-        QTimer.singleShot(100, self.db.connect)
+        # Подключение ставится в очередь и стартует, как только GUI-цикл
+        # обработает построение окна; connect() сам дождется event loop БД.
+        QTimer.singleShot(0, self.db.connect)
         
         self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.refresh_dashboard)
+        # Таймеры живут в GUI-потоке: прямой вызов без проверки потока
+        self.update_timer.timeout.connect(self.refresh_dashboard, Qt.ConnectionType.DirectConnection)
         self.update_timer.start(config.APP_CONFIG['update_interval'])
         
+        # Один генератор PDF на все отчеты: сигналы подключаются один раз.
+        # Они испускаются из потока отчетов.
+        self.pdf_reports = PDFReportThread(config.DB_CONFIG, parent=self)
+        self.pdf_reports.finished.connect(
+            self.on_pdf_report_finished, Qt.ConnectionType.QueuedConnection
+        )
+        self.pdf_reports.error.connect(
+            self.on_pdf_report_error, Qt.ConnectionType.QueuedConnection
+        )
+        self.pdf_reports.progress.connect(
+            self.on_pdf_report_progress, Qt.ConnectionType.QueuedConnection
+        )
+        
         self.export_progress = None
+        self._last_excel_progress = 0
         self.pdf_progress = None
+        
+        # Сообщения о прогрессе PDF копятся в буфере и выводятся в диалог
+        # не чаще 10 раз в секунду.
+        self._pdf_progress_buffer = None
+        self._pdf_progress_timer = QTimer(self)
+        self._pdf_progress_timer.setInterval(100)
+        self._pdf_progress_timer.setSingleShot(False)
+        self._pdf_progress_timer.timeout.connect(
+            self._flush_pdf_progress, Qt.ConnectionType.DirectConnection
+        )
 
-        # Создаем меню для PDF отчетов
-        self.create_pdf_reports_menu()
-
-    def create_pdf_reports_menu(self):
-        """Создание меню для PDF отчетов"""
-        pdf_menu = self.menuBar().addMenu("📊 PDF Отчеты")
+    def create_menu_bar(self):
+        """Строка меню окна: экспорт и PDF отчеты"""
+        menu_bar = self.menuBar()
+        
+        file_menu = menu_bar.addMenu("Файл")
+        excel_action = QAction("📊 Отчет в Excel", self)
+        excel_action.triggered.connect(self.export_to_excel)
+        excel_action.setToolTip("Экспорт данных и аналитики в Excel")
+        file_menu.addAction(excel_action)
+        
+        pdf_menu = menu_bar.addMenu("📊 PDF Отчеты")
         
         statistical_action = QAction("📈 Статистический отчет", self)
         statistical_action.triggered.connect(self.generate_statistical_report)
@@ -108,14 +558,8 @@ class DashboardPySide6(QMainWindow):
             if filename:
                 self.show_pdf_export_progress("Подготовка к генерации статистического отчета...")
                 
-                # Запуск генерации в отдельном потоке с конфигурацией БД
-                report_thread = PDFReportThread(
-                    config.DB_CONFIG, 'statistical', filename, self
-                )
-                report_thread.finished.connect(self.on_pdf_report_finished)
-                report_thread.error.connect(self.on_pdf_report_error)
-                report_thread.progress.connect(self.on_pdf_report_progress)
-                report_thread.start()
+                # Генерация идет в фоновом event loop отчетов
+                self.pdf_reports.generate('statistical', filename)
                 
         except Exception as e:
             QMessageBox.critical(self, "Ошибка", f"Не удалось начать генерацию отчета: {e}")
@@ -133,13 +577,7 @@ class DashboardPySide6(QMainWindow):
             if filename:
                 self.show_pdf_export_progress("Подготовка к генерации детального отчета...")
                 
-                report_thread = PDFReportThread(
-                    config.DB_CONFIG, 'detailed', filename, self
-                )
-                report_thread.finished.connect(self.on_pdf_report_finished)
-                report_thread.error.connect(self.on_pdf_report_error)
-                report_thread.progress.connect(self.on_pdf_report_progress)
-                report_thread.start()
+                self.pdf_reports.generate('detailed', filename)
                 
         except Exception as e:
             QMessageBox.critical(self, "Ошибка", f"Не удалось начать генерацию отчета: {e}")
@@ -151,17 +589,30 @@ class DashboardPySide6(QMainWindow):
         self.pdf_progress.setWindowModality(Qt.WindowModal)
         self.pdf_progress.setCancelButton(None)  # Отключаем кнопку отмены
         self.pdf_progress.show()
+        self._pdf_progress_buffer = None
+        self._pdf_progress_timer.start()
 
     def on_pdf_report_progress(self, message):
         """Обновление прогресса генерации PDF"""
-        if self.pdf_progress:
-            self.pdf_progress.setLabelText(message)
+        self._pdf_progress_buffer = message
 
-    def on_pdf_report_finished(self, filename):
-        """Обработка завершения генерации PDF"""
+    def _flush_pdf_progress(self):
+        """Вывод последнего сообщения о прогрессе PDF"""
+        if self._pdf_progress_buffer is not None and self.pdf_progress:
+            self.pdf_progress.setLabelText(self._pdf_progress_buffer)
+        self._pdf_progress_buffer = None
+
+    def _stop_pdf_progress(self):
+        """Остановка обновлений и закрытие диалога прогресса PDF"""
+        self._pdf_progress_timer.stop()
+        self._pdf_progress_buffer = None
         if self.pdf_progress:
             self.pdf_progress.close()
             self.pdf_progress = None
+
+    def on_pdf_report_finished(self, filename):
+        """Обработка завершения генерации PDF"""
+        self._stop_pdf_progress()
         
         QMessageBox.information(
             self, 
@@ -172,9 +623,7 @@ class DashboardPySide6(QMainWindow):
 
     def on_pdf_report_error(self, error_message):
         """Обработка ошибки генерации PDF"""
-        if self.pdf_progress:
-            self.pdf_progress.close()
-            self.pdf_progress = None
+        self._stop_pdf_progress()
         
         QMessageBox.critical(self, "Ошибка генерации отчета", 
                            f"Произошла ошибка при генерации PDF отчета:\n\n{error_message}")
@@ -182,43 +631,14 @@ class DashboardPySide6(QMainWindow):
     def create_menu(self):
         self.menu_frame = QFrame()
         self.menu_frame.setFixedWidth(250)
-        self.menu_frame.setStyleSheet("""
-            QFrame {
-                background-color: #2c3e50;
-                border: none;
-            }
-            QPushButton {
-                background-color: #34495e;
-                color: white;
-                border: none;
-                padding: 15px;
-                text-align: left;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1abc9c;
-            }
-            QPushButton:pressed {
-                background-color: #16a085;
-            }
-        """)
+        self.menu_frame.setStyleSheet(MENU_STYLE)
         
         menu_layout = QVBoxLayout(self.menu_frame)
         menu_layout.setContentsMargins(0, 0, 0, 0)
         menu_layout.setSpacing(0)
         
         title_label = QLabel(f"{config.APP_CONFIG['name']}")
-        title_label.setStyleSheet("""
-            QLabel {
-                background-color: #1abc9c;
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 20px;
-                text-align: center;
-            }
-        """)
+        title_label.setStyleSheet(MENU_TITLE_STYLE)
         title_label.setAlignment(Qt.AlignCenter)
         menu_layout.addWidget(title_label)
         
@@ -231,13 +651,23 @@ class DashboardPySide6(QMainWindow):
             ("ℹ️ О платформе", self.show_about)
         ]
         
-        for text, slot in menu_items:
+        # Все кнопки меню в одной группе: одно подключение на все пункты
+        self._menu_slots = [slot for _, slot in menu_items]
+        self.menu_group = QButtonGroup(self.menu_frame)
+        self.menu_group.setExclusive(False)
+        for menu_id, (text, _) in enumerate(menu_items):
             btn = QPushButton(text)
             btn.setFixedHeight(60)
-            btn.clicked.connect(slot)
+            self.menu_group.addButton(btn, menu_id)
             menu_layout.addWidget(btn)
+        self.menu_group.idClicked.connect(self._on_menu, Qt.ConnectionType.DirectConnection)
         
         menu_layout.addStretch()
+        
+        self.create_menu_bar()
+
+    def _on_menu(self, menu_id):
+        self._menu_slots[menu_id]()
 
     def export_to_excel(self):
         try:
@@ -254,6 +684,7 @@ class DashboardPySide6(QMainWindow):
                 self.export_progress.setWindowModality(Qt.WindowModal)
                 self.export_progress.setAutoClose(True)
                 self.export_progress.show()
+                self._last_excel_progress = 0
                 
                 self.excel_exporter.create_excel_report(filename)
                 
@@ -261,6 +692,11 @@ class DashboardPySide6(QMainWindow):
             QMessageBox.critical(self, "Ошибка", f"Не удалось начать экспорт: {e}")
 
     def on_export_progress(self, value):
+        # setValue модального диалога прокручивает цикл событий:
+        # пропускаем обновления меньше чем на 1%
+        if value - self._last_excel_progress < 1 and value < 100:
+            return
+        self._last_excel_progress = value
         if self.export_progress:
             self.export_progress.setValue(value)
 
@@ -331,6 +767,7 @@ class DashboardPySide6(QMainWindow):
         
         cards_data = [
             {
+                "key": "collectors_count",
                 "title": "Коллекционеры",
                 "value": "0",
                 "icon": "👥",
@@ -338,6 +775,7 @@ class DashboardPySide6(QMainWindow):
                 "description": "Всего в базе"
             },
             {
+                "key": "collections_count",
                 "title": "Коллекции",
                 "value": "0",
                 "icon": "📚",
@@ -345,6 +783,7 @@ class DashboardPySide6(QMainWindow):
                 "description": "Всего коллекций"
             },
             {
+                "key": "catalog_count",
                 "title": "Предметы в каталоге",
                 "value": "0",
                 "icon": "🗂️",
@@ -352,6 +791,7 @@ class DashboardPySide6(QMainWindow):
                 "description": "Всего предметов"
             },
             {
+                "key": "items_count",
                 "title": "Предметы в коллекциях",
                 "value": "0",
                 "icon": "📦",
@@ -361,24 +801,31 @@ class DashboardPySide6(QMainWindow):
         ]
         
         self.stat_cards = []
+        # Ключ статистики -> QLabel со значением карточки
+        self.stat_value_labels = {}
         for card_data in cards_data:
-            card = self.create_card(**card_data)
+            key = card_data.pop("key")
+            card, value_label = self.create_card(**card_data)
             self.stat_cards.append(card)
+            self.stat_value_labels[key] = value_label
             layout.addWidget(card)
         
         return section
 
+    @classmethod
+    def _card_font(cls, role):
+        """Общий QFont для элементов карточек (создается один раз)"""
+        font = cls._card_fonts.get(role)
+        if font is None:
+            family, size, bold = CARD_FONTS[role]
+            font = QFont(family, size, QFont.Weight.Bold) if bold else QFont(family, size)
+            cls._card_fonts[role] = font
+        return font
+
     def create_card(self, title, value, icon, color, description):
         card = QFrame()
         card.setFrameStyle(QFrame.Shape.StyledPanel)
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 10px;
-                padding: 15px;
-            }}
-        """)
+        card.setStyleSheet(CARD_STYLE)
         
         layout = QVBoxLayout(card)
         layout.setSpacing(8)
@@ -387,11 +834,11 @@ class DashboardPySide6(QMainWindow):
         top_layout = QHBoxLayout()
         
         icon_label = QLabel(icon)
-        icon_label.setFont(QFont("Arial", 16))
+        icon_label.setFont(self._card_font('icon'))
         top_layout.addWidget(icon_label)
         
         title_label = QLabel(title)
-        title_label.setFont(QFont("Arial", 11, QFont.Weight.Bold))
+        title_label.setFont(self._card_font('title'))
         title_label.setStyleSheet("color: #7f8c8d;")
         top_layout.addWidget(title_label)
         
@@ -399,111 +846,66 @@ class DashboardPySide6(QMainWindow):
         layout.addLayout(top_layout)
         
         value_label = QLabel(value)
-        value_label.setFont(QFont("Arial", 24, QFont.Weight.Bold))
+        value_label.setFont(self._card_font('value'))
         value_label.setStyleSheet(f"color: {color};")
         value_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(value_label)
         
         desc_label = QLabel(description)
-        desc_label.setFont(QFont("Arial", 10))
+        desc_label.setFont(self._card_font('desc'))
         desc_label.setStyleSheet("color: #95a5a6;")
         desc_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(desc_label)
         
-        return card
+        return card, value_label
 
     def create_collection_types_chart(self):
         group_box = QGroupBox("Распределение по типам коллекций")
-        group_box.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 14px;
-                border: 1px solid #ddd;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-        
         layout = QVBoxLayout(group_box)
         
         self.type_fig = Figure(figsize=(10, 6), facecolor='white')
-        self.type_canvas = FigureCanvas(self.type_fig)
+        self.type_chart = ChartView(self.type_fig)
+        self.type_ax = self.type_fig.add_subplot(111)
+        self.type_ax.set_axis_off()
+        self._type_blit = None
+        self._types_signature = None
+        self.type_chart.canvas.mpl_connect(
+            'draw_event', lambda event: self._on_chart_draw(self.type_chart.canvas, self._type_blit)
+        )
         
-        layout.addWidget(self.type_canvas)
+        layout.addWidget(self.type_chart)
         
         return group_box
 
     def create_country_chart(self):
         group_box = QGroupBox("Коллекционеры по странам")
-        group_box.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 14px;
-                border: 1px solid #ddd;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-        
         layout = QVBoxLayout(group_box)
         
-        self.country_fig = Figure(figsize=(10, 6), facecolor='white')
-        self.country_canvas = FigureCanvas(self.country_fig)
+        # Подписи стран поворачиваются: tight layout пересчитывается при каждой
+        # полной отрисовке, в том числе после изменения размера
+        self.country_fig = Figure(figsize=(10, 6), facecolor='white', layout='tight')
+        self.country_chart = ChartView(self.country_fig)
+        self.country_ax = self.country_fig.add_subplot(111)
+        self.country_ax.set_axis_off()
+        self._country_blit = None
+        self._country_signature = None
+        self.country_chart.canvas.mpl_connect(
+            'draw_event', lambda event: self._on_chart_draw(self.country_chart.canvas, self._country_blit)
+        )
         
-        layout.addWidget(self.country_canvas)
+        layout.addWidget(self.country_chart)
         
         return group_box
 
     def create_recent_collections_table(self):
         group_box = QGroupBox("Последние коллекции")
-        group_box.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                font-size: 14px;
-                border: 1px solid #ddd;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
-        
         layout = QVBoxLayout(group_box)
         
-        self.recent_table = QTableWidget()
-        self.recent_table.setColumnCount(4)
-        self.recent_table.setHorizontalHeaderLabels(["Название", "Автор", "Тип", "Предметы"])
+        self.recent_table = QTableView()
+        self.recent_table.setModel(RecordTableModel(RECENT_COLUMNS, self.recent_table))
         
         self.recent_table.setAlternatingRowColors(True)
-        self.recent_table.setStyleSheet("""
-            QTableWidget {
-                gridline-color: #ddd;
-                alternate-background-color: #f8f9fa;
-            }
-            QHeaderView::section {
-                background-color: #34495e;
-                color: white;
-                font-weight: bold;
-                padding: 5px;
-                border: none;
-            }
-        """)
+        self.recent_table.setStyleSheet(RECENT_TABLE_STYLE)
         
         header = self.recent_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
@@ -512,294 +914,92 @@ class DashboardPySide6(QMainWindow):
         
         return group_box
 
-    def create_collectors_page(self):
+    def _make_crud_page(self, title, add_text, model, handlers):
+        """Страница справочника: заголовок, панель кнопок и таблица.
+
+        model - RecordTableModel с данными таблицы.
+        Возвращает (страница, кнопки добавления/редактирования/удаления, таблица).
+        """
         page = QWidget()
         layout = QVBoxLayout(page)
         
-        title = QLabel("Коллекционеры")
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #2c3e50;
-                padding: 20px;
-                background-color: #ecf0f1;
-                border-bottom: 2px solid #bdc3c7;
-            }
-        """)
-        layout.addWidget(title)
+        title_label = QLabel(title)
+        title_label.setProperty("role", "page-title")
+        layout.addWidget(title_label)
         
         toolbar_layout = QHBoxLayout()
         
-        self.add_collector_btn = QPushButton("➕ Добавить коллекционера")
-        self.edit_collector_btn = QPushButton("✏️ Редактировать")
-        self.delete_collector_btn = QPushButton("🗑️ Удалить")
+        add_btn = QPushButton(add_text)
+        edit_btn = QPushButton("✏️ Редактировать")
+        delete_btn = QPushButton("🗑️ Удалить")
         refresh_btn = QPushButton("🔄 Обновить")
         
-        button_style = """
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-        """
-        
-        delete_style = """
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-        """
-        
-        self.add_collector_btn.setStyleSheet(button_style)
-        self.edit_collector_btn.setStyleSheet(button_style)
-        self.delete_collector_btn.setStyleSheet(delete_style)
-        refresh_btn.setStyleSheet(button_style)
+        add_btn.setProperty("role", "primary")
+        edit_btn.setProperty("role", "primary")
+        delete_btn.setProperty("role", "danger")
+        refresh_btn.setProperty("role", "primary")
         
-        self.add_collector_btn.clicked.connect(self.add_collector)
-        self.edit_collector_btn.clicked.connect(self.edit_collector)
-        self.delete_collector_btn.clicked.connect(self.delete_collector)
-        refresh_btn.clicked.connect(self.refresh_collectors)
+        add_btn.clicked.connect(handlers['add'])
+        edit_btn.clicked.connect(handlers['edit'])
+        delete_btn.clicked.connect(handlers['delete'])
+        refresh_btn.clicked.connect(handlers['refresh'])
         
-        toolbar_layout.addWidget(self.add_collector_btn)
-        toolbar_layout.addWidget(self.edit_collector_btn)
-        toolbar_layout.addWidget(self.delete_collector_btn)
+        toolbar_layout.addWidget(add_btn)
+        toolbar_layout.addWidget(edit_btn)
+        toolbar_layout.addWidget(delete_btn)
         toolbar_layout.addStretch()
         toolbar_layout.addWidget(refresh_btn)
         
         layout.addLayout(toolbar_layout)
         
-        self.collectors_table = QTableWidget()
-        self.collectors_table.setColumnCount(6)
-        self.collectors_table.setHorizontalHeaderLabels(["ID", "Фамилия", "Имя", "Отчество", "Email", "Страна"])
-        self.collectors_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.collectors_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.collectors_table.setSelectionMode(QTableWidget.SingleSelection)
+        table = QTableView()
+        table.setModel(model)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        # Сортировка по заголовку; до первого щелчка - порядок из БД
+        table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        table.setSortingEnabled(True)
         
-        self.collectors_table.setColumnHidden(0, True)
+        table.setColumnHidden(0, True)
         
-        layout.addWidget(self.collectors_table)
+        layout.addWidget(table)
         
-        self.content_area.addWidget(page)
+        return page, (add_btn, edit_btn, delete_btn), table
+
+    def create_collectors_page(self):
+        page, buttons, self.collectors_table = self._make_crud_page(
+            "Коллекционеры", "➕ Добавить коллекционера",
+            self.collectors_model,
+            {'add': self.add_collector, 'edit': self.edit_collector,
+             'delete': self.delete_collector, 'refresh': self.refresh_collectors})
+        self.add_collector_btn, self.edit_collector_btn, self.delete_collector_btn = buttons
+        return page
 
     def create_collections_page(self):
-        page = QWidget()
-        layout = QVBoxLayout(page)
-        
-        title = QLabel("Коллекции")
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #2c3e50;
-                padding: 20px;
-                background-color: #ecf0f1;
-                border-bottom: 2px solid #bdc3c7;
-            }
-        """)
-        layout.addWidget(title)
-        
-        toolbar_layout = QHBoxLayout()
-        
-        self.add_collection_btn = QPushButton("➕ Добавить коллекцию")
-        self.edit_collection_btn = QPushButton("✏️ Редактировать")
-        self.delete_collection_btn = QPushButton("🗑️ Удалить")
-        refresh_btn = QPushButton("🔄 Обновить")
-        
-        button_style = """
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-        """
-        
-        delete_style = """
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-        """
-        
-        self.add_collection_btn.setStyleSheet(button_style)
-        self.edit_collection_btn.setStyleSheet(button_style)
-        self.delete_collection_btn.setStyleSheet(delete_style)
-        refresh_btn.setStyleSheet(button_style)
-        
-        self.add_collection_btn.clicked.connect(self.add_collection)
-        self.edit_collection_btn.clicked.connect(self.edit_collection)
-        self.delete_collection_btn.clicked.connect(self.delete_collection)
-        refresh_btn.clicked.connect(self.refresh_collections)
-        
-        toolbar_layout.addWidget(self.add_collection_btn)
-        toolbar_layout.addWidget(self.edit_collection_btn)
-        toolbar_layout.addWidget(self.delete_collection_btn)
-        toolbar_layout.addStretch()
-        toolbar_layout.addWidget(refresh_btn)
-        
-        layout.addLayout(toolbar_layout)
-        
-        self.collections_table = QTableWidget()
-        self.collections_table.setColumnCount(7)
-        self.collections_table.setHorizontalHeaderLabels(["ID", "Название", "Автор", "Тип", "Дата создания", "Предметов", "Описание"])
-        self.collections_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.collections_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.collections_table.setSelectionMode(QTableWidget.SingleSelection)
-        
-        self.collections_table.setColumnHidden(0, True)
-        
-        layout.addWidget(self.collections_table)
-        
-        self.content_area.addWidget(page)
+        page, buttons, self.collections_table = self._make_crud_page(
+            "Коллекции", "➕ Добавить коллекцию",
+            self.collections_model,
+            {'add': self.add_collection, 'edit': self.edit_collection,
+             'delete': self.delete_collection, 'refresh': self.refresh_collections})
+        self.add_collection_btn, self.edit_collection_btn, self.delete_collection_btn = buttons
+        return page
 
     def create_catalog_page(self):
-        page = QWidget()
-        layout = QVBoxLayout(page)
-        
-        title = QLabel("Каталог")
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #2c3e50;
-                padding: 20px;
-                background-color: #ecf0f1;
-                border-bottom: 2px solid #bdc3c7;
-            }
-        """)
-        layout.addWidget(title)
-        
-        toolbar_layout = QHBoxLayout()
-        
-        self.add_catalog_btn = QPushButton("➕ Добавить предмет")
-        self.edit_catalog_btn = QPushButton("✏️ Редактировать")
-        self.delete_catalog_btn = QPushButton("🗑️ Удалить")
-        refresh_btn = QPushButton("🔄 Обновить")
-        
-        button_style = """
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-        """
-        
-        delete_style = """
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-                margin: 5px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-        """
-        
-        self.add_catalog_btn.setStyleSheet(button_style)
-        self.edit_catalog_btn.setStyleSheet(button_style)
-        self.delete_catalog_btn.setStyleSheet(delete_style)
-        refresh_btn.setStyleSheet(button_style)
-        
-        self.add_catalog_btn.clicked.connect(self.add_catalog_item)
-        self.edit_catalog_btn.clicked.connect(self.edit_catalog_item)
-        self.delete_catalog_btn.clicked.connect(self.delete_catalog_item)
-        refresh_btn.clicked.connect(self.refresh_catalog)
-        
-        toolbar_layout.addWidget(self.add_catalog_btn)
-        toolbar_layout.addWidget(self.edit_catalog_btn)
-        toolbar_layout.addWidget(self.delete_catalog_btn)
-        toolbar_layout.addStretch()
-        toolbar_layout.addWidget(refresh_btn)
-        
-        layout.addLayout(toolbar_layout)
-        
-        self.catalog_table = QTableWidget()
-        self.catalog_table.setColumnCount(6)
-        self.catalog_table.setHorizontalHeaderLabels(["ID", "Название", "Редкость", "Страна", "Дата выпуска", "Описание"])
-        self.catalog_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.catalog_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.catalog_table.setSelectionMode(QTableWidget.SingleSelection)
-        
-        self.catalog_table.setColumnHidden(0, True)
-        
-        layout.addWidget(self.catalog_table)
-        
-        self.content_area.addWidget(page)
+        page, buttons, self.catalog_table = self._make_crud_page(
+            "Каталог", "➕ Добавить предмет",
+            self.catalog_model,
+            {'add': self.add_catalog_item, 'edit': self.edit_catalog_item,
+             'delete': self.delete_catalog_item, 'refresh': self.refresh_catalog})
+        self.add_catalog_btn, self.edit_catalog_btn, self.delete_catalog_btn = buttons
+        return page
 
     def create_about_page(self):
         page = QWidget()
         layout = QVBoxLayout(page)
         
         title = QLabel("О платформе")
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #2c3e50;
-                padding: 20px;
-                background-color: #ecf0f1;
-                border-bottom: 2px solid #bdc3c7;
-            }
-        """)
+        title.setProperty("role", "page-title")
         layout.addWidget(title)
         
         content = QLabel(
@@ -821,94 +1021,138 @@ class DashboardPySide6(QMainWindow):
         content.setWordWrap(True)
         layout.addWidget(content)
         
-        self.content_area.addWidget(page)
+        return page
 
     def on_database_connected(self):
         logger.info("База данных подключена, загружаем начальные данные")
         self.refresh_all_data()
+        # Диалоги строятся заранее, когда окно уже показано
+        QTimer.singleShot(0, self._prewarm_dialogs)
+
+    def _prewarm_dialogs(self):
+        for dialog_class in (CollectorDialog, CollectionDialog, CatalogItemDialog):
+            if dialog_class not in self._dialogs:
+                self._dialogs[dialog_class] = dialog_class(self)
+
+    def _form_dialog(self, dialog_class, record=None):
+        """Готовый диалог формы, заполненный из record (или пустой)"""
+        dialog = self._dialogs.get(dialog_class)
+        if dialog is None:
+            dialog = self._dialogs[dialog_class] = dialog_class(self)
+        dialog.reset(record)
+        return dialog
 
     def refresh_all_data(self):
-        self.db.get_statistics()
-        self.db.get_collectors()
-        self.db.get_collections()
-        self.db.get_catalog()
-        self.db.get_collection_types_stats()
-        self.db.get_country_stats()
-        self.db.get_countries()
-        self.db.get_collection_types()
+        self.db.refresh_all()
 
     def on_data_loaded(self, data_type, data):
-        logger.info(f"Данные получены: {data_type}")
+        logger.info("Данные получены: %s", DataKind(data_type))
+        self._refreshed_at[data_type] = time.monotonic()
         
+        handler = self._handlers[data_type]
+        if handler is None:
+            return
         try:
-            if data_type == 'statistics':
-                self.update_statistics(data)
-            elif data_type == 'collectors':
-                self.update_collectors_table(data)
-            elif data_type == 'collections':
-                self.update_collections_table(data)
-                self.update_recent_collections_table(data)
-            elif data_type == 'catalog':
-                self.update_catalog_table(data)
-            elif data_type == 'collection_types':
-                self.update_collection_types_chart(data)
-            elif data_type == 'country_stats':
-                self.update_country_chart(data)
-            elif data_type == 'countries':
-                self.countries = data or []
-            elif data_type == 'collection_types_list':
-                self.collection_types = data or []
-            elif data_type in ['collector_added', 'collector_updated', 'collector_deleted',
-                              'collection_added', 'collection_updated', 'collection_deleted',
-                              'catalog_item_added', 'catalog_item_updated', 'catalog_item_deleted']:
-                self.refresh_all_data()
-                QMessageBox.information(self, "Успех", "Операция выполнена успешно!")
+            handler(data)
         except Exception as e:
-            logger.error(f"Ошибка при обработке данных {data_type}: {e}")
+            logger.error(f"Ошибка при обработке данных {DataKind(data_type)}: {e}")
+
+    def _on_data_modified(self, data_type, result):
+        self._pending_refresh.update(MODIFY_REFRESH[data_type])
+        self._refresh_timer.start()
+        self.statusBar().showMessage("Операция выполнена успешно", 3000)
+
+    def _do_refresh_all(self):
+        data_types, self._pending_refresh = list(self._pending_refresh), set()
+        if data_types:
+            self.db.refresh_all(data_types)
 
     def on_database_error(self, error_message):
         logger.error(f"Ошибка БД: {error_message}")
         QMessageBox.critical(self, "Ошибка базы данных", error_message)
 
+    def update_dashboard(self, snapshot):
+        for data_type, data in snapshot.items():
+            self._handlers[data_type](data)
+
     def update_statistics(self, stats):
         if stats:
-            card_data = [
-                ("collectors_count", 0),
-                ("collections_count", 1),
-                ("catalog_count", 2),
-                ("items_count", 3)
-            ]
-            
-            for key, index in card_data:
-                if index < len(self.stat_cards):
-                    card = self.stat_cards[index]
-                    value_label = card.layout().itemAt(1).widget()
-                    if value_label and isinstance(value_label, QLabel):
-                        value_label.setText(str(stats.get(key, 0)))
+            for key, value_label in self.stat_value_labels.items():
+                value_label.setText(str(stats.get(key, 0)))
+
+    def _on_chart_draw(self, canvas, blit):
+        """Полная перерисовка графика: запоминаем фон и дорисовываем данные.
+        Вызывается из потока отрисовки ChartView."""
+        if blit is None:
+            return
+        blit['background'] = canvas.copy_from_bbox(canvas.figure.bbox)
+        for artist in blit['artists']:
+            blit['ax'].draw_artist(artist)
+
+    def _blit_chart(self, chart, blit):
+        """Перерисовка только изменившихся элементов поверх сохраненного фона"""
+        if blit['background'] is None:
+            chart.draw()
+            return
+        chart.canvas.restore_region(blit['background'])
+        for artist in blit['artists']:
+            blit['ax'].draw_artist(artist)
+        chart.show_buffer()
+
+    def _make_chart_blit(self, ax, key, artists, **parts):
+        """Кэш для частичной перерисовки: данные рисуются поверх фона"""
+        for artist in artists:
+            artist.set_animated(True)
+        return dict(ax=ax, key=key, artists=artists, background=None, **parts)
 
     def update_collection_types_chart(self, data):
         if data:
-            self.type_fig.clear()
-            ax = self.type_fig.add_subplot(111)
+            if self.type_chart.busy:
+                self.type_chart.defer(functools.partial(self.update_collection_types_chart, data))
+                return
+            # Данные не изменились с прошлой отрисовки: график уже актуален
+            signature = tuple(data)
+            if signature == self._types_signature:
+                return
+            self._types_signature = signature
             
             types = []
             counts = []
             for item in data:
-                collection_type = item.get('collection_type', 'Неизвестно')
-                count = item.get('count', 0)
+                collection_type = item.collection_type
+                count = item.count
                 if collection_type and count > 0:
                     types.append(collection_type)
                     counts.append(count)
             
+            # Те же категории: пересчитываем секторы без полной перерисовки
+            blit = self._type_blit
+            if blit is not None and blit['key'] == tuple(types):
+                total = float(sum(counts))
+                theta1 = float(PIE_KWARGS['startangle'])
+                for wedge, label, autotext, count in zip(
+                        blit['wedges'], blit['texts'], blit['autotexts'], counts):
+                    frac = count / total
+                    theta2 = theta1 + 360.0 * frac
+                    wedge.set_theta1(theta1)
+                    wedge.set_theta2(theta2)
+                    thetam = math.radians((theta1 + theta2) / 2)
+                    x, y = math.cos(thetam), math.sin(thetam)
+                    label.set_position((1.1 * x, 1.1 * y))
+                    label.set_horizontalalignment('left' if x > 0 else 'right')
+                    autotext.set_position((0.6 * x, 0.6 * y))
+                    autotext.set_text('%1.1f%%' % (100 * frac))
+                    theta1 = theta2
+                self._blit_chart(self.type_chart, blit)
+                return
+            
+            self._type_blit = None
+            ax = self.type_ax
+            ax.clear()
+            
             if types and counts:
-                colors = ['#3498db', '#2ecc71', '#9b59b6', '#e74c3c', '#f39c12']
-                
                 wedges, texts, autotexts = ax.pie(
-                    counts,
-                    labels=types,
-                    autopct='%1.1f%%',
-                    colors=colors[:len(types)],
-                    startangle=90
+                    counts, labels=types, colors=PIE_COLORS[:len(types)], **PIE_KWARGS
                 )
                 
                 for autotext in autotexts:
@@ -916,28 +1160,59 @@ class DashboardPySide6(QMainWindow):
                     autotext.set_fontweight('bold')
                 
                 ax.set_title('Распределение по типам коллекций', fontweight='bold')
+                self._type_blit = self._make_chart_blit(
+                    ax, tuple(types), [*wedges, *texts, *autotexts],
+                    wedges=wedges, texts=texts, autotexts=autotexts
+                )
             else:
                 ax.text(0.5, 0.5, 'Нет данных\nдля отображения', 
                        horizontalalignment='center', verticalalignment='center',
                        transform=ax.transAxes, fontsize=14)
                 ax.set_title('Распределение по типам коллекций', fontweight='bold')
             
-            self.type_canvas.draw()
+            self.type_chart.draw()
 
     def update_country_chart(self, data):
         if data:
-            self.country_fig.clear()
-            ax = self.country_fig.add_subplot(111)
+            if self.country_chart.busy:
+                self.country_chart.defer(functools.partial(self.update_country_chart, data))
+                return
+            signature = tuple(data)
+            if signature == self._country_signature:
+                return
+            self._country_signature = signature
             
             countries = []
             counts = []
             for item in data:
-                country = item.get('country', 'Неизвестно')
-                count = item.get('collector_count', 0)
+                country = item.country
+                count = item.collector_count
                 if country and count > 0:
                     countries.append(country)
                     counts.append(count)
             
+            # Те же страны: меняем высоты существующих столбцов
+            blit = self._country_blit
+            if blit is not None and blit['key'] == tuple(countries):
+                for bar, label, count in zip(blit['bars'], blit['labels'], counts):
+                    bar.set_height(count)
+                    label.set_y(count)
+                    label.set_text(f'{count}')
+                peak = max(counts)
+                if peak == blit['peak']:
+                    # Шкала оси не меняется: достаточно дорисовать столбцы
+                    self._blit_chart(self.country_chart, blit)
+                else:
+                    blit['peak'] = peak
+                    blit['ax'].relim()
+                    blit['ax'].autoscale_view()
+                    self.country_chart.draw()
+                return
+            
+            self._country_blit = None
+            ax = self.country_ax
+            ax.clear()
+            
             if countries and counts:
                 bars = ax.bar(countries, counts, color='#1abc9c', alpha=0.8)
                 
@@ -945,141 +1220,69 @@ class DashboardPySide6(QMainWindow):
                 ax.set_ylabel('Количество коллекционеров')
                 ax.tick_params(axis='x', rotation=45)
                 
+                labels = []
                 for bar, count in zip(bars, counts):
                     height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height,
-                           f'{count}', ha='center', va='bottom')
+                    labels.append(ax.text(bar.get_x() + bar.get_width()/2., height,
+                                          f'{count}', ha='center', va='bottom'))
+                self._country_blit = self._make_chart_blit(
+                    ax, tuple(countries), [*bars, *labels],
+                    bars=bars, labels=labels, peak=max(counts)
+                )
             else:
                 ax.text(0.5, 0.5, 'Нет данных\nдля отображения', 
                        horizontalalignment='center', verticalalignment='center',
                        transform=ax.transAxes, fontsize=14)
                 ax.set_title('Коллекционеры по странам', fontweight='bold')
             
-            self.country_fig.tight_layout()
-            self.country_canvas.draw()
+            self.country_chart.draw()
 
     def update_recent_collections_table(self, collections):
         if collections:
-            recent_collections = collections[-8:] if len(collections) > 8 else collections
-            self.recent_table.setRowCount(len(recent_collections))
-            
-            for row, collection in enumerate(recent_collections):
-                name = collection.get('name', '')
-                author = collection.get('author', '')
-                collection_type = collection.get('collection_type', '')
-                number_of_items = collection.get('number_of_items', 0)
-                
-                self.recent_table.setItem(row, 0, QTableWidgetItem(name))
-                self.recent_table.setItem(row, 1, QTableWidgetItem(author))
-                self.recent_table.setItem(row, 2, QTableWidgetItem(collection_type))
-                self.recent_table.setItem(row, 3, QTableWidgetItem(str(number_of_items)))
+            self.recent_table.model().set_rows(collections)
 
     def update_collectors_table(self, collectors):
-        self.current_collectors = collectors
         if collectors:
-            self.collectors_table.setRowCount(len(collectors))
-            for row, collector in enumerate(collectors):
-                collector_id = collector.get('id', '')
-                surname = collector.get('surname', '')
-                name = collector.get('name', '')
-                patronymic = collector.get('patronymic', '')
-                email = collector.get('email', '')
-                country = collector.get('country', '')
-
-                self.collectors_table.setItem(row, 0, QTableWidgetItem(str(collector_id)))
-                self.collectors_table.setItem(row, 1, QTableWidgetItem(surname))
-                self.collectors_table.setItem(row, 2, QTableWidgetItem(name))
-                self.collectors_table.setItem(row, 3, QTableWidgetItem(patronymic))
-                self.collectors_table.setItem(row, 4, QTableWidgetItem(email))
-                self.collectors_table.setItem(row, 5, QTableWidgetItem(country))
+            self.collectors_model.set_rows(collectors)
 
     def update_collections_table(self, collections):
-        self.current_collections = collections
         if collections:
-            self.collections_table.setRowCount(len(collections))
-            for row, collection in enumerate(collections):
-                collection_id = collection.get('id', '')
-                name = collection.get('name', '')
-                author = collection.get('author', '')
-                collection_type = collection.get('collection_type', '')
-                
-                date_creation = collection.get('date_of_creation')
-                if date_creation:
-                    if isinstance(date_creation, str):
-                        date_str = date_creation
-                    else:
-                        date_str = str(date_creation)
-                else:
-                    date_str = ""
-                
-                number_of_items = collection.get('number_of_items', 0)
-                description = collection.get('description', '')
-                
-                self.collections_table.setItem(row, 0, QTableWidgetItem(str(collection_id)))
-                self.collections_table.setItem(row, 1, QTableWidgetItem(name))
-                self.collections_table.setItem(row, 2, QTableWidgetItem(author))
-                self.collections_table.setItem(row, 3, QTableWidgetItem(collection_type))
-                self.collections_table.setItem(row, 4, QTableWidgetItem(date_str))
-                self.collections_table.setItem(row, 5, QTableWidgetItem(str(number_of_items)))
-                self.collections_table.setItem(row, 6, QTableWidgetItem(description))
+            self.collections_model.set_rows(collections)
 
     def update_catalog_table(self, catalog):
-        self.current_catalog = catalog
         if catalog:
-            self.catalog_table.setRowCount(len(catalog))
-            for row, item in enumerate(catalog):
-                item_id = item.get('id', '')
-                name = item.get('name', '')
-                rare = item.get('rare', '')
-                country = item.get('country', '')
-                
-                release_date = item.get('release_date')
-                if release_date:
-                    if isinstance(release_date, str):
-                        date_str = release_date
-                    else:
-                        date_str = str(release_date)
-                else:
-                    date_str = ""
-                
-                description = item.get('description', '')
-                
-                self.catalog_table.setItem(row, 0, QTableWidgetItem(str(item_id)))
-                self.catalog_table.setItem(row, 1, QTableWidgetItem(name))
-                self.catalog_table.setItem(row, 2, QTableWidgetItem(rare))
-                self.catalog_table.setItem(row, 3, QTableWidgetItem(country))
-                self.catalog_table.setItem(row, 4, QTableWidgetItem(date_str))
-                self.catalog_table.setItem(row, 5, QTableWidgetItem(description))
+            self.catalog_model.set_rows(catalog)
+
+    @staticmethod
+    def _current_record(table):
+        """Строка БД, выбранная в таблице, или None"""
+        row = table.currentIndex().row()
+        return table.model().row_at(row) if row >= 0 else None
 
     def add_collector(self):
-        dialog = CollectorDialog(self, countries=self.countries)
+        dialog = self._form_dialog(CollectorDialog)
         if dialog.exec() == QDialog.Accepted:
             data = dialog.get_data()
             self.db.add_collector(data)
 
     def edit_collector(self):
-        current_row = self.collectors_table.currentRow()
-        if current_row < 0:
+        collector = self._current_record(self.collectors_table)
+        if collector is None:
             QMessageBox.warning(self, "Предупреждение", "Выберите коллекционера для редактирования")
             return
         
-        collector_id = int(self.collectors_table.item(current_row, 0).text())
-        collector = next((c for c in self.current_collectors if c['id'] == collector_id), None)
-        
-        if collector:
-            dialog = CollectorDialog(self, collector=collector, countries=self.countries)
-            if dialog.exec() == QDialog.Accepted:
-                data = dialog.get_data()
-                self.db.update_collector(collector_id, data)
+        dialog = self._form_dialog(CollectorDialog, collector._asdict())
+        if dialog.exec() == QDialog.Accepted:
+            data = dialog.get_data()
+            self.db.update_collector(collector.id, data)
 
     def delete_collector(self):
-        current_row = self.collectors_table.currentRow()
-        if current_row < 0:
+        collector = self._current_record(self.collectors_table)
+        if collector is None:
             QMessageBox.warning(self, "Предупреждение", "Выберите коллекционера для удаления")
             return
         
-        collector_id = int(self.collectors_table.item(current_row, 0).text())
-        collector_name = self.collectors_table.item(current_row, 1).text()
+        collector_name = _cell_text(collector.surname)
         
         reply = QMessageBox.question(
             self, "Подтверждение удаления", 
@@ -1088,37 +1291,32 @@ class DashboardPySide6(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            self.db.delete_collector(collector_id)
+            self.db.delete_collector(collector.id)
 
     def add_collection(self):
-        dialog = CollectionDialog(self, collection_types=self.collection_types)
+        dialog = self._form_dialog(CollectionDialog)
         if dialog.exec() == QDialog.Accepted:
             data = dialog.get_data()
             self.db.add_collection(data)
 
     def edit_collection(self):
-        current_row = self.collections_table.currentRow()
-        if current_row < 0:
+        collection = self._current_record(self.collections_table)
+        if collection is None:
             QMessageBox.warning(self, "Предупреждение", "Выберите коллекцию для редактирования")
             return
         
-        collection_id = int(self.collections_table.item(current_row, 0).text())
-        collection = next((c for c in self.current_collections if c['id'] == collection_id), None)
-        
-        if collection:
-            dialog = CollectionDialog(self, collection=collection, collection_types=self.collection_types)
-            if dialog.exec() == QDialog.Accepted:
-                data = dialog.get_data()
-                self.db.update_collection(collection_id, data)
+        dialog = self._form_dialog(CollectionDialog, collection._asdict())
+        if dialog.exec() == QDialog.Accepted:
+            data = dialog.get_data()
+            self.db.update_collection(collection.id, data)
 
     def delete_collection(self):
-        current_row = self.collections_table.currentRow()
-        if current_row < 0:
+        collection = self._current_record(self.collections_table)
+        if collection is None:
             QMessageBox.warning(self, "Предупреждение", "Выберите коллекцию для удаления")
             return
         
-        collection_id = int(self.collections_table.item(current_row, 0).text())
-        collection_name = self.collections_table.item(current_row, 1).text()
+        collection_name = _cell_text(collection.name)
         
         reply = QMessageBox.question(
             self, "Подтверждение удаления", 
@@ -1127,37 +1325,32 @@ class DashboardPySide6(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            self.db.delete_collection(collection_id)
+            self.db.delete_collection(collection.id)
 
     def add_catalog_item(self):
-        dialog = CatalogItemDialog(self, countries=self.countries)
+        dialog = self._form_dialog(CatalogItemDialog)
         if dialog.exec() == QDialog.Accepted:
             data = dialog.get_data()
             self.db.add_catalog_item(data)
 
     def edit_catalog_item(self):
-        current_row = self.catalog_table.currentRow()
-        if current_row < 0:
+        item = self._current_record(self.catalog_table)
+        if item is None:
             QMessageBox.warning(self, "Предупреждение", "Выберите предмет каталога для редактирования")
             return
         
-        item_id = int(self.catalog_table.item(current_row, 0).text())
-        item = next((i for i in self.current_catalog if i['id'] == item_id), None)
-        
-        if item:
-            dialog = CatalogItemDialog(self, item=item, countries=self.countries)
-            if dialog.exec() == QDialog.Accepted:
-                data = dialog.get_data()
-                self.db.update_catalog_item(item_id, data)
+        dialog = self._form_dialog(CatalogItemDialog, item._asdict())
+        if dialog.exec() == QDialog.Accepted:
+            data = dialog.get_data()
+            self.db.update_catalog_item(item.id, data)
 
     def delete_catalog_item(self):
-        current_row = self.catalog_table.currentRow()
-        if current_row < 0:
+        item = self._current_record(self.catalog_table)
+        if item is None:
             QMessageBox.warning(self, "Предупреждение", "Выберите предмет каталога для удаления")
             return
         
-        item_id = int(self.catalog_table.item(current_row, 0).text())
-        item_name = self.catalog_table.item(current_row, 1).text()
+        item_name = _cell_text(item.name)
         
         reply = QMessageBox.question(
             self, "Подтверждение удаления", 
@@ -1166,13 +1359,16 @@ class DashboardPySide6(QMainWindow):
         )
         
         if reply == QMessageBox.Yes:
-            self.db.delete_catalog_item(item_id)
+            self.db.delete_catalog_item(item.id)
 
     def refresh_dashboard(self):
-        self.db.get_statistics()
-        self.db.get_collection_types_stats()
-        self.db.get_country_stats()
-        self.db.get_collections()
+        # Скрытый дашборд не обновляем: show_dashboard обновит его при возврате
+        if self.content_area.currentIndex() != 0:
+            return
+        # Пока открыт модальный диалог (редактирование, экспорт), тики пропускаем
+        if QApplication.activeModalWidget() is not None:
+            return
+        self.db.get_dashboard()
 
     def refresh_collectors(self):
         self.db.get_collectors()
@@ -1183,27 +1379,51 @@ class DashboardPySide6(QMainWindow):
     def refresh_catalog(self):
         self.db.get_catalog()
 
+    def _ensure_page(self, index):
+        """Построение страницы при первом обращении к ней"""
+        builder = self._page_builders.pop(index, None)
+        if builder is None:
+            return
+        placeholder = self.content_area.widget(index)
+        self.content_area.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.content_area.insertWidget(index, builder())
+
+    def _refresh_if_stale(self, data_type, refresh):
+        """Загрузка данных вкладки, если они не запрашивались только что"""
+        now = time.monotonic()
+        if now - self._refreshed_at.get(data_type, 0.0) < TAB_REFRESH_INTERVAL:
+            return
+        self._refreshed_at[data_type] = now
+        refresh()
+
     def show_dashboard(self):
         self.content_area.setCurrentIndex(0)
         self.refresh_dashboard()
 
     def show_collectors(self):
+        self._ensure_page(1)
         self.content_area.setCurrentIndex(1)
-        self.refresh_collectors()
+        self._refresh_if_stale(DataKind.COLLECTORS, self.refresh_collectors)
 
     def show_collections(self):
+        self._ensure_page(2)
         self.content_area.setCurrentIndex(2)
-        self.refresh_collections()
+        self._refresh_if_stale(DataKind.COLLECTIONS, self.refresh_collections)
 
     def show_catalog(self):
+        self._ensure_page(3)
         self.content_area.setCurrentIndex(3)
-        self.refresh_catalog()
+        self._refresh_if_stale(DataKind.CATALOG, self.refresh_catalog)
 
     def show_about(self):
+        self._ensure_page(4)
         self.content_area.setCurrentIndex(4)
 
     def closeEvent(self, event):
         logger.info("Закрытие приложения...")
         self.update_timer.stop()
+        ChartView.wait_renders()
+        stop_reporter_loop()
         self.db.stop()
         event.accept()